@@ -1,7 +1,13 @@
+from datetime import timedelta
+from django.db import connection, transaction
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth.models import User
+from apps.appointments.models import Appointment
+from apps.professionals.models import Professional
+from .views import MyAppointmentsView
 
 
 class AuthTests(APITestCase):
@@ -41,3 +47,68 @@ class AuthTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn("access", response.data)
+
+
+class MyAppointmentsTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="patient", password="password123")
+        self.other_user = User.objects.create_user(username="other")
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("me-appointments")
+
+        professional = Professional.objects.create(
+            social_name="Dr. Strange",
+            profession="Sorcerer Supreme",
+            contact="strange@sanctum.com",
+        )
+        now = timezone.now()
+        self.upcoming = [
+            Appointment.objects.create(
+                professional=professional,
+                date=now + timedelta(days=days),
+                patient=self.user,
+            )
+            for days in (7, 2)
+        ]
+        Appointment.objects.create(
+            professional=professional, date=now - timedelta(days=2), patient=self.user
+        )
+        Appointment.objects.create(
+            professional=professional,
+            date=now + timedelta(days=1),
+            patient=self.other_user,
+        )
+
+    def test_my_upcoming_appointments(self):
+        """Teste das próximas consultas do usuário, em ordem cronológica"""
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in response.data],
+            [self.upcoming[1].id, self.upcoming[0].id],
+        )
+
+    def test_my_appointments_requires_authentication(self):
+        """Teste de autenticação obrigatória em /api/me/appointments/"""
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_my_appointments_use_patient_date_index(self):
+        """Teste de plano de execução: busca pelo índice (patient_id, date)"""
+        view = MyAppointmentsView()
+        view.request = type("Request", (), {"user": self.user})()
+        queryset = view.get_queryset()
+        if connection.vendor == "sqlite":
+            self.assertIn("appointment_patient_date_idx", queryset.explain())
+        elif connection.vendor == "postgresql":
+            # Com poucas linhas o planejador prefere varredura sequencial.
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                plan = queryset.explain()
+            self.assertNotIn("Seq Scan on appointments", plan)
+            self.assertRegex(plan, r"Index Cond: .*patient_id.*date")
+        else:
+            self.skipTest("EXPLAIN verificado apenas em SQLite e PostgreSQL.")
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import MyAppointmentsView
+
+urlpatterns = [
+    path("appointments/", MyAppointmentsView.as_view(), name="me-appointments"),
+]
@@ -1 +1,26 @@
-# Create your views here.
+from django.utils import timezone
+from rest_framework import generics
+
+from apps.appointments.models import Appointment
+from apps.appointments.serializers import AppointmentSerializer
+
+
+class MyAppointmentsView(generics.ListAPIView):
+    """
+    Próximas consultas do usuário autenticado, em ordem cronológica.
+
+    Uma única consulta por intervalo sobre o índice `(patient_id, date)`.
+    """
+
+    serializer_class = AppointmentSerializer
+
+    def get_queryset(self):
+        return (
+            Appointment.objects.filter(
+                patient=self.request.user,
+                date__gte=timezone.now(),
+                professional__deleted_at__isnull=True,
+            )
+            .select_related("professional")
+            .order_by("date")
+        )
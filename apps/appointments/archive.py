@@ -0,0 +1,56 @@
+from django.db import connection, transaction
+
+from .models import Appointment, AppointmentArchive
+
+ARCHIVED_FIELDS = (
+    "id",
+    "date",
+    "professional_id",
+    "patient_id",
+    "created_at",
+    "updated_at",
+)
+
+
+def archive_batch(cutoff, batch_size):
+    """
+    Move até `batch_size` consultas anteriores a `cutoff` para a tabela de
+    arquivo, em uma única transação. Retorna a quantidade movida.
+
+    Arquivar não é uma remoção de domínio: o delete é feito em SQL direto, sem
+    disparar signals (tombstones de sincronização ou eventos SSE). O filtro por
+    `date` permite ao PostgreSQL limitar o delete às partições antigas.
+
+    Como as chaves estrangeiras para consultas não têm constraint no banco, o
+    delete direto não tem cascata: os lembretes das consultas arquivadas são
+    removidos na mesma transação, para o worker não os encontrar depois. Os
+    pagamentos são mantidos (histórico financeiro e conciliação com a Asaas);
+    o `appointment_id` deles passa a apontar para `AppointmentArchive`, que
+    preserva o ID original.
+    """
+    from apps.reminders.models import Reminder
+
+    with transaction.atomic():
+        rows = list(
+            Appointment.objects.select_for_update(skip_locked=True)
+            .filter(date__lt=cutoff)
+            .order_by("date")
+            .values(*ARCHIVED_FIELDS)[:batch_size]
+        )
+        if not rows:
+            return 0
+
+        AppointmentArchive.objects.bulk_create(
+            [AppointmentArchive(**row) for row in rows], ignore_conflicts=True
+        )
+
+        ids = [row["id"] for row in rows]
+        table = connection.ops.quote_name(Appointment._meta.db_table)
+        placeholders = ", ".join(["%s"] * len(ids))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {table} WHERE id IN ({placeholders}) AND date < %s",
+                [*ids, cutoff],
+            )
+        Reminder.objects.filter(appointment_id__in=ids).delete()
+    return len(rows)
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger("django")
+
+
+def professional_channel(professional_id):
+    return f"professional:{professional_id}"
+
+
+class InMemoryBroker:
+    """
+    Broker de eventos em processo.
+
+    Cada assinante recebe uma fila asyncio própria; `publish` pode ser chamado de
+    qualquer thread (views síncronas, signals) e entrega o evento no event loop
+    do assinante. Só alcança conexões abertas no mesmo processo.
+    """
+
+    def __init__(self, queue_size=100):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def publish(self, channel, event):
+        self._dispatch(channel, event)
+
+    def _dispatch(self, channel, event):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, event)
+            except RuntimeError:
+                # Event loop já encerrado: o assinante será removido ao sair do contexto.
+                pass
+
+    @staticmethod
+    def _offer(queue, event):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Cliente lento: descarta o evento em vez de acumular memória.
+            logger.warning("SSE: fila cheia, evento descartado")
+
+    @asynccontextmanager
+    async def subscribe(self, channel):
+        subscriber = (
+            asyncio.get_running_loop(),
+            asyncio.Queue(maxsize=self.queue_size),
+        )
+        with self._lock:
+            self._subscribers[channel].add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                self._subscribers[channel].discard(subscriber)
+                if not self._subscribers[channel]:
+                    del self._subscribers[channel]
+
+
+class PostgresNotifyBroker(InMemoryBroker):
+    """
+    Broker baseado em LISTEN/NOTIFY do PostgreSQL.
+
+    `publish` emite um NOTIFY; cada processo mantém uma única conexão em LISTEN
+    (iniciada no primeiro assinante) e repassa as notificações para as filas
+    locais. Assim, uma notificação atende todas as conexões SSE do processo.
+    """
+
+    pg_channel = "appointment_events"
+
+    def __init__(self, queue_size=100):
+        super().__init__(queue_size)
+        self._listener = None
+
+    def publish(self, channel, event):
+        payload = json.dumps({"channel": channel, "event": event})
+        with connections["default"].cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.pg_channel, payload])
+
+    @asynccontextmanager
+    async def subscribe(self, channel):
+        self._ensure_listener()
+        async with super().subscribe(channel) as queue:
+            yield queue
+
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(
+                    target=self._listen_forever, name="pg-notify-listener", daemon=True
+                )
+                self._listener.start()
+
+    def _listen_forever(self):
+        while True:
+            try:
+                self._listen()
+            except Exception:
+                logger.exception("SSE: conexão LISTEN perdida, reconectando")
+                time.sleep(1)
+
+    def _listen(self):
+        connection = connections.create_connection("default")
+        try:
+            connection.ensure_connection()
+            connection.set_autocommit(True)
+            raw = connection.connection
+            with raw.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.pg_channel}")
+
+            if hasattr(raw, "poll"):  # psycopg2
+                while True:
+                    if select.select([raw], [], [], 5) == ([], [], []):
+                        continue
+                    raw.poll()
+                    while raw.notifies:
+                        self._receive(raw.notifies.pop(0).payload)
+            else:  # psycopg 3
+                for notify in raw.notifies():
+                    self._receive(notify.payload)
+        finally:
+            connection.close()
+
+    def _receive(self, payload):
+        message = json.loads(payload)
+        self._dispatch(message["channel"], message["event"])
+
+
+@lru_cache(maxsize=1)
+def get_broker():
+    """Retorna o broker configurado em `APPOINTMENT_EVENTS_BROKER` (um por processo)."""
+    return import_string(settings.APPOINTMENT_EVENTS_BROKER)()
+
+
+def publish_appointment_event(event_type, appointment):
+    """
+    Publica um evento da consulta no canal do profissional após o commit da
+    transação corrente (o payload é montado imediatamente).
+    """
+    channel = professional_channel(appointment.professional_id)
+    event = {
+        "type": event_type,
+        "id": appointment.pk,
+        "professional": appointment.professional_id,
+        "patient": appointment.patient_id,
+        "date": appointment.date.isoformat(),
+    }
+    transaction.on_commit(lambda: get_broker().publish(channel, event))
@@ -0,0 +1,119 @@
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework import serializers
+
+from backend.core.filters import parse_id_list
+
+PERIODS = ("upcoming", "past")
+
+
+def _parse_bound(params, name, end_of_day=False):
+    """
+    Converte `date_from`/`date_to` (data ou data/hora ISO 8601) em datetime com
+    timezone. Uma data simples em `date_to` inclui o dia inteiro.
+    """
+    raw = params.get(name)
+    if not raw:
+        return None
+
+    # Data antes de data/hora: `parse_datetime` também aceita uma data simples.
+    try:
+        day = parse_date(raw)
+    except ValueError:
+        day = None
+    if day is not None:
+        if end_of_day:
+            day += timedelta(days=1)
+        value = datetime.combine(day, time.min)
+    else:
+        try:
+            value = parse_datetime(raw)
+        except ValueError:
+            value = None
+        if value is None:
+            raise serializers.ValidationError(
+                {name: ["Informe uma data ou data/hora no formato ISO 8601."]}
+            )
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def date_window(params):
+    """
+    Intervalo `[date_from, date_to)` pedido em `date_from` / `date_to` /
+    `period=upcoming|past`, ou None sem filtro de data.
+
+    Um intervalo explícito precisa dos dois limites e de no máximo
+    `APPOINTMENT_MAX_DATE_RANGE_DAYS`. Só os atalhos `period` completam o limite
+    ausente com esse tamanho, para que uma requisição não percorra todo o
+    histórico; o intervalo aplicado volta nos headers da listagem.
+    """
+    date_from = _parse_bound(params, "date_from")
+    date_to = _parse_bound(params, "date_to", end_of_day=True)
+    if date_from is None and date_to is None and "period" not in params:
+        return None
+
+    max_span = timedelta(days=settings.APPOINTMENT_MAX_DATE_RANGE_DAYS)
+    period = params.get("period")
+    if period is None:
+        if date_from is None or date_to is None:
+            missing = "date_to" if date_to is None else "date_from"
+            raise serializers.ValidationError(
+                {missing: ["Informe date_from e date_to para filtrar por data."]}
+            )
+    elif period not in PERIODS:
+        raise serializers.ValidationError(
+            {"period": [f"Valores aceitos: {', '.join(PERIODS)}."]}
+        )
+    elif period == "upcoming":
+        now = timezone.now()
+        date_from = max(date_from, now) if date_from else now
+        if date_to is None:
+            date_to = date_from + max_span
+    else:
+        now = timezone.now()
+        date_to = min(date_to, now) if date_to else now
+        if date_from is None:
+            date_from = date_to - max_span
+
+    if date_from > date_to:
+        raise serializers.ValidationError(
+            {"date_to": ["date_to deve ser posterior a date_from."]}
+        )
+    if date_to - date_from > max_span:
+        raise serializers.ValidationError(
+            {
+                "date_to": [
+                    "O intervalo máximo é de "
+                    f"{settings.APPOINTMENT_MAX_DATE_RANGE_DAYS} dias."
+                ]
+            }
+        )
+    return date_from, date_to
+
+
+def filter_appointments(queryset, params, window):
+    """
+    Aplica os filtros da listagem de consultas em SQL:
+
+    - `professional_id` ou `professional_id__in=1,2,3`;
+    - `window`, o intervalo de datas resolvido por `date_window`.
+
+    Os filtros combinam com o índice `(professional_id, date)`.
+    """
+    professional_id = params.get("professional_id")
+    if professional_id is not None:
+        queryset = queryset.filter(professional_id=professional_id)
+
+    professional_ids = parse_id_list(params, "professional_id__in")
+    if professional_ids is not None:
+        queryset = queryset.filter(professional_id__in=professional_ids)
+
+    if window is None:
+        return queryset
+    date_from, date_to = window
+    return queryset.filter(date__gte=date_from, date__lt=date_to)
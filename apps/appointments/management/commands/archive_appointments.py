@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.appointments.archive import archive_batch
+from apps.appointments.models import Appointment
+
+
+class Command(BaseCommand):
+    help = (
+        "Move, em lotes, as consultas mais antigas que o horizonte configurado "
+        "para a tabela de arquivo."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=settings.APPOINTMENT_ARCHIVE_AFTER_DAYS,
+            help="Arquiva consultas com data anterior a este número de dias.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Quantidade de consultas movidas por transação.",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Limita a quantidade de lotes nesta execução.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas informa quantas consultas seriam arquivadas.",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["older_than_days"])
+
+        if options["dry_run"]:
+            count = Appointment.objects.filter(date__lt=cutoff).count()
+            self.stdout.write(
+                f"{count} consultas anteriores a {cutoff:%Y-%m-%d} seriam arquivadas."
+            )
+            return
+
+        total = batches = 0
+        while options["max_batches"] is None or batches < options["max_batches"]:
+            moved = archive_batch(cutoff, options["batch_size"])
+            if not moved:
+                break
+            total += moved
+            batches += 1
+            self.stdout.write(f"Lote {batches}: {moved} consultas arquivadas.")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{total} consultas anteriores a {cutoff:%Y-%m-%d} arquivadas."
+            )
+        )
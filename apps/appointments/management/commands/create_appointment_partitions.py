@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.appointments.partitions import (
+    add_months,
+    create_partitions,
+    is_partitioned,
+    month_start,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Cria antecipadamente as partições mensais da tabela de consultas "
+        "(PostgreSQL). Deve ser agendado periodicamente (ex.: diariamente)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=settings.APPOINTMENT_PARTITIONS_AHEAD,
+            help="Quantidade de meses futuros que devem ter partição.",
+        )
+
+    def handle(self, *args, **options):
+        if not is_partitioned(connection):
+            self.stdout.write(
+                self.style.WARNING(
+                    "Tabela de consultas não particionada; nada a fazer."
+                )
+            )
+            return
+
+        current = month_start(timezone.now())
+        with transaction.atomic(), connection.cursor() as cursor:
+            created = create_partitions(
+                cursor, current, add_months(current, options["months_ahead"])
+            )
+
+        for name in created:
+            self.stdout.write(f"Partição criada: {name}")
+        self.stdout.write(self.style.SUCCESS(f"{len(created)} partições criadas."))
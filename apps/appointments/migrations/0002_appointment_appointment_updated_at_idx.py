@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-19 18:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("appointments", "0001_initial"),
+        ("professionals", "0002_professional_professional_updated_at_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["updated_at"], name="appointment_updated_at_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,122 @@
+"""
+Converte `appointments_appointment` em uma tabela particionada por mês (RANGE em
+`date`) no PostgreSQL. Em outros bancos (SQLite) a migração não faz nada.
+
+A chave primária passa a ser `(id, date)`, exigência do PostgreSQL para tabelas
+particionadas; o Django continua tratando `id` como pk. Tabelas que referenciam
+consultas devem usar `db_constraint=False`.
+"""
+
+from django.db import migrations
+from django.utils import timezone
+
+from apps.appointments.partitions import (
+    DEFAULT_PARTITION,
+    PARENT_TABLE,
+    add_months,
+    create_partitions,
+    month_start,
+)
+
+LEGACY_TABLE = f"{PARENT_TABLE}_legacy"
+SEQUENCE = f"{PARENT_TABLE}_id_seq"
+COLUMNS = "id, date, created_at, updated_at, professional_id"
+PARTITIONS_AHEAD = 3
+
+
+def _create_constraints_and_indexes(cursor):
+    cursor.execute(
+        f'ALTER TABLE "{PARENT_TABLE}" ADD CONSTRAINT "{PARENT_TABLE}_professional_id_fk" '
+        "FOREIGN KEY (professional_id) REFERENCES professionals_professional (id) "
+        "DEFERRABLE INITIALLY DEFERRED"
+    )
+    cursor.execute(
+        f'CREATE INDEX "{PARENT_TABLE}_professional_id_idx" '
+        f'ON "{PARENT_TABLE}" (professional_id)'
+    )
+    cursor.execute(
+        f'CREATE INDEX "appointment_updated_at_idx" ON "{PARENT_TABLE}" (updated_at)'
+    )
+
+
+def partition_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" RENAME TO "{LEGACY_TABLE}"')
+        cursor.execute(f'CREATE SEQUENCE "{PARENT_TABLE}_partitioned_id_seq"')
+        cursor.execute(
+            f'CREATE TABLE "{PARENT_TABLE}" ('
+            f"id bigint NOT NULL DEFAULT nextval('{PARENT_TABLE}_partitioned_id_seq'), "
+            "date timestamp with time zone NOT NULL, "
+            "created_at timestamp with time zone NOT NULL, "
+            "updated_at timestamp with time zone NOT NULL, "
+            "professional_id bigint NOT NULL, "
+            "PRIMARY KEY (id, date)"
+            ") PARTITION BY RANGE (date)"
+        )
+        cursor.execute(
+            f'ALTER SEQUENCE "{PARENT_TABLE}_partitioned_id_seq" '
+            f'OWNED BY "{PARENT_TABLE}".id'
+        )
+        cursor.execute(
+            f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{PARENT_TABLE}" DEFAULT'
+        )
+
+        cursor.execute(f'SELECT MIN(date) FROM "{LEGACY_TABLE}"')
+        oldest = cursor.fetchone()[0] or timezone.now()
+        create_partitions(
+            cursor, oldest, add_months(month_start(timezone.now()), PARTITIONS_AHEAD)
+        )
+
+        cursor.execute(
+            f'INSERT INTO "{PARENT_TABLE}" ({COLUMNS}) '
+            f'SELECT {COLUMNS} FROM "{LEGACY_TABLE}"'
+        )
+        cursor.execute(
+            f"SELECT setval('{PARENT_TABLE}_partitioned_id_seq', "
+            f'COALESCE(MAX(id), 0) + 1, false) FROM "{PARENT_TABLE}"'
+        )
+        cursor.execute(f'DROP TABLE "{LEGACY_TABLE}"')
+        cursor.execute(
+            f'ALTER SEQUENCE "{PARENT_TABLE}_partitioned_id_seq" RENAME TO "{SEQUENCE}"'
+        )
+        _create_constraints_and_indexes(cursor)
+
+
+def unpartition_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" RENAME TO "{LEGACY_TABLE}"')
+        cursor.execute(
+            f'CREATE TABLE "{PARENT_TABLE}" ('
+            f"id bigint NOT NULL DEFAULT nextval('{SEQUENCE}') PRIMARY KEY, "
+            "date timestamp with time zone NOT NULL, "
+            "created_at timestamp with time zone NOT NULL, "
+            "updated_at timestamp with time zone NOT NULL, "
+            "professional_id bigint NOT NULL"
+            ")"
+        )
+        cursor.execute(
+            f'INSERT INTO "{PARENT_TABLE}" ({COLUMNS}) '
+            f'SELECT {COLUMNS} FROM "{LEGACY_TABLE}"'
+        )
+        cursor.execute(f'ALTER SEQUENCE "{SEQUENCE}" OWNED BY "{PARENT_TABLE}".id')
+        cursor.execute(f'DROP TABLE "{LEGACY_TABLE}" CASCADE')
+        _create_constraints_and_indexes(cursor)
+
+
+class Migration(migrations.Migration):
+    atomic = True
+
+    dependencies = [
+        ("appointments", "0002_appointment_appointment_updated_at_idx"),
+        ("professionals", "0002_professional_professional_updated_at_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_table, unpartition_table),
+    ]
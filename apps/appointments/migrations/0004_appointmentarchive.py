@@ -0,0 +1,45 @@
+# Generated by Django 6.0.2 on 2026-10-19 18:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("appointments", "0003_partition_appointment_by_date"),
+        ("professionals", "0002_professional_professional_updated_at_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AppointmentArchive",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("date", models.DateTimeField(verbose_name="Data da Consulta")),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "professional",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="archived_appointments",
+                        to="professionals.professional",
+                        verbose_name="Profissional",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Consulta Arquivada",
+                "verbose_name_plural": "Consultas Arquivadas",
+                "ordering": ["-date"],
+                "indexes": [
+                    models.Index(
+                        fields=["professional", "date"],
+                        name="appointment_archive_prof_idx",
+                    )
+                ],
+            },
+        ),
+    ]
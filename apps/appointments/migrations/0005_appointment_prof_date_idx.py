@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-19 18:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("appointments", "0004_appointmentarchive"),
+        ("professionals", "0003_professional_soft_delete"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["professional", "date"], name="appointment_prof_date_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 6.0.2 on 2026-10-19 19:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("appointments", "0005_appointment_prof_date_idx"),
+        ("professionals", "0003_professional_soft_delete"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="appointment",
+            name="patient",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="appointments",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Paciente",
+            ),
+        ),
+        migrations.AddField(
+            model_name="appointmentarchive",
+            name="patient",
+            field=models.ForeignKey(
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="archived_appointments",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Paciente",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["patient", "date"], name="appointment_patient_date_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.2 on 2026-10-19 19:14
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("appointments", "0006_appointment_patient"),
+        ("professionals", "0004_professional_trigram_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="appointment",
+            name="professional",
+            field=models.ForeignKey(
+                limit_choices_to={"deleted_at__isnull": True},
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="appointments",
+                to="professionals.professional",
+                verbose_name="Profissional",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(fields=["date"], name="appointment_date_idx"),
+        ),
+    ]
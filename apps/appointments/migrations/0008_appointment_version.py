@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-19 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("appointments", "0007_appointment_admin"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="appointment",
+            name="version",
+            field=models.PositiveIntegerField(
+                db_default=1, default=1, editable=False, verbose_name="Versão"
+            ),
+        ),
+    ]
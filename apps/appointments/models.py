@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db import models
 from apps.professionals.models import Professional
 
@@ -7,11 +8,26 @@ class Appointment(models.Model):
     professional = models.ForeignKey(
         Professional,
         on_delete=models.CASCADE,
+        limit_choices_to={"deleted_at__isnull": True},
         related_name="appointments",
         verbose_name="Profissional",
     )
+    # Indexado junto com `date` (appointment_patient_date_idx).
+    patient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_index=False,
+        related_name="appointments",
+        verbose_name="Paciente",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Incrementada a cada edição pela API (controle de concorrência otimista).
+    version = models.PositiveIntegerField(
+        default=1, db_default=1, editable=False, verbose_name="Versão"
+    )
 
     def __str__(self):
         return f"Consulta com {self.professional.social_name} em {self.date}"
@@ -20,3 +36,55 @@ class Appointment(models.Model):
         verbose_name = "Consulta"
         verbose_name_plural = "Consultas"
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["updated_at"], name="appointment_updated_at_idx"),
+            # Ordenação padrão e filtros de ano/mês do admin (MIN/MAX e intervalos).
+            models.Index(fields=["date"], name="appointment_date_idx"),
+            models.Index(
+                fields=["professional", "date"], name="appointment_prof_date_idx"
+            ),
+            models.Index(
+                fields=["patient", "date"], name="appointment_patient_date_idx"
+            ),
+        ]
+
+
+class AppointmentArchive(models.Model):
+    """
+    Consultas antigas movidas para fora da tabela principal pelo comando
+    `archive_appointments`. Mantém o ID original da consulta.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    date = models.DateTimeField(verbose_name="Data da Consulta")
+    professional = models.ForeignKey(
+        Professional,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="archived_appointments",
+        verbose_name="Profissional",
+    )
+    patient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="archived_appointments",
+        verbose_name="Paciente",
+    )
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Consulta arquivada #{self.pk} em {self.date}"
+
+    class Meta:
+        verbose_name = "Consulta Arquivada"
+        verbose_name_plural = "Consultas Arquivadas"
+        ordering = ["-date"]
+        indexes = [
+            models.Index(
+                fields=["professional", "date"], name="appointment_archive_prof_idx"
+            ),
+        ]
@@ -0,0 +1,75 @@
+"""
+Particionamento mensal (RANGE em `date`) da tabela de consultas no PostgreSQL.
+
+A tabela `appointments_appointment` é particionada por mês, com chave primária
+`(id, date)` e uma partição DEFAULT para datas sem partição própria. Consultas
+com filtro por `date` têm as partições irrelevantes descartadas pelo planner.
+"""
+
+from datetime import UTC, datetime
+
+PARENT_TABLE = "appointments_appointment"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+
+
+def month_start(moment):
+    """Primeiro instante (UTC) do mês de `moment`."""
+    moment = moment.astimezone(UTC)
+    return datetime(moment.year, moment.month, 1, tzinfo=UTC)
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month):
+    return f"{PARENT_TABLE}_p{month:%Y_%m}"
+
+
+def is_partitioned(connection):
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(%s))",
+            [PARENT_TABLE],
+        )
+        return cursor.fetchone()[0]
+
+
+def create_partition(cursor, month):
+    """
+    Cria a partição do mês iniciado em `month`, movendo para ela as linhas que
+    estejam na partição DEFAULT. Retorna False se a partição já existir.
+    Deve ser executada dentro de uma transação.
+    """
+    name = partition_name(month)
+    cursor.execute("SELECT to_regclass(%s)", [name])
+    if cursor.fetchone()[0] is not None:
+        return False
+
+    start, end = month.isoformat(), add_months(month, 1).isoformat()
+    cursor.execute(f'CREATE TABLE "{name}" (LIKE "{PARENT_TABLE}" INCLUDING DEFAULTS)')
+    cursor.execute(
+        f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" '
+        f"WHERE date >= '{start}' AND date < '{end}' RETURNING *) "
+        f'INSERT INTO "{name}" SELECT * FROM moved'
+    )
+    cursor.execute(
+        f'ALTER TABLE "{PARENT_TABLE}" ATTACH PARTITION "{name}" '
+        f"FOR VALUES FROM ('{start}') TO ('{end}')"
+    )
+    return True
+
+
+def create_partitions(cursor, first_month, last_month):
+    """Garante uma partição para cada mês entre `first_month` e `last_month`."""
+    created = []
+    month = month_start(first_month)
+    while month <= last_month:
+        if create_partition(cursor, month):
+            created.append(partition_name(month))
+        month = add_months(month, 1)
+    return created
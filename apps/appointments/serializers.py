@@ -1,3 +1,4 @@
+from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from .models import Appointment
 from apps.professionals.serializers import ProfessionalSerializer
@@ -14,10 +15,23 @@ class AppointmentSerializer(serializers.ModelSerializer):
             "date",
             "professional",
             "professional_detail",
+            "patient",
             "created_at",
             "updated_at",
+            "version",
         ]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        read_only_fields = ["id", "patient", "created_at", "updated_at", "version"]
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is not None and request.user.is_staff:
+            # A equipe (recepção) agenda em nome de um paciente; sem `patient`,
+            # a consulta fica com o próprio usuário, como para os demais.
+            fields["patient"] = serializers.PrimaryKeyRelatedField(
+                queryset=get_user_model().objects.all(), required=False
+            )
+        return fields
 
     def validate_date(self, value):
         """Validate that appointment date is in the future."""
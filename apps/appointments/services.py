@@ -1,4 +1,7 @@
 import logging
+import uuid
+
+from django.conf import settings
 
 logger = logging.getLogger("django")
 
@@ -12,25 +15,30 @@ class AsaasService:
     @staticmethod
     def create_payment_with_split(appointment):
         """
-        Simula a criação de uma cobrança com split de pagamento.
+        Simula a criação de uma cobrança com split de pagamento e registra o
+        `Payment` local, cuja situação é atualizada pelos webhooks da Asaas.
+        Com o preço do profissional em cache, a única query é o INSERT.
         """
+        from apps.payments.models import Payment
+        from apps.payments.pricing import get_pricing
+
         professional = appointment.professional
+        price = get_pricing(professional)
 
-        # Dados fictícios para demonstração do payload da Asaas
         payload = {
             "customer": "customer_id_da_lacrei",
             "billingType": "CREDIT_CARD",
-            "value": 200.0,
+            "value": float(price.value),
             "dueDate": appointment.date.strftime("%Y-%m-%d"),
             "description": f"Consulta com {professional.social_name} em {appointment.date}",
             "split": [
                 {
-                    "walletId": "wallet_id_do_profissional",  # ID da conta do profissional na Asaas
-                    "fixedValue": 180.0,  # Valor que vai para o profissional
+                    "walletId": price.wallet_id,  # ID da conta do profissional na Asaas
+                    "fixedValue": float(price.professional_value),
                 },
                 {
-                    "walletId": "wallet_id_da_lacrei",  # ID da conta da Lacrei Saúde
-                    "fixedValue": 20.0,  # Taxa da plataforma
+                    "walletId": settings.ASAAS_PLATFORM_WALLET_ID,  # Conta da Lacrei Saúde
+                    "fixedValue": float(price.platform_fee),  # Taxa da plataforma
                 },
             ],
         }
@@ -40,4 +48,8 @@ class AsaasService:
         )
 
         # Em uma integração real, aqui faríamos um requests.post para a API da Asaas
-        return {"status": "success", "asaas_id": "pay_123456789"}
+        asaas_id = f"pay_{uuid.uuid4().hex[:12]}"
+        Payment.objects.create(
+            appointment=appointment, asaas_id=asaas_id, value=price.value
+        )
+        return {"status": "success", "asaas_id": asaas_id}
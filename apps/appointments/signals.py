@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .events import publish_appointment_event
+from .models import Appointment
+
+
+@receiver(post_save, sender=Appointment, dispatch_uid="appointment_events_save")
+def publish_saved(sender, instance, created, **kwargs):
+    publish_appointment_event("created" if created else "updated", instance)
+
+
+@receiver(post_delete, sender=Appointment, dispatch_uid="appointment_events_delete")
+def publish_deleted(sender, instance, **kwargs):
+    publish_appointment_event("deleted", instance)
@@ -1,11 +1,25 @@
+import asyncio
+from io import StringIO
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth.models import User
 from django.utils import timezone
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from rest_framework_simplejwt.tokens import AccessToken
+from apps.payments.models import Payment
 from apps.professionals.models import Professional
-from .models import Appointment
+from apps.reminders.models import Reminder
+from .events import InMemoryBroker, get_broker
+from .filters import date_window, filter_appointments
+from .models import Appointment, AppointmentArchive
+from .partitions import add_months, month_start, partition_name
 
 
 class AppointmentTests(APITestCase):
@@ -31,6 +45,28 @@ class AppointmentTests(APITestCase):
         response = self.client.post(self.url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Appointment.objects.count(), 1)
+        self.assertEqual(Appointment.objects.get().patient, self.user)
+
+    def test_staff_books_for_patient(self):
+        """Teste: a equipe agenda em nome de um paciente; os demais só para si"""
+        other = User.objects.create_user(username="other", password="password123")
+        data = {
+            "professional": self.professional.id,
+            "date": self.future_date,
+            "patient": other.id,
+        }
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            Appointment.objects.get(pk=response.data["id"]).patient, self.user
+        )
+
+        receptionist = User.objects.create_user(username="reception", is_staff=True)
+        self.client.force_authenticate(user=receptionist)
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["patient"], other.id)
+        self.assertEqual(Appointment.objects.get(pk=response.data["id"]).patient, other)
 
     def test_create_appointment_past_date(self):
         """Teste de validação: impedir agendamento no passado"""
@@ -53,17 +89,437 @@ class AppointmentTests(APITestCase):
         """Teste de listagem com filtro por profissional"""
         # Cria consulta para este profissional
         Appointment.objects.create(
-            professional=self.professional, date=self.future_date
+            professional=self.professional, date=self.future_date, patient=self.user
         )
 
         # Cria outro profissional e consulta para testar filtro
         other_prof = Professional.objects.create(
             social_name="Dr. Who", profession="Time Lord", contact="tardis@bbc.com"
         )
-        Appointment.objects.create(professional=other_prof, date=self.future_date)
+        Appointment.objects.create(
+            professional=other_prof, date=self.future_date, patient=self.user
+        )
 
         # Filtra pelo primeiro profissional
         response = self.client.get(f"{self.url}?professional_id={self.professional.id}")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["professional"], self.professional.id)
+
+    def test_list_appointments_scoped_to_patient(self):
+        """Teste de listagem: pacientes veem apenas as próprias consultas"""
+        other_user = User.objects.create_user(username="other", password="password123")
+        mine = Appointment.objects.create(
+            professional=self.professional, date=self.future_date, patient=self.user
+        )
+        others = Appointment.objects.create(
+            professional=self.professional, date=self.future_date, patient=other_user
+        )
+
+        response = self.client.get(self.url)
+        self.assertEqual([item["id"] for item in response.data], [mine.id])
+        response = self.client.get(reverse("appointment-detail", args=[others.id]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        staff = User.objects.create_user(username="staff", is_staff=True)
+        self.client.force_authenticate(user=staff)
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 2)
+
+    def test_reschedule_with_if_match(self):
+        """Teste de reagendamento condicional: ETag antiga responde 412"""
+        appointment = Appointment.objects.create(
+            professional=self.professional, patient=self.user, date=self.future_date
+        )
+        detail_url = reverse("appointment-detail", args=[appointment.id])
+        new_date = self.future_date + timedelta(days=40)
+
+        response = self.client.patch(
+            detail_url, {"date": new_date}, format="json", HTTP_IF_MATCH='"1"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], '"2"')
+
+        response = self.client.patch(
+            detail_url,
+            {"date": self.future_date},
+            format="json",
+            HTTP_IF_MATCH='"1"',
+        )
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        appointment = Appointment.objects.get(pk=appointment.pk)
+        self.assertEqual((appointment.date, appointment.version), (new_date, 2))
+
+
+class AppointmentFilterTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="patient", password="password123")
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("appointment-list")
+        self.now = timezone.now()
+
+        self.professionals = [
+            Professional.objects.create(
+                social_name=f"Dr. {name}",
+                profession="Clínico",
+                contact=f"{name.lower()}@clinic.com",
+            )
+            for name in ("Strange", "Who", "House")
+        ]
+        for professional in self.professionals:
+            for days in (-40, -2, 3, 30):
+                Appointment.objects.create(
+                    professional=professional,
+                    date=self.now + timedelta(days=days),
+                    patient=self.user,
+                )
+
+    def test_filter_by_date_range_and_professionals(self):
+        """Teste de filtro por intervalo de datas e lista de profissionais"""
+        first, second, _ = self.professionals
+        date_from = (self.now - timedelta(days=5)).date().isoformat()
+        date_to = (self.now + timedelta(days=10)).date().isoformat()
+        response = self.client.get(
+            self.url,
+            {
+                "professional_id__in": f"{first.id},{second.id}",
+                "date_from": date_from,
+                "date_to": date_to,
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 4)
+        self.assertEqual(
+            {item["professional"] for item in response.data}, {first.id, second.id}
+        )
+
+    def test_upcoming_and_past_shortcuts(self):
+        """Teste dos atalhos period=upcoming e period=past"""
+        professional = self.professionals[0]
+        upcoming = self.client.get(
+            self.url, {"professional_id": professional.id, "period": "upcoming"}
+        )
+        past = self.client.get(
+            self.url, {"professional_id": professional.id, "period": "past"}
+        )
+        self.assertEqual(len(upcoming.data), 2)
+        self.assertEqual(len(past.data), 2)
+        self.assertTrue(all(item["date"] < self.now.isoformat() for item in past.data))
+
+    def test_applied_window_in_headers(self):
+        """Teste dos headers com o intervalo aplicado na listagem"""
+        date_from = self.now.date()
+        date_to = date_from + timedelta(days=10)
+        response = self.client.get(
+            self.url, {"date_from": date_from, "date_to": date_to}
+        )
+        self.assertEqual(
+            datetime.fromisoformat(response["X-Date-From"]).date(), date_from
+        )
+        self.assertEqual(
+            datetime.fromisoformat(response["X-Date-To"]).date(),
+            date_to + timedelta(days=1),
+        )
+
+        upcoming = self.client.get(self.url, {"period": "upcoming"})
+        window = datetime.fromisoformat(upcoming["X-Date-To"]) - datetime.fromisoformat(
+            upcoming["X-Date-From"]
+        )
+        self.assertEqual(
+            window, timedelta(days=settings.APPOINTMENT_MAX_DATE_RANGE_DAYS)
+        )
+
+        self.assertNotIn("X-Date-From", self.client.get(self.url))
+
+    def test_rejects_invalid_filters(self):
+        """Teste de validação de intervalos longos e parâmetros inválidos"""
+        date_from = self.now.date()
+        too_long = date_from + timedelta(
+            days=settings.APPOINTMENT_MAX_DATE_RANGE_DAYS + 1
+        )
+        cases = [
+            ({"date_from": date_from, "date_to": too_long}, "date_to"),
+            ({"date_from": date_from}, "date_to"),
+            ({"date_to": too_long}, "date_from"),
+            ({"date_from": "ontem"}, "date_from"),
+            ({"professional_id__in": "1,a"}, "professional_id__in"),
+            ({"period": "someday"}, "period"),
+        ]
+        for params, field in cases:
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn(field, response.data)
+
+    def test_filters_use_professional_date_index(self):
+        """Teste de plano de execução: filtros usam o índice (professional_id, date)"""
+        params = {
+            "professional_id__in": str(self.professionals[0].id),
+            "period": "upcoming",
+        }
+        queryset = filter_appointments(
+            Appointment.objects.all(), params, date_window(params)
+        )
+        if connection.vendor == "sqlite":
+            plan = queryset.explain()
+            self.assertIn("appointment_prof_date_idx", plan)
+        elif connection.vendor == "postgresql":
+            # Com poucas linhas o planejador prefere varredura sequencial.
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                plan = queryset.explain()
+            self.assertNotIn("Seq Scan", plan)
+            self.assertRegex(plan, r"Index Cond: .*professional_id.*date")
+        else:
+            self.skipTest("EXPLAIN verificado apenas em SQLite e PostgreSQL.")
+
+
+class AppointmentEventTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="reception", password="password123"
+        )
+        self.token = str(AccessToken.for_user(self.user))
+        self.professional = Professional.objects.create(
+            social_name="Dr. Strange",
+            profession="Sorcerer Supreme",
+            contact="strange@sanctum.com",
+            address="177A Bleecker Street",
+        )
+        self.url = reverse("appointment-events", args=[self.professional.id])
+
+    async def test_broker_delivers_events_published_from_other_threads(self):
+        """Teste de fan-out do broker em processo para assinantes do canal"""
+        broker = InMemoryBroker()
+        async with broker.subscribe("professional:1") as first:
+            async with broker.subscribe("professional:1") as second:
+                await asyncio.to_thread(
+                    broker.publish, "professional:1", {"type": "created", "id": 1}
+                )
+                for queue in (first, second):
+                    event = await asyncio.wait_for(queue.get(), timeout=1)
+                    self.assertEqual(event["id"], 1)
+
+    def test_appointment_changes_are_published_after_commit(self):
+        """Teste de publicação de eventos de criação e remoção após o commit"""
+        published = []
+        broker = get_broker()
+        original = broker.publish
+        broker.publish = lambda channel, event: published.append((channel, event))
+        try:
+            with self.captureOnCommitCallbacks(execute=True):
+                appointment = Appointment.objects.create(
+                    professional=self.professional,
+                    date=timezone.now() + timedelta(days=1),
+                )
+            appointment_id = appointment.id
+            with self.captureOnCommitCallbacks(execute=True):
+                appointment.delete()
+        finally:
+            broker.publish = original
+
+        channel = f"professional:{self.professional.id}"
+        self.assertEqual(
+            [(c, e["type"], e["id"]) for c, e in published],
+            [
+                (channel, "created", appointment_id),
+                (channel, "deleted", appointment_id),
+            ],
+        )
+
+    async def test_stream_requires_authentication(self):
+        """Teste de acesso negado ao stream sem token JWT"""
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_stream_pushes_events(self):
+        """Teste de envio pelo stream SSE só dos eventos das consultas do paciente"""
+        response = await self.async_client.get(
+            self.url, headers={"Authorization": f"Bearer {self.token}"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        stream = response.streaming_content
+        self.assertTrue((await anext(stream)).startswith(b"retry:"))
+        channel = f"professional:{self.professional.id}"
+        get_broker().publish(
+            channel, {"type": "created", "id": 6, "patient": self.user.pk + 1}
+        )
+        get_broker().publish(
+            channel, {"type": "updated", "id": 7, "patient": self.user.pk}
+        )
+        chunk = await asyncio.wait_for(anext(stream), timeout=1)
+        self.assertIn(b"event: updated", chunk)
+        self.assertIn(b'"id": 7', chunk)
+        await stream.aclose()
+
+
+class AppointmentStorageTests(APITestCase):
+    def setUp(self):
+        self.professional = Professional.objects.create(
+            social_name="Dr. Strange",
+            profession="Sorcerer Supreme",
+            contact="strange@sanctum.com",
+            address="177A Bleecker Street",
+        )
+
+    def test_archive_moves_old_appointments_in_batches(self):
+        """Teste de arquivamento em lotes das consultas antigas"""
+        now = timezone.now()
+        old = [
+            Appointment.objects.create(
+                professional=self.professional, date=now - timedelta(days=400 + i)
+            )
+            for i in range(3)
+        ]
+        recent = Appointment.objects.create(
+            professional=self.professional, date=now - timedelta(days=10)
+        )
+
+        out = StringIO()
+        call_command(
+            "archive_appointments",
+            "--older-than-days",
+            "365",
+            "--batch-size",
+            "2",
+            stdout=out,
+        )
+
+        self.assertEqual(
+            list(Appointment.objects.values_list("id", flat=True)), [recent.id]
+        )
+        self.assertEqual(
+            sorted(AppointmentArchive.objects.values_list("id", flat=True)),
+            sorted(a.id for a in old),
+        )
+        self.assertIn("Lote 2", out.getvalue())
+
+    def test_archive_leaves_no_orphans(self):
+        """Teste: lembretes removidos e pagamentos ligados ao arquivo"""
+        now = timezone.now()
+        old, recent = (
+            Appointment.objects.create(
+                professional=self.professional, date=now - timedelta(days=days)
+            )
+            for days in (400, 10)
+        )
+        for index, appointment in enumerate((old, recent)):
+            Reminder.objects.create(
+                appointment=appointment,
+                lead_minutes=60,
+                scheduled_for=appointment.date,
+                remind_at=appointment.date,
+            )
+            Payment.objects.create(
+                appointment=appointment,
+                asaas_id=f"pay_{index}",
+                value=Decimal("200.00"),
+            )
+
+        call_command(
+            "archive_appointments", "--older-than-days", "365", stdout=StringIO()
+        )
+
+        live = set(Appointment.objects.values_list("id", flat=True))
+        archived = set(AppointmentArchive.objects.values_list("id", flat=True))
+        self.assertEqual(
+            set(Reminder.objects.values_list("appointment_id", flat=True)), live
+        )
+        self.assertEqual(
+            set(Payment.objects.values_list("appointment_id", flat=True)),
+            live | archived,
+        )
+        self.assertEqual(archived, {old.id})
+
+    def test_partition_month_arithmetic(self):
+        """Teste do cálculo de meses e nomes das partições"""
+        month = month_start(datetime(2026, 11, 15, 12, tzinfo=UTC))
+        self.assertEqual(month, datetime(2026, 11, 1, tzinfo=UTC))
+        self.assertEqual(add_months(month, 2), datetime(2027, 1, 1, tzinfo=UTC))
+        self.assertEqual(partition_name(month), "appointments_appointment_p2026_11")
+
+
+class AppointmentAdminTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="admin", password="password123"
+        )
+        self.client.force_login(self.admin)
+        self.professional = Professional.objects.create(
+            social_name="Dr. Strange",
+            profession="Sorcerer Supreme",
+            contact="strange@sanctum.com",
+            address="177A Bleecker Street",
+        )
+        self.url = reverse("admin:appointments_appointment_changelist")
+
+    def create_appointments(self, count):
+        Appointment.objects.bulk_create(
+            Appointment(
+                professional=Professional.objects.create(
+                    social_name=f"Dra. Admin {index}",
+                    profession="Clínica Geral",
+                    contact=f"admin{index}@example.com",
+                    address="Rua do Admin",
+                ),
+                patient=self.admin,
+                date=timezone.now() + timedelta(days=index + 1),
+            )
+            for index in range(count)
+        )
+
+    def changelist_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        """Teste: a listagem do admin não faz uma query por consulta exibida"""
+        self.create_appointments(2)
+        few = self.changelist_queries()
+        self.create_appointments(8)
+        self.assertEqual(self.changelist_queries(), few)
+
+    def test_changelist_year_and_month_filters(self):
+        """Teste dos filtros de ano e mês na listagem do admin"""
+        self.create_appointments(3)
+        first = timezone.localtime(timezone.now() + timedelta(days=1))
+        response = self.client.get(self.url, {"year": first.year})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, "Dra. Admin 0")
+        self.assertContains(response, f"?month={first.month}&amp;year={first.year}")
+
+        response = self.client.get(
+            self.url, {"year": first.year + 1, "month": first.month}
+        )
+        self.assertNotContains(response, "Dra. Admin 0")
+
+        response = self.client.get(self.url, {"year": "abc"})
+        self.assertRedirects(response, f"{self.url}?e=1", fetch_redirect_response=False)
+
+    def test_professional_autocomplete(self):
+        """Teste do autocomplete de profissional sem os removidos logicamente"""
+        Professional.objects.create(
+            social_name="Dr. Strange (antigo)",
+            profession="Sorcerer Supreme",
+            contact="old@sanctum.com",
+            address="177A Bleecker Street",
+            deleted_at=timezone.now(),
+        )
+        response = self.client.get(
+            reverse("admin:autocomplete"),
+            {
+                "app_label": "appointments",
+                "model_name": "appointment",
+                "field_name": "professional",
+                "term": "strange",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["id"] for result in response.json()["results"]],
+            [str(self.professional.pk)],
+        )
@@ -1,10 +1,15 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import AppointmentViewSet
+from .views import AppointmentViewSet, appointment_event_stream
 
 router = DefaultRouter()
 router.register(r"", AppointmentViewSet)
 
 urlpatterns = [
+    path(
+        "events/<int:professional_id>/",
+        appointment_event_stream,
+        name="appointment-events",
+    ),
     path("", include(router.urls)),
 ]
@@ -1,19 +1,45 @@
-from rest_framework import viewsets
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework import exceptions, viewsets
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from apps.sync.views import ChangeFeedMixin
+from backend.core.batch import BatchObjectCacheMixin
+from backend.core.concurrency import OptimisticConcurrencyMixin
+from backend.core.renderers import MessagePackMixin
+from .events import get_broker, professional_channel
+from .filters import date_window, filter_appointments
 from .models import Appointment
 from .serializers import AppointmentSerializer
 
 
-class AppointmentViewSet(viewsets.ModelViewSet):
+class AppointmentViewSet(
+    MessagePackMixin,
+    OptimisticConcurrencyMixin,
+    BatchObjectCacheMixin,
+    ChangeFeedMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet para visualização e edição de consultas médicas.
     """
 
     queryset = Appointment.objects.all()
     serializer_class = AppointmentSerializer
+    # `date` é a chave de partição no PostgreSQL: descarta as demais partições.
+    version_lookup_fields = ("pk", "date")
     # permission_classes = [permissions.AllowAny]
 
     def perform_create(self, serializer):
-        appointment = serializer.save()
+        # `patient` só é gravável pela equipe (ver AppointmentSerializer).
+        appointment = serializer.save(
+            patient=serializer.validated_data.get("patient", self.request.user)
+        )
         # Trigger Asaas Mock
         from .services import AsaasService
 
@@ -21,10 +47,96 @@ class AppointmentViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """
-        Opcionalmente filtra as consultas por id do profissional através do parâmetro `professional_id`.
+        Filtra as consultas por profissional (`professional_id`, `professional_id__in`)
+        e por data (`date_from`, `date_to`, `period=upcoming|past`); ver `filters.py`.
+        Consultas de profissionais removidos (aguardando a remoção definitiva) são ocultadas.
+        Usuários que não são da equipe (`is_staff`) veem apenas as próprias consultas.
+        """
+        queryset = Appointment.objects.filter(
+            professional__deleted_at__isnull=True
+        ).select_related("professional")
+        if not self.request.user.is_staff:
+            queryset = queryset.filter(patient=self.request.user)
+        params = self.request.query_params
+        self.date_window = date_window(params)
+        return filter_appointments(queryset, params, self.date_window)
+
+    def filter_tombstones(self, tombstones):
+        # Como em get_queryset: remoções apenas das próprias consultas.
+        if not self.request.user.is_staff:
+            tombstones = tombstones.filter(patient_id=self.request.user.pk)
+        return tombstones
+
+    def list(self, request, *args, **kwargs):
+        """
+        Com filtro de data, `X-Date-From` e `X-Date-To` trazem o intervalo
+        aplicado (`[from, to)`); a próxima janela começa em `X-Date-To`.
         """
-        queryset = Appointment.objects.all()
-        professional_id = self.request.query_params.get("professional_id")
-        if professional_id is not None:
-            queryset = queryset.filter(professional_id=professional_id)
-        return queryset
+        response = super().list(request, *args, **kwargs)
+        if self.date_window is not None:
+            date_from, date_to = self.date_window
+            response["X-Date-From"] = date_from.isoformat()
+            response["X-Date-To"] = date_to.isoformat()
+        return response
+
+
+async def _authenticate(request):
+    """Autentica a requisição via JWT (header `Authorization: Bearer ...`)."""
+    try:
+        result = await sync_to_async(JWTAuthentication().authenticate)(request)
+    except exceptions.AuthenticationFailed:
+        return None
+    return result[0] if result else None
+
+
+async def _event_stream(channel, patient_id=None):
+    """Eventos do canal; com `patient_id`, apenas os das consultas desse paciente."""
+    async with get_broker().subscribe(channel) as queue:
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=settings.SSE_HEARTBEAT_SECONDS
+                )
+            except TimeoutError:
+                # Comentário SSE mantém a conexão viva através de proxies.
+                yield ": keepalive\n\n"
+                continue
+            if patient_id is not None and event.get("patient") != patient_id:
+                continue
+            yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+@require_GET
+async def appointment_event_stream(request, professional_id):
+    """
+    Stream SSE (`text/event-stream`) com os eventos de criação, atualização e
+    remoção das consultas de um profissional.
+
+    Conexões ociosas não consultam o banco: os eventos chegam pelo broker
+    configurado em `APPOINTMENT_EVENTS_BROKER`. Disponível apenas quando a
+    aplicação é servida via ASGI (`backend.asgi`). Usuários que não são da
+    equipe recebem apenas os eventos das próprias consultas.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {"detail": "Stream de eventos disponível apenas via ASGI."}, status=503
+        )
+
+    user = await _authenticate(request)
+    if user is None:
+        return JsonResponse(
+            {"detail": "As credenciais de autenticação não foram fornecidas."},
+            status=401,
+        )
+
+    response = StreamingHttpResponse(
+        _event_stream(
+            professional_channel(professional_id),
+            patient_id=None if user.is_staff else user.pk,
+        ),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,18 @@
+from django.contrib import admin
+
+from .models import PricingRule
+
+
+@admin.register(PricingRule)
+class PricingRuleAdmin(admin.ModelAdmin):
+    list_display = [
+        "professional",
+        "profession",
+        "value",
+        "platform_fee",
+        "wallet_id",
+        "updated_at",
+    ]
+    list_select_related = ["professional"]
+    search_fields = ["profession", "professional__social_name"]
+    autocomplete_fields = ["professional"]
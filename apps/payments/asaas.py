@@ -0,0 +1,69 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from django.conf import settings
+
+
+class AsaasError(Exception):
+    """Falha de comunicação com a API da Asaas."""
+
+
+class TokenBucket:
+    """
+    Limitador de taxa (token bucket) compartilhado entre threads: permite
+    rajadas de até `capacity` requisições e, em média, `rate` por segundo.
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = self.clock()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+class AsaasClient:
+    """Cliente mínimo (urllib) da API REST da Asaas."""
+
+    def __init__(self, base_url=None, api_key=None, timeout=None, limiter=None):
+        self.base_url = (base_url or settings.ASAAS_API_URL).rstrip("/")
+        self.api_key = api_key if api_key is not None else settings.ASAAS_API_KEY
+        self.timeout = timeout or settings.ASAAS_TIMEOUT_SECONDS
+        self.limiter = limiter
+
+    def get_payment(self, asaas_id):
+        """Retorna a cobrança na Asaas ou `None` se ela não existir."""
+        if self.limiter is not None:
+            self.limiter.acquire()
+        request = urllib.request.Request(
+            f"{self.base_url}/payments/{asaas_id}",
+            headers={"access_token": self.api_key, "Accept": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.load(response)
+        except urllib.error.HTTPError as exc:
+            if exc.code == 404:
+                return None
+            raise AsaasError(f"HTTP {exc.code} ao consultar {asaas_id}") from exc
+        except (urllib.error.URLError, TimeoutError, ValueError) as exc:
+            raise AsaasError(f"Falha ao consultar {asaas_id}: {exc}") from exc
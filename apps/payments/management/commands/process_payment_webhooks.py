@@ -0,0 +1,78 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.payments.webhooks import pending_events, process_webhook_batch
+
+logger = logging.getLogger("django")
+
+
+class Command(BaseCommand):
+    help = (
+        "Aplica, em lotes, os eventos de webhook da Asaas recebidos na caixa de "
+        "entrada e informa métricas de atraso do processamento."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.PAYMENT_WEBHOOK_BATCH_SIZE,
+            help="Quantidade de eventos aplicados por transação.",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Limita a quantidade de lotes nesta execução.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Continua rodando, verificando a caixa de entrada a cada --interval segundos.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Espera entre verificações quando não há eventos (com --loop).",
+        )
+
+    def handle(self, *args, **options):
+        processed = batches = 0
+        max_lag = None
+        while options["max_batches"] is None or batches < options["max_batches"]:
+            count, lag = process_webhook_batch(options["batch_size"])
+            if count:
+                processed += count
+                batches += 1
+                max_lag = lag if max_lag is None else max(max_lag, lag)
+                continue
+            if options["loop"]:
+                if processed:
+                    self.report(processed, batches, max_lag)
+                    processed = batches = 0
+                    max_lag = None
+                time.sleep(options["interval"])
+                continue
+            break
+
+        self.report(processed, batches, max_lag)
+
+    def report(self, processed, batches, max_lag):
+        log_data = {
+            "processed": processed,
+            "batches": batches,
+            "max_lag": f"{max_lag.total_seconds():.3f}s" if max_lag else None,
+            "backlog": pending_events().count(),
+        }
+        logger.info(f"Payment Webhooks: {log_data}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{processed} eventos processados em {batches} lotes; "
+                f"atraso máximo: {log_data['max_lag'] or '-'}; "
+                f"pendentes: {log_data['backlog']}."
+            )
+        )
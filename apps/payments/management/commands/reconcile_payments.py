@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.payments.asaas import AsaasClient, TokenBucket
+from apps.payments.reconcile import reconcile_payments
+
+
+class Command(BaseCommand):
+    help = (
+        "Concilia os pagamentos locais com a Asaas, com consultas concorrentes e "
+        "limite de taxa. Retoma do último checkpoint se a execução anterior foi "
+        "interrompida."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="Consultas simultâneas à API da Asaas.",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=settings.ASAAS_RATE_LIMIT,
+            help="Máximo de requisições por segundo à API da Asaas.",
+        )
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=500,
+            help="Pagamentos conferidos por página (e por checkpoint).",
+        )
+        parser.add_argument(
+            "--max-pages",
+            type=int,
+            default=None,
+            help="Interrompe após N páginas (a próxima execução continua dali).",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignora o checkpoint e recomeça do primeiro pagamento.",
+        )
+        parser.add_argument(
+            "--base-url",
+            default=None,
+            help="URL da API da Asaas (padrão: ASAAS_API_URL).",
+        )
+
+    def handle(self, *args, **options):
+        client = AsaasClient(
+            base_url=options["base_url"], limiter=TokenBucket(options["rate"])
+        )
+        result = reconcile_payments(
+            client,
+            workers=options["workers"],
+            page_size=options["page_size"],
+            max_pages=options["max_pages"],
+            restart=options["restart"],
+        )
+
+        state = "concluída" if result.finished else "interrompida (checkpoint salvo)"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Conciliação {state}: {result.checked} pagamentos conferidos, "
+                f"{result.discrepancies} divergências."
+            )
+        )
@@ -0,0 +1,107 @@
+# Generated by Django 6.0.2 on 2026-10-19 19:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("appointments", "0005_appointment_prof_date_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Payment",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "asaas_id",
+                    models.CharField(
+                        max_length=100, unique=True, verbose_name="ID Asaas"
+                    ),
+                ),
+                (
+                    "value",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=10, verbose_name="Valor"
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        default="PENDING", max_length=30, verbose_name="Situação"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "appointment",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="payments",
+                        to="appointments.appointment",
+                        verbose_name="Consulta",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Pagamento",
+                "verbose_name_plural": "Pagamentos",
+            },
+        ),
+        migrations.CreateModel(
+            name="WebhookEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event_id",
+                    models.CharField(
+                        max_length=100, unique=True, verbose_name="ID do Evento"
+                    ),
+                ),
+                ("event", models.CharField(max_length=50, verbose_name="Tipo")),
+                ("payload", models.JSONField(verbose_name="Conteúdo")),
+                (
+                    "received_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Recebido em"),
+                ),
+                (
+                    "processed_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Processado em"
+                    ),
+                ),
+                ("error", models.TextField(blank=True, verbose_name="Erro")),
+            ],
+            options={
+                "verbose_name": "Evento de Webhook",
+                "verbose_name_plural": "Eventos de Webhook",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("processed_at__isnull", True)),
+                        fields=["received_at"],
+                        name="webhook_event_pending_idx",
+                    )
+                ],
+            },
+        ),
+    ]
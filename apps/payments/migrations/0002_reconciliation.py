@@ -0,0 +1,94 @@
+# Generated by Django 6.0.2 on 2026-10-19 19:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payments", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReconciliationCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(max_length=50, unique=True, verbose_name="Nome"),
+                ),
+                (
+                    "last_payment_id",
+                    models.BigIntegerField(verbose_name="Último pagamento"),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Checkpoint de Conciliação",
+                "verbose_name_plural": "Checkpoints de Conciliação",
+            },
+        ),
+        migrations.CreateModel(
+            name="PaymentDiscrepancy",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("missing", "Não encontrado na Asaas"),
+                            ("status", "Situação divergente"),
+                            ("value", "Valor divergente"),
+                            ("error", "Falha na consulta"),
+                        ],
+                        max_length=10,
+                        verbose_name="Tipo",
+                    ),
+                ),
+                (
+                    "local_value",
+                    models.CharField(blank=True, max_length=100, verbose_name="Local"),
+                ),
+                (
+                    "remote_value",
+                    models.CharField(blank=True, max_length=255, verbose_name="Asaas"),
+                ),
+                (
+                    "detected_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Detectado em"
+                    ),
+                ),
+                (
+                    "payment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="discrepancies",
+                        to="payments.payment",
+                        verbose_name="Pagamento",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Divergência de Pagamento",
+                "verbose_name_plural": "Divergências de Pagamento",
+            },
+        ),
+    ]
@@ -0,0 +1,103 @@
+# Generated by Django 6.0.2 on 2026-10-19 19:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payments", "0002_reconciliation"),
+        ("professionals", "0004_professional_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PricingRule",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "profession",
+                    models.CharField(
+                        blank=True, max_length=100, verbose_name="Profissão"
+                    ),
+                ),
+                (
+                    "value",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=10, verbose_name="Valor"
+                    ),
+                ),
+                (
+                    "platform_fee",
+                    models.DecimalField(
+                        decimal_places=2,
+                        max_digits=10,
+                        verbose_name="Taxa da Plataforma",
+                    ),
+                ),
+                (
+                    "wallet_id",
+                    models.CharField(
+                        max_length=100, verbose_name="Wallet do Profissional"
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "professional",
+                    models.ForeignKey(
+                        blank=True,
+                        db_index=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pricing_rules",
+                        to="professionals.professional",
+                        verbose_name="Profissional",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Regra de Preço",
+                "verbose_name_plural": "Regras de Preço",
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("professional__isnull", False)),
+                        fields=("professional",),
+                        name="pricing_rule_professional_unique",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("professional__isnull", True)),
+                        fields=("profession",),
+                        name="pricing_rule_profession_unique",
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            models.Q(
+                                ("profession", ""), ("professional__isnull", False)
+                            ),
+                            models.Q(
+                                ("professional__isnull", True),
+                                models.Q(("profession", ""), _negated=True),
+                            ),
+                            _connector="OR",
+                        ),
+                        name="pricing_rule_target",
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            ("platform_fee__gte", 0),
+                            ("platform_fee__lte", models.F("value")),
+                        ),
+                        name="pricing_rule_fee_within_value",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-19 19:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payments", "0003_pricingrule"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="payment",
+            name="status_changed_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Situação alterada em"
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.2 on 2026-10-19 20:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payments", "0004_payment_status_changed_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhookevent",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(
+                default=0, verbose_name="Tentativas"
+            ),
+        ),
+        migrations.AddField(
+            model_name="webhookevent",
+            name="next_attempt_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Próxima tentativa"
+            ),
+        ),
+    ]
@@ -0,0 +1,172 @@
+from django.db import models
+
+from apps.appointments.models import Appointment
+from apps.professionals.models import Professional
+
+
+class Payment(models.Model):
+    """Cobrança de uma consulta na Asaas e sua situação mais recente."""
+
+    # Sem constraint no banco (chave (id, date) no PostgreSQL) e sem cascade:
+    # o registro financeiro sobrevive ao arquivamento ou remoção da consulta.
+    appointment = models.ForeignKey(
+        Appointment,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="payments",
+        verbose_name="Consulta",
+    )
+    asaas_id = models.CharField(max_length=100, unique=True, verbose_name="ID Asaas")
+    value = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Valor")
+    status = models.CharField(max_length=30, default="PENDING", verbose_name="Situação")
+    # Data do evento da Asaas que definiu `status`: eventos mais antigos que
+    # chegam depois (outro lote, outro consumidor) não sobrescrevem a situação.
+    status_changed_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="Situação alterada em"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Pagamento {self.asaas_id} ({self.status})"
+
+    class Meta:
+        verbose_name = "Pagamento"
+        verbose_name_plural = "Pagamentos"
+
+
+class WebhookEvent(models.Model):
+    """
+    Caixa de entrada dos webhooks da Asaas: o evento bruto é gravado na
+    chegada e aplicado depois, em lotes, pelo comando `process_payment_webhooks`.
+    """
+
+    event_id = models.CharField(
+        max_length=100, unique=True, verbose_name="ID do Evento"
+    )
+    event = models.CharField(max_length=50, verbose_name="Tipo")
+    payload = models.JSONField(verbose_name="Conteúdo")
+    received_at = models.DateTimeField(auto_now_add=True, verbose_name="Recebido em")
+    processed_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="Processado em"
+    )
+    error = models.TextField(blank=True, verbose_name="Erro")
+    # Eventos de pagamentos ainda não gravados localmente são reprocessados
+    # com espera crescente até PAYMENT_WEBHOOK_MAX_ATTEMPTS.
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="Tentativas")
+    next_attempt_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="Próxima tentativa"
+    )
+
+    def __str__(self):
+        return f"{self.event} ({self.event_id})"
+
+    class Meta:
+        verbose_name = "Evento de Webhook"
+        verbose_name_plural = "Eventos de Webhook"
+        indexes = [
+            models.Index(
+                fields=["received_at"],
+                condition=models.Q(processed_at__isnull=True),
+                name="webhook_event_pending_idx",
+            ),
+        ]
+
+
+class PaymentDiscrepancy(models.Model):
+    """Divergência entre o pagamento local e a cobrança na Asaas."""
+
+    class Kind(models.TextChoices):
+        MISSING = "missing", "Não encontrado na Asaas"
+        STATUS = "status", "Situação divergente"
+        VALUE = "value", "Valor divergente"
+        ERROR = "error", "Falha na consulta"
+
+    payment = models.ForeignKey(
+        Payment,
+        on_delete=models.CASCADE,
+        related_name="discrepancies",
+        verbose_name="Pagamento",
+    )
+    kind = models.CharField(max_length=10, choices=Kind.choices, verbose_name="Tipo")
+    local_value = models.CharField(max_length=100, blank=True, verbose_name="Local")
+    remote_value = models.CharField(max_length=255, blank=True, verbose_name="Asaas")
+    detected_at = models.DateTimeField(auto_now_add=True, verbose_name="Detectado em")
+
+    def __str__(self):
+        return f"{self.get_kind_display()} em {self.payment_id}"
+
+    class Meta:
+        verbose_name = "Divergência de Pagamento"
+        verbose_name_plural = "Divergências de Pagamento"
+
+
+class ReconciliationCheckpoint(models.Model):
+    """Último pagamento conferido por uma conciliação, para retomar execuções interrompidas."""
+
+    name = models.CharField(max_length=50, unique=True, verbose_name="Nome")
+    last_payment_id = models.BigIntegerField(verbose_name="Último pagamento")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name}: {self.last_payment_id}"
+
+    class Meta:
+        verbose_name = "Checkpoint de Conciliação"
+        verbose_name_plural = "Checkpoints de Conciliação"
+
+
+class PricingRule(models.Model):
+    """
+    Preço da consulta e split do pagamento. Vale para um profissional ou, sem
+    profissional, para todos de uma profissão; a regra do profissional tem
+    precedência. Lida pelo cache em processo de `apps.payments.pricing`.
+    """
+
+    professional = models.ForeignKey(
+        Professional,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        # Coberto pelo índice único parcial pricing_rule_professional_unique.
+        db_index=False,
+        related_name="pricing_rules",
+        verbose_name="Profissional",
+    )
+    profession = models.CharField(max_length=100, blank=True, verbose_name="Profissão")
+    value = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Valor")
+    platform_fee = models.DecimalField(
+        max_digits=10, decimal_places=2, verbose_name="Taxa da Plataforma"
+    )
+    wallet_id = models.CharField(max_length=100, verbose_name="Wallet do Profissional")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        target = self.professional_id or self.profession
+        return f"Preço de {target}: {self.value}"
+
+    class Meta:
+        verbose_name = "Regra de Preço"
+        verbose_name_plural = "Regras de Preço"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["professional"],
+                condition=models.Q(professional__isnull=False),
+                name="pricing_rule_professional_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["profession"],
+                condition=models.Q(professional__isnull=True),
+                name="pricing_rule_profession_unique",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(professional__isnull=False, profession="")
+                | (models.Q(professional__isnull=True) & ~models.Q(profession="")),
+                name="pricing_rule_target",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(platform_fee__gte=0)
+                & models.Q(platform_fee__lte=models.F("value")),
+                name="pricing_rule_fee_within_value",
+            ),
+        ]
@@ -0,0 +1,176 @@
+"""
+Preço e split das consultas, resolvidos a partir de `PricingRule` com um cache
+em processo.
+
+Cada processo guarda o preço já resolvido por (profissional, profissão). Quando
+uma regra muda, os signals descartam o cache do processo após o commit e, no
+PostgreSQL, emitem um NOTIFY no canal `pricing_rules`; com
+`PRICING_LISTEN_FOR_CHANGES`, cada worker mantém uma conexão em LISTEN e
+descarta o próprio cache ao recebê-lo. As entradas também expiram após
+`PRICING_CACHE_TTL_SECONDS`, o que cobre alterações por `update()` em lote (que
+não disparam signals) e notificações perdidas durante uma reconexão.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Q
+
+from apps.appointments.events import PostgresNotifyBroker
+
+
+@dataclass(frozen=True)
+class Pricing:
+    """Valor da consulta e split: o profissional recebe `value - platform_fee`."""
+
+    value: Decimal
+    platform_fee: Decimal
+    wallet_id: str
+
+    @property
+    def professional_value(self):
+        return self.value - self.platform_fee
+
+    @classmethod
+    def default(cls):
+        return cls(
+            value=settings.PRICING_DEFAULT_VALUE,
+            platform_fee=settings.PRICING_DEFAULT_PLATFORM_FEE,
+            wallet_id=settings.PRICING_DEFAULT_WALLET_ID,
+        )
+
+
+def load_pricing(keys):
+    """
+    Resolve o preço de vários pares (profissional, profissão) em uma query:
+    regra do profissional, senão a da profissão, senão o padrão das settings.
+    """
+    from .models import PricingRule
+
+    professional_ids = {professional_id for professional_id, _ in keys}
+    professions = {profession for _, profession in keys}
+    by_professional = {}
+    by_profession = {}
+    for rule in PricingRule.objects.filter(
+        Q(professional_id__in=professional_ids)
+        | Q(professional__isnull=True, profession__in=professions)
+    ):
+        if rule.professional_id is not None:
+            by_professional[rule.professional_id] = rule
+        else:
+            by_profession[rule.profession] = rule
+
+    default = Pricing.default()
+    resolved = {}
+    for professional_id, profession in keys:
+        rule = by_professional.get(professional_id) or by_profession.get(profession)
+        resolved[professional_id, profession] = (
+            Pricing(rule.value, rule.platform_fee, rule.wallet_id) if rule else default
+        )
+    return resolved
+
+
+class PricingCache:
+    """Preços resolvidos por (profissional, profissão), seguros entre threads."""
+
+    def __init__(self, ttl=None, clock=time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = {}
+        self.loaded_at = None
+        # Incrementado a cada descarte, para não guardar um carregamento que
+        # começou antes de uma invalidação.
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def _sync(self):
+        ttl = settings.PRICING_CACHE_TTL_SECONDS if self.ttl is None else self.ttl
+        now = self.clock()
+        with self.lock:
+            if self.loaded_at is None or now - self.loaded_at >= ttl:
+                self.entries = {}
+                self.loaded_at = now
+                self.generation += 1
+            return self.generation
+
+    def get_many(self, professionals):
+        """Preço por id de profissional; só os ausentes do cache vão ao banco."""
+        generation = self._sync()
+        keys = {
+            (professional.pk, professional.profession) for professional in professionals
+        }
+        entries = self.entries
+        loaded = {}
+        missing = {key for key in keys if key not in entries}
+        if missing:
+            loaded = load_pricing(missing)
+            with self.lock:
+                if self.generation == generation:
+                    # Copia em vez de alterar: leitores sem lock não veem o
+                    # dicionário mudar durante a leitura.
+                    self.entries = {**self.entries, **loaded}
+        # Chave: (id do profissional, profissão)
+        return {key[0]: loaded.get(key) or entries[key] for key in keys}
+
+    def clear(self):
+        with self.lock:
+            self.entries = {}
+            self.loaded_at = None
+            self.generation += 1
+
+
+class PricingChangeListener(PostgresNotifyBroker):
+    """
+    Reaproveita a conexão LISTEN do broker de eventos das consultas, no canal
+    `pricing_rules`: cada notificação descarta o cache de preços do processo.
+    """
+
+    pg_channel = "pricing_rules"
+
+    def __init__(self, pricing_cache):
+        super().__init__()
+        self.pricing_cache = pricing_cache
+
+    def start(self):
+        self._ensure_listener()
+
+    def _listen(self):
+        # Notificações emitidas enquanto a conexão estava caída se perderam.
+        self.pricing_cache.clear()
+        super()._listen()
+
+    def _receive(self, payload):
+        self.pricing_cache.clear()
+
+
+# Um cache por processo (cada worker do gunicorn tem o seu).
+pricing_cache = PricingCache()
+pricing_listener = PricingChangeListener(pricing_cache)
+
+
+def notify_pricing_change(using="default"):
+    """
+    Descarta o cache deste processo após o commit e, no PostgreSQL, avisa os
+    demais processos: o NOTIFY só é entregue se a transação for confirmada.
+    """
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, '')", [PricingChangeListener.pg_channel]
+            )
+    transaction.on_commit(pricing_cache.clear, using=using)
+
+
+def get_pricing_many(professionals):
+    if settings.PRICING_LISTEN_FOR_CHANGES:
+        pricing_listener.start()
+    return pricing_cache.get_many(professionals)
+
+
+def get_pricing(professional):
+    return get_pricing_many([professional])[professional.pk]
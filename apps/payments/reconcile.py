@@ -0,0 +1,133 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+
+from .asaas import AsaasError
+from .models import Payment, PaymentDiscrepancy, ReconciliationCheckpoint
+
+CHECKPOINT_NAME = "asaas"
+
+
+@dataclass
+class ReconciliationResult:
+    checked: int = 0
+    discrepancies: int = 0
+    pages: int = 0
+    finished: bool = False
+
+
+def iter_payment_pages(after_id, page_size):
+    """Percorre os pagamentos por chave (`id > último id`), sem OFFSET."""
+    while True:
+        page = list(
+            Payment.objects.filter(pk__gt=after_id)
+            .order_by("pk")
+            .only("pk", "asaas_id", "status", "value")[:page_size]
+        )
+        if not page:
+            return
+        yield page
+        after_id = page[-1].pk
+
+
+def compare(payment, remote):
+    """Divergências entre o pagamento local e a cobrança retornada pela Asaas."""
+    if remote is None:
+        return [
+            PaymentDiscrepancy(payment=payment, kind=PaymentDiscrepancy.Kind.MISSING)
+        ]
+
+    found = []
+    if remote.get("status") != payment.status:
+        found.append(
+            PaymentDiscrepancy(
+                payment=payment,
+                kind=PaymentDiscrepancy.Kind.STATUS,
+                local_value=payment.status,
+                remote_value=str(remote.get("status")),
+            )
+        )
+    try:
+        remote_value = Decimal(str(remote.get("value")))
+    except InvalidOperation:
+        remote_value = None
+    if remote_value != payment.value:
+        found.append(
+            PaymentDiscrepancy(
+                payment=payment,
+                kind=PaymentDiscrepancy.Kind.VALUE,
+                local_value=str(payment.value),
+                remote_value=str(remote.get("value")),
+            )
+        )
+    return found
+
+
+def _fetch(client, payment):
+    try:
+        return payment, client.get_payment(payment.asaas_id), None
+    except AsaasError as exc:
+        return payment, None, exc
+
+
+def _save_checkpoint(last_payment_id):
+    ReconciliationCheckpoint.objects.bulk_create(
+        [
+            ReconciliationCheckpoint(
+                name=CHECKPOINT_NAME, last_payment_id=last_payment_id
+            )
+        ],
+        update_conflicts=True,
+        unique_fields=["name"],
+        update_fields=["last_payment_id", "updated_at"],
+    )
+
+
+def reconcile_payments(client, workers=8, page_size=500, max_pages=None, restart=False):
+    """
+    Confere os pagamentos locais com a Asaas.
+
+    Cada página é consultada em paralelo por `workers` threads (a taxa de
+    requisições é controlada pelo limitador do `client`); as divergências da
+    página são gravadas com um `bulk_create`, na mesma transação que avança o
+    checkpoint. Uma execução interrompida continua do checkpoint; ao concluir,
+    o checkpoint é removido e a próxima execução recomeça do início.
+    """
+    if restart:
+        ReconciliationCheckpoint.objects.filter(name=CHECKPOINT_NAME).delete()
+    checkpoint = ReconciliationCheckpoint.objects.filter(name=CHECKPOINT_NAME).first()
+    after_id = checkpoint.last_payment_id if checkpoint else 0
+
+    result = ReconciliationResult()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for page in iter_payment_pages(after_id, page_size):
+            discrepancies = []
+            for payment, remote, error in executor.map(
+                lambda payment: _fetch(client, payment), page
+            ):
+                if error is not None:
+                    discrepancies.append(
+                        PaymentDiscrepancy(
+                            payment=payment,
+                            kind=PaymentDiscrepancy.Kind.ERROR,
+                            remote_value=str(error)[:255],
+                        )
+                    )
+                else:
+                    discrepancies.extend(compare(payment, remote))
+
+            with transaction.atomic():
+                PaymentDiscrepancy.objects.bulk_create(discrepancies)
+                _save_checkpoint(page[-1].pk)
+
+            result.checked += len(page)
+            result.discrepancies += len(discrepancies)
+            result.pages += 1
+            if max_pages is not None and result.pages >= max_pages:
+                return result
+
+    ReconciliationCheckpoint.objects.filter(name=CHECKPOINT_NAME).delete()
+    result.finished = True
+    return result
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import PricingRule
+from .pricing import notify_pricing_change
+
+
+@receiver([post_save, post_delete], sender=PricingRule, dispatch_uid="payments_pricing")
+def invalidate_pricing(sender, using, **kwargs):
+    notify_pricing_change(using)
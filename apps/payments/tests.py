@@ -0,0 +1,478 @@
+import json
+import select
+import threading
+from datetime import datetime, timedelta
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection, connections, transaction
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.appointments.models import Appointment
+from apps.appointments.services import AsaasService
+from apps.professionals.models import Professional
+from .asaas import TokenBucket
+from .models import (
+    Payment,
+    PaymentDiscrepancy,
+    PricingRule,
+    ReconciliationCheckpoint,
+    WebhookEvent,
+)
+from .pricing import (
+    Pricing,
+    PricingCache,
+    PricingChangeListener,
+    get_pricing,
+    get_pricing_many,
+    pricing_cache,
+)
+from .webhooks import process_webhook_batch
+
+
+def webhook_event(
+    event_id, payment_id, payment_status, date_created="2026-01-01 10:00:00"
+):
+    return {
+        "id": event_id,
+        "event": f"PAYMENT_{payment_status}",
+        "dateCreated": date_created,
+        "payment": {"id": payment_id, "status": payment_status, "value": 200.0},
+    }
+
+
+@override_settings(ASAAS_WEBHOOK_TOKEN="webhook-secret")
+class PaymentWebhookTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("asaas-webhook")
+        self.professional = Professional.objects.create(
+            social_name="Dr. Strange",
+            profession="Sorcerer Supreme",
+            contact="strange@sanctum.com",
+            address="177A Bleecker Street",
+        )
+        self.appointment = Appointment.objects.create(
+            professional=self.professional, date=timezone.now() + timedelta(days=1)
+        )
+        self.payment = Payment.objects.create(
+            appointment=self.appointment, asaas_id="pay_1", value=Decimal("200.00")
+        )
+
+    def post_event(self, payload, token="webhook-secret"):
+        return self.client.post(
+            self.url, payload, format="json", HTTP_ASAAS_ACCESS_TOKEN=token
+        )
+
+    def test_creating_appointment_registers_payment(self):
+        """Teste de registro do pagamento ao agendar uma consulta"""
+        user = User.objects.create_user(username="patient", password="password123")
+        self.client.force_authenticate(user=user)
+        response = self.client.post(
+            reverse("appointment-list"),
+            {
+                "professional": self.professional.id,
+                "date": timezone.now() + timedelta(days=2),
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        payment = Payment.objects.get(appointment_id=response.data["id"])
+        self.assertEqual(payment.status, "PENDING")
+        self.assertEqual(payment.value, Decimal("200.00"))
+
+    def test_webhook_requires_valid_token(self):
+        """Teste de rejeição de webhooks sem o token configurado"""
+        response = self.post_event(
+            webhook_event("evt_1", "pay_1", "RECEIVED"), token="wrong"
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertFalse(WebhookEvent.objects.exists())
+
+    def test_webhook_stores_event_once(self):
+        """Teste de gravação do evento na caixa de entrada, sem duplicar"""
+        payload = webhook_event("evt_1", "pay_1", "RECEIVED")
+        for _ in range(2):
+            with self.assertNumQueries(1):
+                response = self.post_event(payload)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        event = WebhookEvent.objects.get()
+        self.assertEqual(event.payload, payload)
+        self.assertIsNone(event.processed_at)
+        # O pagamento só muda quando o consumidor processa a caixa de entrada.
+        self.payment.refresh_from_db()
+        self.assertEqual(self.payment.status, "PENDING")
+
+    def test_webhook_rejects_malformed_event(self):
+        """Teste de rejeição de eventos sem id"""
+        response = self.post_event({"event": "PAYMENT_RECEIVED"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_applies_latest_status_per_payment(self):
+        """Teste de aplicação em lote: prevalece o último evento de cada pagamento"""
+        for payload in (
+            webhook_event("evt_1", "pay_1", "CONFIRMED"),
+            webhook_event("evt_2", "pay_1", "RECEIVED"),
+            webhook_event("evt_3", "pay_unknown", "RECEIVED"),
+        ):
+            self.post_event(payload)
+
+        # SELECT dos eventos, SELECT dos pagamentos e um UPDATE em lote por
+        # tabela, mais o SAVEPOINT/RELEASE da transação dentro do teste
+        with self.assertNumQueries(6):
+            processed, lag = process_webhook_batch(100)
+
+        self.assertEqual(processed, 3)
+        self.assertGreaterEqual(lag, timedelta(0))
+        self.payment.refresh_from_db()
+        self.assertEqual(self.payment.status, "RECEIVED")
+        # O evento do pagamento desconhecido fica pendente para nova tentativa.
+        unknown = WebhookEvent.objects.get(processed_at__isnull=True)
+        self.assertEqual(unknown.event_id, "evt_3")
+        self.assertEqual(unknown.attempts, 1)
+
+    def test_event_received_before_payment_is_retried(self):
+        """Teste: evento recebido antes do pagamento local é aplicado na nova tentativa"""
+        self.post_event(webhook_event("evt_1", "pay_2", "RECEIVED"))
+        now = timezone.now()
+        process_webhook_batch(100, now=now)
+
+        event = WebhookEvent.objects.get()
+        self.assertIsNone(event.processed_at)
+        self.assertEqual(event.next_attempt_at, now + timedelta(seconds=30))
+        # Antes do prazo o evento não é reservado.
+        self.assertEqual(process_webhook_batch(100, now=now), (0, None))
+
+        payment = Payment.objects.create(
+            appointment=self.appointment, asaas_id="pay_2", value=Decimal("200.00")
+        )
+        process_webhook_batch(100, now=now + timedelta(seconds=30))
+
+        payment.refresh_from_db()
+        self.assertEqual(payment.status, "RECEIVED")
+        event.refresh_from_db()
+        self.assertIsNotNone(event.processed_at)
+
+    @override_settings(PAYMENT_WEBHOOK_MAX_ATTEMPTS=3)
+    def test_unknown_payment_event_gives_up_after_max_attempts(self):
+        """Teste: evento de pagamento desconhecido é encerrado após as tentativas"""
+        self.post_event(webhook_event("evt_1", "pay_unknown", "RECEIVED"))
+        now = timezone.now()
+        for _ in range(3):
+            process_webhook_batch(100, now=now)
+            now += timedelta(hours=1)
+
+        event = WebhookEvent.objects.get()
+        self.assertEqual(event.attempts, 3)
+        self.assertIsNotNone(event.processed_at)
+        self.assertEqual(event.error, "Pagamento desconhecido após 3 tentativas.")
+
+    def test_older_event_processed_later_is_ignored(self):
+        """Teste: evento mais antigo aplicado em outro lote não regride a situação"""
+        self.post_event(
+            webhook_event("evt_1", "pay_1", "RECEIVED", "2026-01-01 10:05:00")
+        )
+        process_webhook_batch(100)
+        self.post_event(
+            webhook_event("evt_2", "pay_1", "PENDING", "2026-01-01 10:00:00")
+        )
+        process_webhook_batch(100)
+
+        self.payment.refresh_from_db()
+        self.assertEqual(self.payment.status, "RECEIVED")
+        self.assertEqual(
+            self.payment.status_changed_at,
+            timezone.make_aware(datetime(2026, 1, 1, 10, 5)),
+        )
+        self.assertFalse(
+            WebhookEvent.objects.filter(processed_at__isnull=True).exists()
+        )
+
+    def test_process_payment_webhooks_command(self):
+        """Teste do comando process_payment_webhooks com métricas de atraso"""
+        for index in range(5):
+            self.post_event(webhook_event(f"evt_{index}", "pay_1", "RECEIVED"))
+
+        out = StringIO()
+        with self.assertLogs("django", level="INFO") as logs:
+            call_command(
+                "process_payment_webhooks",
+                "--batch-size",
+                "2",
+                "--max-batches",
+                "2",
+                stdout=out,
+            )
+
+        self.assertIn("4 eventos processados em 2 lotes", out.getvalue())
+        self.assertIn("pendentes: 1", out.getvalue())
+        self.assertTrue(any("Payment Webhooks:" in line for line in logs.output))
+
+
+class MockAsaasHandler(BaseHTTPRequestHandler):
+    payments = {}
+
+    def do_GET(self):
+        asaas_id = self.path.rsplit("/", 1)[-1]
+        if self.headers.get("access_token") != "api-key":
+            self.send_response(401)
+        elif asaas_id == "pay_broken":
+            self.send_response(500)
+        elif asaas_id not in self.payments:
+            self.send_response(404)
+        else:
+            body = json.dumps(self.payments[asaas_id]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@override_settings(ASAAS_API_KEY="api-key")
+class PaymentReconciliationTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), MockAsaasHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}/api/v3"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        professional = Professional.objects.create(
+            social_name="Dr. Strange",
+            profession="Sorcerer Supreme",
+            contact="strange@sanctum.com",
+            address="177A Bleecker Street",
+        )
+        appointment = Appointment.objects.create(
+            professional=professional, date=timezone.now() + timedelta(days=1)
+        )
+        MockAsaasHandler.payments = {}
+        for index in range(10):
+            asaas_id = f"pay_{index}"
+            Payment.objects.create(
+                appointment=appointment, asaas_id=asaas_id, value=Decimal("200.00")
+            )
+            MockAsaasHandler.payments[asaas_id] = {
+                "id": asaas_id,
+                "status": "PENDING",
+                "value": 200.0,
+            }
+        MockAsaasHandler.payments["pay_3"]["status"] = "RECEIVED"
+        MockAsaasHandler.payments["pay_7"]["value"] = 150.0
+        del MockAsaasHandler.payments["pay_8"]
+        Payment.objects.filter(asaas_id="pay_9").update(asaas_id="pay_broken")
+
+    def reconcile(self, *args):
+        out = StringIO()
+        call_command(
+            "reconcile_payments",
+            "--base-url",
+            self.base_url,
+            "--workers",
+            "4",
+            "--rate",
+            "1000",
+            "--page-size",
+            "4",
+            *args,
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def test_reconcile_records_discrepancies(self):
+        """Teste de conciliação contra um servidor Asaas simulado"""
+        output = self.reconcile()
+
+        self.assertIn("Conciliação concluída: 10 pagamentos conferidos", output)
+        self.assertEqual(
+            sorted(PaymentDiscrepancy.objects.values_list("payment__asaas_id", "kind")),
+            [
+                ("pay_3", "status"),
+                ("pay_7", "value"),
+                ("pay_8", "missing"),
+                ("pay_broken", "error"),
+            ],
+        )
+        self.assertFalse(ReconciliationCheckpoint.objects.exists())
+
+    def test_reconcile_resumes_from_checkpoint(self):
+        """Teste de retomada da conciliação a partir do checkpoint"""
+        output = self.reconcile("--max-pages", "1")
+        self.assertIn("interrompida", output)
+        checkpoint = ReconciliationCheckpoint.objects.get()
+        self.assertEqual(
+            checkpoint.last_payment_id, Payment.objects.get(asaas_id="pay_3").pk
+        )
+
+        output = self.reconcile()
+        self.assertIn("6 pagamentos conferidos", output)
+        self.assertEqual(PaymentDiscrepancy.objects.count(), 4)
+
+
+class TokenBucketTests(SimpleTestCase):
+    def test_token_bucket_limits_rate(self):
+        """Teste do limitador de taxa: rajada inicial e depois `rate` por segundo"""
+        clock = [0.0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        bucket = TokenBucket(rate=2, clock=lambda: clock[0], sleep=sleep)
+        for _ in range(6):
+            bucket.acquire()
+        # 2 da rajada inicial e mais 4 a 2 por segundo
+        self.assertAlmostEqual(clock[0], 2.0)
+
+
+class PricingTests(TestCase):
+    def setUp(self):
+        pricing_cache.clear()
+        self.addCleanup(pricing_cache.clear)
+        self.professionals = [
+            Professional.objects.create(
+                social_name=f"Dra. Preço {index}",
+                profession=profession,
+                contact=f"preco{index}@example.com",
+                address="Rua do Preço",
+            )
+            for index, profession in enumerate(["Psicologia", "Psicologia", "Nutrição"])
+        ]
+        PricingRule.objects.create(
+            profession="Psicologia",
+            value=Decimal("150.00"),
+            platform_fee=Decimal("15.00"),
+            wallet_id="wallet_psicologia",
+        )
+        self.rule = PricingRule.objects.create(
+            professional=self.professionals[0],
+            value=Decimal("300.00"),
+            platform_fee=Decimal("30.00"),
+            wallet_id="wallet_dra_0",
+        )
+
+    def test_pricing_resolution_in_one_query(self):
+        """Teste: regra do profissional, da profissão ou padrão, em uma query"""
+        with self.assertNumQueries(1):
+            pricing = get_pricing_many(self.professionals)
+        first, second, third = (pricing[p.pk] for p in self.professionals)
+
+        self.assertEqual(
+            first, Pricing(Decimal("300.00"), Decimal("30.00"), "wallet_dra_0")
+        )
+        self.assertEqual(second.value, Decimal("150.00"))
+        self.assertEqual(second.professional_value, Decimal("135.00"))
+        self.assertEqual(third, Pricing.default())
+
+        with self.assertNumQueries(0):
+            get_pricing_many(self.professionals)
+
+    def test_booking_uses_cached_pricing(self):
+        """Teste: com o preço em cache, a cobrança só faz o INSERT do pagamento"""
+        appointments = [
+            Appointment.objects.create(
+                professional=self.professionals[0],
+                date=timezone.now() + timedelta(days=days),
+            )
+            for days in (1, 2)
+        ]
+        AsaasService.create_payment_with_split(appointments[0])
+        with self.assertNumQueries(1):
+            AsaasService.create_payment_with_split(appointments[1])
+
+        self.assertEqual(
+            list(Payment.objects.values_list("value", flat=True).distinct()),
+            [Decimal("300.00")],
+        )
+
+    def test_rule_change_invalidates_cache(self):
+        """Teste de invalidação do cache quando uma regra muda"""
+        get_pricing(self.professionals[0])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.rule.value = Decimal("320.00")
+            self.rule.save()
+        self.assertEqual(get_pricing(self.professionals[0]).value, Decimal("320.00"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.rule.delete()
+        self.assertEqual(get_pricing(self.professionals[0]).value, Decimal("150.00"))
+
+    def test_cache_expires_after_ttl(self):
+        """Teste de expiração das entradas do cache após o TTL"""
+        clock = [0.0]
+        pricing = PricingCache(ttl=60, clock=lambda: clock[0])
+        pricing.get_many(self.professionals)
+
+        clock[0] = 59
+        with self.assertNumQueries(0):
+            pricing.get_many(self.professionals)
+        clock[0] = 60
+        with self.assertNumQueries(1):
+            pricing.get_many(self.professionals)
+
+    def test_change_notification_clears_cache(self):
+        """Teste: a notificação de outro processo descarta o cache local"""
+        pricing = PricingCache()
+        pricing.get_many(self.professionals)
+        PricingChangeListener(pricing)._receive("")
+        with self.assertNumQueries(1):
+            pricing.get_many(self.professionals)
+
+
+@skipUnless(connection.vendor == "postgresql", "LISTEN/NOTIFY exige PostgreSQL")
+class PricingNotificationTests(TransactionTestCase):
+    def test_rule_change_notifies_other_processes(self):
+        """Teste: alterar uma regra emite NOTIFY só após o commit"""
+        listener = connections.create_connection("default")
+        self.addCleanup(listener.close)
+        listener.ensure_connection()
+        listener.set_autocommit(True)
+        raw = listener.connection
+        with raw.cursor() as cursor:
+            cursor.execute(f"LISTEN {PricingChangeListener.pg_channel}")
+
+        def received():
+            select.select([raw], [], [], 1)
+            raw.poll()
+            notifies = list(raw.notifies)
+            raw.notifies.clear()
+            return notifies
+
+        with transaction.atomic():
+            rule = PricingRule.objects.create(
+                profession="Nutrição",
+                value=Decimal("150.00"),
+                platform_fee=Decimal("15.00"),
+                wallet_id="wallet_nutricao",
+            )
+            self.assertEqual(received(), [])
+        self.assertEqual(len(received()), 1)
+
+        rule.delete()
+        self.assertEqual(len(received()), 1)
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import asaas_webhook
+
+urlpatterns = [
+    path("webhooks/asaas/", asaas_webhook, name="asaas-webhook"),
+]
@@ -0,0 +1,38 @@
+import hmac
+import json
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from .models import WebhookEvent
+
+
+@csrf_exempt
+@require_POST
+def asaas_webhook(request):
+    """
+    Recebe os webhooks de pagamento da Asaas.
+
+    Apenas valida o token enviado no header `asaas-access-token` e grava o
+    evento bruto na caixa de entrada, respondendo 200 imediatamente. Eventos
+    repetidos (mesmo `id`) são descartados pela constraint única. O
+    processamento é feito pelo comando `process_payment_webhooks`.
+    """
+    token = request.headers.get("asaas-access-token", "")
+    expected = settings.ASAAS_WEBHOOK_TOKEN
+    if not expected or not hmac.compare_digest(token, expected):
+        return JsonResponse({"detail": "Token de webhook inválido."}, status=401)
+
+    try:
+        payload = json.loads(request.body)
+        event_id, event = str(payload["id"]), str(payload["event"])
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({"detail": "Evento inválido."}, status=400)
+
+    WebhookEvent.objects.bulk_create(
+        [WebhookEvent(event_id=event_id, event=event, payload=payload)],
+        ignore_conflicts=True,
+    )
+    return JsonResponse({"received": True})
@@ -0,0 +1,120 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Payment, WebhookEvent
+
+
+def pending_events():
+    return WebhookEvent.objects.filter(processed_at__isnull=True)
+
+
+def due_events(now):
+    """Eventos pendentes, exceto os que aguardam uma nova tentativa."""
+    return pending_events().filter(
+        Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now)
+    )
+
+
+def retry_delay(attempts):
+    return timedelta(
+        seconds=settings.PAYMENT_WEBHOOK_RETRY_SECONDS * 2 ** (attempts - 1)
+    )
+
+
+def event_time(event):
+    """
+    Data do evento segundo a Asaas (`dateCreated`, horário local sem fuso);
+    sem ela, vale a data de recebimento.
+    """
+    try:
+        moment = datetime.fromisoformat(event.payload["dateCreated"])
+    except (KeyError, TypeError, ValueError):
+        return event.received_at
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def process_webhook_batch(batch_size, now=None):
+    """
+    Aplica um lote de eventos da caixa de entrada em uma única transação.
+
+    Os eventos são reservados com `FOR UPDATE SKIP LOCKED` (vários consumidores
+    podem rodar em paralelo) e agrupados por pagamento: apenas a situação do
+    evento mais recente (`dateCreated`) de cada pagamento é gravada, com um
+    `bulk_update`. Os pagamentos ficam travados até o commit e eventos mais
+    antigos que o último aplicado são ignorados, então a ordem em que lotes
+    concorrentes terminam não importa. Eventos de um pagamento que ainda não
+    existe localmente (o webhook pode chegar antes do commit do `Payment`)
+    continuam pendentes e são tentados de novo após `retry_delay`; após
+    `PAYMENT_WEBHOOK_MAX_ATTEMPTS` tentativas são encerrados com erro.
+    Retorna `(eventos processados, atraso do evento mais antigo do lote)`.
+    """
+    now = now or timezone.now()
+    with transaction.atomic():
+        events = list(
+            due_events(now)
+            .select_for_update(skip_locked=True)
+            .order_by("received_at", "pk")[:batch_size]
+        )
+        if not events:
+            return 0, None
+
+        by_payment = defaultdict(list)
+        for event in events:
+            payment = event.payload.get("payment")
+            if not isinstance(payment, dict) or not payment.get("id"):
+                event.error = "Evento sem dados de pagamento."
+                continue
+            by_payment[payment["id"]].append(event)
+
+        # Travados em ordem de pk para que consumidores concorrentes não entrem
+        # em deadlock.
+        payments = {
+            payment.asaas_id: payment
+            for payment in Payment.objects.select_for_update()
+            .filter(asaas_id__in=by_payment)
+            .order_by("pk")
+        }
+        changed = []
+        retrying = set()
+        for asaas_id, payment_events in by_payment.items():
+            payment = payments.get(asaas_id)
+            if payment is None:
+                for event in payment_events:
+                    event.attempts += 1
+                    event.error = (
+                        f"Pagamento desconhecido após {event.attempts} tentativas."
+                    )
+                    if event.attempts < settings.PAYMENT_WEBHOOK_MAX_ATTEMPTS:
+                        event.next_attempt_at = now + retry_delay(event.attempts)
+                        retrying.add(event.pk)
+                continue
+            # Prevalece o evento mais recente; empates ficam com o último a chegar.
+            latest = max(reversed(payment_events), key=event_time)
+            occurred_at = event_time(latest)
+            if payment.status_changed_at and occurred_at < payment.status_changed_at:
+                continue
+            status = latest.payload["payment"].get("status")
+            if status:
+                payment.status = status
+                payment.status_changed_at = occurred_at
+                payment.updated_at = now
+                changed.append(payment)
+
+        Payment.objects.bulk_update(
+            changed, ["status", "status_changed_at", "updated_at"]
+        )
+        for event in events:
+            if event.pk not in retrying:
+                event.processed_at = now
+        WebhookEvent.objects.bulk_update(
+            events, ["processed_at", "error", "attempts", "next_attempt_at"]
+        )
+
+    return len(events), now - events[0].received_at
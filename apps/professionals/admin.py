@@ -1 +1,28 @@
-# Register your models here.
+from django.contrib import admin
+
+from backend.core.admin import EstimatedCountPaginator, VersionedAdminMixin
+from .models import Professional
+
+
+@admin.register(Professional)
+class ProfessionalAdmin(VersionedAdminMixin, admin.ModelAdmin):
+    """
+    Admin de profissionais preparado para tabelas grandes: total estimado na
+    listagem sem filtros e busca servida pelos índices trigram de
+    `social_name` e `profession` (migração 0004, PostgreSQL). Mostra também os
+    profissionais removidos logicamente.
+    """
+
+    list_display = ["social_name", "profession", "contact", "updated_at", "deleted_at"]
+    list_filter = [("deleted_at", admin.EmptyFieldListFilter)]
+    search_fields = ["social_name", "profession"]
+    # Ordenação e colunas ordenáveis restritas ao que tem índice.
+    ordering = ["-updated_at"]
+    sortable_by = ["updated_at"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # Inclui os removidos logicamente; sem o filtro do manager padrão a
+        # listagem sem filtros pode usar o total estimado.
+        return Professional.all_objects.all()
@@ -0,0 +1,192 @@
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from .models import Professional
+from .validators import (
+    clean_contact,
+    clean_profession,
+    clean_social_name,
+    normalize_contact,
+)
+
+IMPORT_FIELDS = ("social_name", "profession", "address", "contact")
+FORMATS = ("csv", "ndjson")
+
+
+def _clean_address(value):
+    if not value or not value.strip():
+        raise serializers.ValidationError("O endereço não pode estar vazio.")
+    return value.strip()
+
+
+CLEANERS = {
+    "social_name": clean_social_name,
+    "profession": clean_profession,
+    "address": _clean_address,
+    "contact": clean_contact,
+}
+
+
+def _text_lines(stream):
+    for line in stream:
+        yield line.decode("utf-8-sig") if isinstance(line, bytes) else line
+
+
+def read_rows(stream, fmt):
+    """
+    Lê a entrada linha a linha (sem carregá-la inteira em memória) e gera
+    tuplas `(linha, dados, erro)`.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(_text_lines(stream))
+        for row in reader:
+            yield reader.line_num, row, None
+    elif fmt == "ndjson":
+        for number, line in enumerate(_text_lines(stream), start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                yield number, None, "JSON inválido."
+                continue
+            if not isinstance(row, dict):
+                yield number, None, "Cada linha deve ser um objeto JSON."
+                continue
+            yield number, row, None
+    else:
+        raise ValueError(f"Formato não suportado: {fmt}")
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    duplicates: int = 0
+    errors: list = field(default_factory=list)
+
+    def as_dict(self):
+        return {
+            "created": self.created,
+            "duplicates": self.duplicates,
+            "errors": self.errors,
+        }
+
+
+class ProfessionalImporter:
+    """
+    Importação em massa de profissionais.
+
+    Valida cada linha com as mesmas regras do serializer (regex pré-compiladas),
+    descarta contatos duplicados (normalizados) em relação à base e ao próprio
+    arquivo e grava em lotes: `COPY` no PostgreSQL, `bulk_create` nos demais
+    bancos. Linhas inválidas são reportadas sem interromper a importação.
+    """
+
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+        self.max_lengths = {
+            name: Professional._meta.get_field(name).max_length
+            for name in IMPORT_FIELDS
+        }
+
+    def run(self, rows):
+        result = ImportResult()
+        seen = self._existing_contacts()
+        batch = []
+
+        for line, row, error in rows:
+            if error:
+                result.errors.append(
+                    {"line": line, "errors": {"non_field_errors": [error]}}
+                )
+                continue
+
+            values, errors = self._validate(row)
+            if errors:
+                result.errors.append({"line": line, "errors": errors})
+                continue
+
+            key = normalize_contact(values["contact"])
+            if key in seen:
+                result.duplicates += 1
+                result.errors.append(
+                    {"line": line, "errors": {"contact": ["Contato já cadastrado."]}}
+                )
+                continue
+            seen.add(key)
+
+            batch.append(values)
+            if len(batch) >= self.batch_size:
+                result.created += self._flush(batch)
+                batch = []
+
+        if batch:
+            result.created += self._flush(batch)
+        return result
+
+    def _existing_contacts(self):
+        return {
+            normalize_contact(contact)
+            for contact in Professional.objects.values_list(
+                "contact", flat=True
+            ).iterator(chunk_size=5000)
+        }
+
+    def _validate(self, row):
+        values, errors = {}, {}
+        for name in IMPORT_FIELDS:
+            raw = row.get(name)
+            try:
+                value = CLEANERS[name](raw if isinstance(raw, str) else "")
+            except serializers.ValidationError as exc:
+                errors[name] = [str(message) for message in exc.detail]
+                continue
+            max_length = self.max_lengths[name]
+            if max_length and len(value) > max_length:
+                errors[name] = [
+                    f"Certifique-se de que este campo não tenha mais de {max_length} caracteres."
+                ]
+                continue
+            values[name] = value
+        return values, errors
+
+    def _flush(self, batch):
+        now = timezone.now()
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                self._copy(batch, now)
+            else:
+                Professional.objects.bulk_create(
+                    [
+                        Professional(**values, created_at=now, updated_at=now)
+                        for values in batch
+                    ]
+                )
+        return len(batch)
+
+    def _copy(self, batch, now):
+        columns = (*IMPORT_FIELDS, "created_at", "updated_at")
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        timestamp = now.isoformat()
+        for values in batch:
+            writer.writerow(
+                [*(values[name] for name in IMPORT_FIELDS), timestamp, timestamp]
+            )
+        buffer.seek(0)
+
+        table = connection.ops.quote_name(Professional._meta.db_table)
+        sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+        with connection.cursor() as cursor:
+            raw = cursor.cursor
+            if hasattr(raw, "copy_expert"):  # psycopg2
+                raw.copy_expert(sql, buffer)
+            else:  # psycopg 3
+                with raw.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.professionals.importers import FORMATS, ProfessionalImporter, read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa profissionais em massa a partir de um arquivo CSV ou NDJSON "
+        "(cabeçalho/chaves: social_name, profession, address, contact)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Arquivo de entrada ou '-' para stdin.")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="Formato da entrada (padrão: deduzido pela extensão do arquivo).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Quantidade de profissionais gravados por lote.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or Path(path).suffix.lstrip(".").lower()
+        if fmt not in FORMATS:
+            raise CommandError("Informe --format csv ou --format ndjson.")
+
+        importer = ProfessionalImporter(batch_size=options["batch_size"])
+        if path == "-":
+            result = importer.run(read_rows(sys.stdin, fmt))
+        else:
+            try:
+                with open(path, encoding="utf-8-sig", newline="") as source:
+                    result = importer.run(read_rows(source, fmt))
+            except FileNotFoundError as exc:
+                raise CommandError(f"Arquivo não encontrado: {path}") from exc
+
+        for error in result.errors:
+            self.stderr.write(f"Linha {error['line']}: {error['errors']}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.created} profissionais importados, "
+                f"{result.duplicates} duplicados, {len(result.errors)} linhas com erro."
+            )
+        )
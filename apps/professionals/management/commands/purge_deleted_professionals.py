@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from apps.professionals.models import Professional
+from apps.professionals.purge import purge_professional
+
+
+class Command(BaseCommand):
+    help = (
+        "Remove definitivamente os profissionais excluídos pela API, apagando "
+        "suas consultas em lotes. Deve ser agendado periodicamente."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Quantidade de consultas apagadas por transação.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Quantidade máxima de profissionais processados nesta execução.",
+        )
+
+    def handle(self, *args, **options):
+        pending = Professional.all_objects.filter(deleted_at__isnull=False).order_by(
+            "deleted_at"
+        )
+        if options["limit"] is not None:
+            pending = pending[: options["limit"]]
+
+        purged = 0
+        for professional in pending:
+            removed = purge_professional(professional, options["chunk_size"])
+            purged += 1
+            self.stdout.write(
+                f"Profissional #{professional.pk} removido ({removed} consultas)."
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"{purged} profissionais removidos."))
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 18:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("professionals", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="professional",
+            index=models.Index(
+                fields=["updated_at"], name="professional_updated_at_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.2 on 2026-10-19 18:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("professionals", "0002_professional_professional_updated_at_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="professional",
+            name="deleted_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Removido em"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="professional",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)),
+                fields=["deleted_at"],
+                name="professional_deleted_idx",
+            ),
+        ),
+    ]
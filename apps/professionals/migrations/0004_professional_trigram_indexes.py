@@ -0,0 +1,52 @@
+"""
+Índices trigram (`pg_trgm`) para a busca do admin de profissionais no
+PostgreSQL. A busca do admin usa `icontains`, que o Django compila como
+`UPPER(coluna::text) LIKE UPPER('%termo%')`; os índices GIN são criados sobre a
+mesma expressão para atender esse LIKE sem varrer a tabela.
+
+Em outros bancos, ou se a extensão não estiver disponível no servidor, a
+migração não faz nada e a busca continua funcionando com varredura sequencial.
+"""
+
+from django.db import migrations
+
+TABLE = "professionals_professional"
+INDEXES = {
+    "professional_social_name_trgm_idx": "social_name",
+    "professional_profession_trgm_idx": "profession",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, column in INDEXES.items():
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS "{name}" ON "{TABLE}" '
+                f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+            )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        for name in INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("professionals", "0003_professional_soft_delete"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
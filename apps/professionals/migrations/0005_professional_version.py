@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-19 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("professionals", "0004_professional_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="professional",
+            name="version",
+            field=models.PositiveIntegerField(
+                db_default=1, default=1, editable=False, verbose_name="Versão"
+            ),
+        ),
+    ]
@@ -1,6 +1,13 @@
 from django.db import models
 
 
+class ActiveProfessionalManager(models.Manager):
+    """Manager padrão: ignora profissionais removidos logicamente."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
 class Professional(models.Model):
     social_name = models.CharField(max_length=255, verbose_name="Nome Social")
     profession = models.CharField(max_length=100, verbose_name="Profissão")
@@ -8,6 +15,14 @@ class Professional(models.Model):
     contact = models.CharField(max_length=100, verbose_name="Contato")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    deleted_at = models.DateTimeField(null=True, blank=True, verbose_name="Removido em")
+    # Incrementada a cada edição pela API (controle de concorrência otimista).
+    version = models.PositiveIntegerField(
+        default=1, db_default=1, editable=False, verbose_name="Versão"
+    )
+
+    objects = ActiveProfessionalManager()
+    all_objects = models.Manager()
 
     def __str__(self):
         return f"{self.social_name} ({self.profession})"
@@ -16,3 +31,11 @@ class Professional(models.Model):
         verbose_name = "Profissional"
         verbose_name_plural = "Profissionais"
         ordering = ["social_name"]
+        indexes = [
+            models.Index(fields=["updated_at"], name="professional_updated_at_idx"),
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="professional_deleted_idx",
+            ),
+        ]
@@ -0,0 +1,28 @@
+from django.db import transaction
+
+from apps.appointments.models import Appointment
+
+
+def purge_professional(professional, chunk_size=500):
+    """
+    Remove definitivamente um profissional removido logicamente.
+
+    As consultas são apagadas em lotes de `chunk_size`, cada um em sua própria
+    transação, para que memória e duração dos locks não cresçam com o volume de
+    consultas do profissional. Retorna a quantidade de consultas removidas.
+    """
+    removed = 0
+    while True:
+        ids = list(
+            Appointment.objects.filter(professional=professional).values_list(
+                "pk", flat=True
+            )[:chunk_size]
+        )
+        if not ids:
+            break
+        with transaction.atomic():
+            Appointment.objects.filter(pk__in=ids).delete()
+        removed += len(ids)
+
+    professional.delete()
+    return removed
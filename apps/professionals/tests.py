@@ -1,8 +1,21 @@
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models import F
+from django.test import TestCase
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth.models import User
+from apps.appointments.models import Appointment
 from .models import Professional
+from .views import ProfessionalViewSet
 
 
 class ProfessionalTests(APITestCase):
@@ -59,6 +72,63 @@ class ProfessionalTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["social_name"], "Dr. Gregory House")
 
+    def test_update_with_if_match(self):
+        """Teste de edição condicional com ETag/If-Match"""
+        professional = Professional.objects.create(**self.professional_data)
+        detail_url = reverse("professional-detail", args=[professional.id])
+
+        response = self.client.get(detail_url)
+        self.assertEqual(response["ETag"], '"1"')
+
+        response = self.client.patch(
+            detail_url, {"address": "Plainsboro"}, format="json", HTTP_IF_MATCH='"1"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["version"], 2)
+        self.assertEqual(response["ETag"], '"2"')
+
+        # ETag antiga: outra edição já aconteceu
+        response = self.client.patch(
+            detail_url, {"address": "Baker Street"}, format="json", HTTP_IF_MATCH='"1"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        professional.refresh_from_db()
+        self.assertEqual(professional.address, "Plainsboro")
+
+        # ETag fraca (resposta comprimida) também é aceita
+        response = self.client.patch(
+            detail_url,
+            {"address": "Baker Street"},
+            format="json",
+            HTTP_IF_MATCH='W/"2"',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_concurrent_update_is_rejected(self):
+        """Teste: edição concorrente entre a leitura e a escrita responde 412"""
+        professional = Professional.objects.create(**self.professional_data)
+        detail_url = reverse("professional-detail", args=[professional.id])
+        original = ProfessionalViewSet.get_expected_version
+
+        def concurrent_write(view, instance):
+            Professional.objects.filter(pk=instance.pk).update(
+                address="Outro endereço", version=F("version") + 1
+            )
+            return original(view, instance)
+
+        with mock.patch.object(
+            ProfessionalViewSet, "get_expected_version", concurrent_write
+        ):
+            response = self.client.put(
+                detail_url,
+                {**self.professional_data, "address": "Princeton"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        professional.refresh_from_db()
+        self.assertEqual(professional.address, "Outro endereço")
+        self.assertEqual(professional.version, 2)
+
     def test_delete_professional(self):
         """Teste de remoção de profissional"""
         professional = Professional.objects.create(**self.professional_data)
@@ -73,3 +143,147 @@ class ProfessionalTests(APITestCase):
         self.client.force_authenticate(user=None)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_delete_professional_is_deferred(self):
+        """Teste de remoção lógica: consultas são ocultadas e removidas depois em lotes"""
+        professional = Professional.objects.create(**self.professional_data)
+        future = timezone.now() + timedelta(days=1)
+        Appointment.objects.bulk_create(
+            [Appointment(professional=professional, date=future) for _ in range(5)]
+        )
+        detail_url = reverse("professional-detail", args=[professional.id])
+
+        with self.assertNumQueries(3):  # busca, UPDATE deleted_at e tombstone
+            response = self.client.delete(detail_url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(Appointment.objects.count(), 5)
+        self.assertEqual(self.client.get(reverse("appointment-list")).data, [])
+
+        out = StringIO()
+        call_command("purge_deleted_professionals", "--chunk-size", "2", stdout=out)
+        self.assertFalse(Professional.all_objects.filter(pk=professional.pk).exists())
+        self.assertEqual(Appointment.objects.count(), 0)
+        self.assertIn("5 consultas", out.getvalue())
+
+    def test_bulk_import_csv(self):
+        """Teste de importação em massa via CSV com erros por linha e duplicados"""
+        Professional.objects.create(**self.professional_data)
+        body = (
+            "social_name,profession,address,contact\n"
+            "Dra. Grey,Cirurgiã,Seattle Grace,grey@seattle.com\n"
+            "Dr. Shepherd,Neurocirurgião,Seattle Grace,(11) 91234-5678\n"
+            "X,Cirurgião,Seattle Grace,invalid\n"
+            "Dr. House Again,Diagnostician,Princeton,HOUSE@princeton.edu\n"
+            "Dr. Shepherd Jr,Neurocirurgião,Seattle Grace,11912345678\n"
+        )
+        response = self.client.post(
+            reverse("professional-bulk"), data=body, content_type="text/csv"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(response.data["duplicates"], 2)
+        self.assertEqual(
+            [error["line"] for error in response.data["errors"]], [4, 5, 6]
+        )
+        self.assertIn("social_name", response.data["errors"][0]["errors"])
+        self.assertIn("contact", response.data["errors"][0]["errors"])
+        self.assertEqual(Professional.objects.count(), 3)
+
+    def test_import_professionals_command_ndjson(self):
+        """Teste do comando import_professionals com NDJSON"""
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson", delete=False) as source:
+            source.write(json.dumps({**self.professional_data}) + "\n")
+            source.write("{not json}\n")
+        self.addCleanup(os.unlink, source.name)
+
+        out, err = StringIO(), StringIO()
+        call_command("import_professionals", source.name, stdout=out, stderr=err)
+
+        self.assertEqual(Professional.objects.get().social_name, "Dr. House")
+        self.assertIn("1 profissionais importados", out.getvalue())
+        self.assertIn("Linha 2", err.getvalue())
+
+    def test_list_professionals_by_ids(self):
+        """Teste de busca de vários profissionais por ID em uma única consulta"""
+        professionals = [
+            Professional.objects.create(
+                social_name=f"Dr. {name}",
+                profession="Clínico",
+                contact=f"{name.lower()}@clinic.com",
+            )
+            for name in ("Grey", "Shepherd", "Yang")
+        ]
+        ids = f"{professionals[0].id},{professionals[2].id},999999"
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"ids": ids})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {item["id"] for item in response.data},
+            {professionals[0].id, professionals[2].id},
+        )
+
+        response = self.client.get(self.url, {"ids": "1,abc"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("ids", response.data)
+
+
+class ProfessionalAdminTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="admin", password="password123"
+        )
+        self.client.force_login(self.admin)
+        Professional.objects.create(
+            social_name="Dr. House",
+            profession="Diagnostician",
+            contact="house@princeton.edu",
+            address="221B Baker Street",
+        )
+
+    def test_admin_search(self):
+        """Teste de busca por nome na listagem do admin"""
+        response = self.client.get(
+            reverse("admin:professionals_professional_changelist"), {"q": "hous"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, "Dr. House")
+
+    def test_admin_edit_increments_version(self):
+        """Teste: edição pelo admin invalida a ETag dos clientes da API"""
+        professional = Professional.objects.get()
+        response = self.client.post(
+            reverse("admin:professionals_professional_change", args=[professional.pk]),
+            {
+                "social_name": "Dr. Gregory House",
+                "profession": "Diagnostician",
+                "address": "221B Baker Street",
+                "contact": "house@princeton.edu",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        professional.refresh_from_db()
+        self.assertEqual(
+            (professional.social_name, professional.version), ("Dr. Gregory House", 2)
+        )
+
+    def test_admin_search_uses_trigram_index(self):
+        """Teste: a busca do admin é atendida pelo índice trigram (PostgreSQL)"""
+        if connection.vendor != "postgresql":
+            self.skipTest("Índice trigram existe apenas no PostgreSQL.")
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_indexes WHERE indexname = %s",
+                ["professional_social_name_trgm_idx"],
+            )
+            if cursor.fetchone() is None:
+                self.skipTest("Extensão pg_trgm indisponível no servidor.")
+
+        queryset = Professional.objects.filter(social_name__icontains="hous")
+        # Com poucas linhas o planejador prefere varredura sequencial.
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+        self.assertIn("professional_social_name_trgm_idx", plan)
@@ -0,0 +1,70 @@
+"""
+Regras de validação dos campos de profissional, compartilhadas pelo serializer
+e pela importação em massa. As expressões regulares são compiladas uma única
+vez, na importação do módulo.
+"""
+
+import re
+
+from rest_framework import serializers
+
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+PHONE_PATTERN = re.compile(r"^\(?\d{2}\)?\s?\d{4,5}-?\d{4}$")
+NON_DIGITS = re.compile(r"\D")
+
+
+def clean_social_name(value):
+    """Validate and sanitize social name."""
+    if not value or not value.strip():
+        raise serializers.ValidationError("O nome social não pode estar vazio.")
+
+    # Remove caracteres especiais perigosos (XSS prevention)
+    sanitized = value.strip()
+    if len(sanitized) < 3:
+        raise serializers.ValidationError(
+            "O nome social deve ter pelo menos 3 caracteres."
+        )
+    if len(sanitized) > 200:
+        raise serializers.ValidationError(
+            "O nome social não pode exceder 200 caracteres."
+        )
+
+    return sanitized
+
+
+def clean_profession(value):
+    """Validate profession field."""
+    if not value or not value.strip():
+        raise serializers.ValidationError("A profissão não pode estar vazia.")
+
+    sanitized = value.strip()
+    if len(sanitized) < 3:
+        raise serializers.ValidationError(
+            "A profissão deve ter pelo menos 3 caracteres."
+        )
+
+    return sanitized
+
+
+def clean_contact(value):
+    """Validate contact information."""
+    if not value or not value.strip():
+        raise serializers.ValidationError("O contato não pode estar vazio.")
+
+    sanitized = value.strip()
+
+    # Basic email or phone validation
+    if not (EMAIL_PATTERN.match(sanitized) or PHONE_PATTERN.match(sanitized)):
+        raise serializers.ValidationError(
+            "O contato deve ser um email válido ou telefone no formato (XX) XXXXX-XXXX."
+        )
+
+    return sanitized
+
+
+def normalize_contact(value):
+    """Chave de deduplicação: email em minúsculas ou apenas os dígitos do telefone."""
+    value = value.strip()
+    if "@" in value:
+        return value.lower()
+    return NON_DIGITS.sub("", value)
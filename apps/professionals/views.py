@@ -1,9 +1,26 @@
-from rest_framework import viewsets
+from django.utils import timezone
+from rest_framework import serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from apps.sync.signals import record_tombstone
+from apps.sync.views import ChangeFeedMixin
+from backend.core.batch import BatchObjectCacheMixin
+from backend.core.concurrency import OptimisticConcurrencyMixin
+from backend.core.filters import parse_id_list
+from backend.core.parsers import CSVStreamParser, NDJSONStreamParser
+from backend.core.renderers import MessagePackMixin
+from .importers import ProfessionalImporter, read_rows
 from .models import Professional
 from .serializers import ProfessionalSerializer
 
 
-class ProfessionalViewSet(viewsets.ModelViewSet):
+class ProfessionalViewSet(
+    MessagePackMixin,
+    OptimisticConcurrencyMixin,
+    BatchObjectCacheMixin,
+    ChangeFeedMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet para visualização e edição de profissionais de saúde.
     """
@@ -11,3 +28,49 @@ class ProfessionalViewSet(viewsets.ModelViewSet):
     queryset = Professional.objects.all()
     serializer_class = ProfessionalSerializer
     # permission_classes = [permissions.AllowAny] # Removido para seguir configuração global (IsAuthenticated)
+
+    def get_queryset(self):
+        """
+        Com `?ids=1,2,3`, retorna apenas os profissionais informados em uma única
+        consulta `IN` (substitui várias chamadas ao endpoint de detalhe).
+        """
+        queryset = super().get_queryset()
+        ids = parse_id_list(self.request.query_params, "ids")
+        if ids is not None:
+            queryset = queryset.filter(id__in=ids)
+        return queryset
+
+    def perform_destroy(self, instance):
+        """
+        Remoção lógica: responde imediatamente, sem carregar as consultas do
+        profissional. A remoção definitiva, em lotes, é feita pelo comando
+        `purge_deleted_professionals`.
+        """
+        instance.deleted_at = timezone.now()
+        instance.save(update_fields=["deleted_at", "updated_at"])
+        record_tombstone(instance)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        parser_classes=[CSVStreamParser, NDJSONStreamParser],
+    )
+    def bulk(self, request):
+        """
+        Importação em massa de profissionais a partir de um corpo `text/csv` ou
+        `application/x-ndjson`, processado em streaming. Linhas inválidas ou com
+        contato duplicado são reportadas em `errors` sem interromper o lote.
+        """
+        stream = request.data
+        if not hasattr(stream, "read"):
+            raise serializers.ValidationError(
+                {
+                    "non_field_errors": [
+                        "Envie o arquivo CSV ou NDJSON no corpo da requisição."
+                    ]
+                }
+            )
+
+        fmt = "csv" if request.content_type.startswith("text/csv") else "ndjson"
+        result = ProfessionalImporter().run(read_rows(stream, fmt))
+        return Response(result.as_dict())
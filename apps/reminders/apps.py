@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class RemindersConfig(AppConfig):
+    name = "apps.reminders"
+
+    def ready(self):
+        from . import signals  # noqa: F401
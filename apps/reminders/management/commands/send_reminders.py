@@ -0,0 +1,45 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.reminders.scheduler import send_due_reminders
+
+
+class Command(BaseCommand):
+    help = (
+        "Envia os lembretes de consulta vencidos. Pode rodar em várias instâncias "
+        "em paralelo: cada lote é reservado com FOR UPDATE SKIP LOCKED."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.REMINDER_BATCH_SIZE,
+            help="Quantidade de lembretes reservados por transação.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Continua rodando, verificando a fila a cada --interval segundos.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.REMINDER_POLL_SECONDS,
+            help="Espera entre verificações quando a fila está vazia (com --loop).",
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        while True:
+            processed = send_due_reminders(options["batch_size"])
+            total += processed
+            if processed:
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS(f"{total} lembretes processados."))
@@ -0,0 +1,91 @@
+# Generated by Django 6.0.2 on 2026-10-19 18:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("appointments", "0005_appointment_prof_date_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Reminder",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "lead_minutes",
+                    models.PositiveIntegerField(verbose_name="Antecedência (minutos)"),
+                ),
+                ("remind_at", models.DateTimeField(verbose_name="Enviar em")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pendente"),
+                            ("sent", "Enviado"),
+                            ("failed", "Falhou"),
+                            ("canceled", "Cancelado"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="Situação",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="Tentativas"
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, verbose_name="Último erro"),
+                ),
+                (
+                    "sent_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Enviado em"
+                    ),
+                ),
+                (
+                    "appointment",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reminders",
+                        to="appointments.appointment",
+                        verbose_name="Consulta",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Lembrete",
+                "verbose_name_plural": "Lembretes",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("status", "pending")),
+                        fields=["remind_at"],
+                        name="reminder_due_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("appointment", "lead_minutes"),
+                        name="reminder_unique_appointment_lead",
+                    )
+                ],
+            },
+        ),
+    ]
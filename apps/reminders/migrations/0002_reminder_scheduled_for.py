@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-19 19:33
+
+from django.db import migrations, models
+
+
+def copy_remind_at(apps, schema_editor):
+    # Melhor aproximação disponível: lembretes já reagendados por falha de
+    # envio ficam com o horário da nova tentativa.
+    Reminder = apps.get_model("reminders", "Reminder")
+    Reminder.objects.update(scheduled_for=models.F("remind_at"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reminders", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reminder",
+            name="scheduled_for",
+            field=models.DateTimeField(null=True, verbose_name="Agendado para"),
+        ),
+        migrations.RunPython(copy_remind_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="reminder",
+            name="scheduled_for",
+            field=models.DateTimeField(verbose_name="Agendado para"),
+        ),
+    ]
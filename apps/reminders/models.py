@@ -0,0 +1,62 @@
+from django.db import models
+
+from apps.appointments.models import Appointment
+
+
+class Reminder(models.Model):
+    """
+    Fila de lembretes de consulta, ordenada por `remind_at`.
+
+    Há um lembrete por consulta e antecedência (`REMINDER_LEAD_TIMES_MINUTES`).
+    O worker `send_reminders` consome apenas os pendentes vencidos, pelo índice
+    parcial `reminder_due_idx`, sem varrer a tabela de consultas.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pendente"
+        SENT = "sent", "Enviado"
+        FAILED = "failed", "Falhou"
+        CANCELED = "canceled", "Cancelado"
+
+    # Sem constraint no banco: a chave primária de consultas é (id, date) no PostgreSQL.
+    appointment = models.ForeignKey(
+        Appointment,
+        on_delete=models.CASCADE,
+        db_constraint=False,
+        related_name="reminders",
+        verbose_name="Consulta",
+    )
+    lead_minutes = models.PositiveIntegerField(verbose_name="Antecedência (minutos)")
+    # Horário calculado pela data da consulta; `remind_at` pode ser adiado pelas
+    # novas tentativas de envio, este não.
+    scheduled_for = models.DateTimeField(verbose_name="Agendado para")
+    remind_at = models.DateTimeField(verbose_name="Enviar em")
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name="Situação",
+    )
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="Tentativas")
+    last_error = models.TextField(blank=True, verbose_name="Último erro")
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name="Enviado em")
+
+    def __str__(self):
+        return f"Lembrete da consulta #{self.appointment_id} em {self.remind_at}"
+
+    class Meta:
+        verbose_name = "Lembrete"
+        verbose_name_plural = "Lembretes"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["appointment", "lead_minutes"],
+                name="reminder_unique_appointment_lead",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["remind_at"],
+                condition=models.Q(status="pending"),
+                name="reminder_due_idx",
+            ),
+        ]
@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.appointments.models import Appointment
+
+from .models import Reminder
+from .senders import get_sender
+
+
+def expected_reminders(appointment):
+    """Horário de cada lembrete da consulta, por antecedência em minutos."""
+    return {
+        lead: appointment.date - timedelta(minutes=lead)
+        for lead in settings.REMINDER_LEAD_TIMES_MINUTES
+    }
+
+
+def schedule_reminders(appointment):
+    """
+    Agenda (ou reagenda) os lembretes de uma consulta.
+
+    Quando os lembretes existentes já correspondem à data da consulta nada é
+    alterado, de modo que salvar a consulta sem mudar `date` não reenvia
+    lembretes nem desfaz uma nova tentativa de envio pendente (a comparação usa
+    `scheduled_for`, não `remind_at`). Antecedências que já passaram não geram
+    lembrete.
+    """
+    expected = expected_reminders(appointment)
+    current = dict(
+        Reminder.objects.filter(appointment_id=appointment.pk).values_list(
+            "lead_minutes", "scheduled_for"
+        )
+    )
+    changed = {lead: at for lead, at in expected.items() if current.get(lead) != at}
+    if not changed:
+        return
+
+    now = timezone.now()
+    upcoming = {lead: at for lead, at in changed.items() if at > now}
+    stale = [lead for lead in changed if lead in current and lead not in upcoming]
+    with transaction.atomic():
+        if stale:
+            # Na nova data esta antecedência já passou: o lembrete pendente é descartado.
+            Reminder.objects.filter(
+                appointment_id=appointment.pk,
+                lead_minutes__in=stale,
+                status=Reminder.Status.PENDING,
+            ).delete()
+        if upcoming:
+            Reminder.objects.bulk_create(
+                [
+                    Reminder(
+                        appointment_id=appointment.pk,
+                        lead_minutes=lead,
+                        scheduled_for=at,
+                        remind_at=at,
+                    )
+                    for lead, at in upcoming.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["appointment", "lead_minutes"],
+                update_fields=[
+                    "scheduled_for",
+                    "remind_at",
+                    "status",
+                    "attempts",
+                    "last_error",
+                    "sent_at",
+                ],
+            )
+
+
+def send_due_reminders(batch_size, now=None):
+    """
+    Envia um lote de lembretes vencidos e retorna quantos foram processados.
+
+    Os lembretes são reservados com `SELECT ... FOR UPDATE SKIP LOCKED`, então
+    vários workers podem rodar em paralelo sem enviar o mesmo lembrete duas
+    vezes. Falhas são reagendadas com espera crescente até
+    `REMINDER_MAX_ATTEMPTS`.
+    """
+    now = now or timezone.now()
+    sender = get_sender()
+    with transaction.atomic():
+        reminders = list(
+            Reminder.objects.select_for_update(skip_locked=True)
+            .filter(status=Reminder.Status.PENDING, remind_at__lte=now)
+            .order_by("remind_at")[:batch_size]
+        )
+        if not reminders:
+            return 0
+
+        appointments = Appointment.objects.select_related("professional").in_bulk(
+            {reminder.appointment_id for reminder in reminders}
+        )
+        for reminder in reminders:
+            appointment = appointments.get(reminder.appointment_id)
+            if appointment is None or appointment.professional.deleted_at:
+                # Consulta arquivada ou profissional removido.
+                reminder.status = Reminder.Status.CANCELED
+                continue
+            try:
+                sender.send(reminder, appointment)
+            except Exception as exc:
+                reminder.attempts += 1
+                reminder.last_error = str(exc)
+                if reminder.attempts >= settings.REMINDER_MAX_ATTEMPTS:
+                    reminder.status = Reminder.Status.FAILED
+                else:
+                    reminder.remind_at = now + timedelta(minutes=reminder.attempts)
+            else:
+                reminder.status = Reminder.Status.SENT
+                reminder.sent_at = now
+
+        Reminder.objects.bulk_update(
+            reminders, ["status", "attempts", "last_error", "remind_at", "sent_at"]
+        )
+    return len(reminders)
@@ -0,0 +1,39 @@
+import logging
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger("django")
+
+
+class BaseSender:
+    """
+    Canal de envio de lembretes (e-mail, SMS, push...). Implementações recebem o
+    lembrete e a consulta, já carregada com o profissional, e devem levantar
+    exceção em caso de falha para que o envio seja tentado novamente.
+    """
+
+    def send(self, reminder, appointment):
+        raise NotImplementedError
+
+
+class LoggingSender(BaseSender):
+    """Sender local: apenas registra o lembrete no log."""
+
+    def send(self, reminder, appointment):
+        log_data = {
+            "reminder": reminder.pk,
+            "appointment": appointment.pk,
+            "patient": appointment.patient_id,
+            "professional": appointment.professional.social_name,
+            "date": appointment.date.isoformat(),
+            "lead_minutes": reminder.lead_minutes,
+        }
+        logger.info(f"Reminder: {log_data}")
+
+
+@lru_cache
+def get_sender():
+    """Instância do sender configurado em `REMINDER_SENDER`."""
+    return import_string(settings.REMINDER_SENDER)()
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.appointments.models import Appointment
+
+from .scheduler import schedule_reminders
+
+
+@receiver(post_save, sender=Appointment, dispatch_uid="reminders_schedule")
+def reschedule_reminders(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and "date" not in update_fields:
+        return
+    schedule_reminders(instance)
@@ -0,0 +1,176 @@
+import threading
+from datetime import timedelta
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from apps.appointments.models import Appointment
+from apps.professionals.models import Professional
+from .models import Reminder
+from .scheduler import send_due_reminders
+from .senders import BaseSender, get_sender
+
+
+class FailingSender(BaseSender):
+    def send(self, reminder, appointment):
+        raise ConnectionError("gateway indisponível")
+
+
+def create_professional():
+    return Professional.objects.create(
+        social_name="Dr. Strange",
+        profession="Sorcerer Supreme",
+        contact="strange@sanctum.com",
+        address="177A Bleecker Street",
+    )
+
+
+@override_settings(REMINDER_LEAD_TIMES_MINUTES=[1440, 60])
+class ReminderSchedulingTests(TestCase):
+    def setUp(self):
+        self.professional = create_professional()
+        self.date = timezone.now() + timedelta(days=3)
+        self.appointment = Appointment.objects.create(
+            professional=self.professional, date=self.date
+        )
+
+    def reminders(self):
+        return dict(
+            Reminder.objects.filter(appointment=self.appointment).values_list(
+                "lead_minutes", "remind_at"
+            )
+        )
+
+    def test_reminders_created_with_appointment(self):
+        """Teste de criação dos lembretes junto com a consulta"""
+        self.assertEqual(
+            self.reminders(),
+            {
+                1440: self.date - timedelta(days=1),
+                60: self.date - timedelta(hours=1),
+            },
+        )
+
+    def test_save_without_date_change_keeps_reminders(self):
+        """Teste: salvar a consulta sem mudar a data não reenvia lembretes"""
+        Reminder.objects.filter(lead_minutes=1440).update(status=Reminder.Status.SENT)
+        with self.assertNumQueries(2):  # UPDATE da consulta + leitura dos lembretes
+            self.appointment.save()
+        self.assertEqual(
+            Reminder.objects.get(lead_minutes=1440).status, Reminder.Status.SENT
+        )
+
+    def test_date_change_reschedules_reminders(self):
+        """Teste de reagendamento dos lembretes quando a data da consulta muda"""
+        Reminder.objects.update(status=Reminder.Status.SENT)
+
+        new_date = timezone.now() + timedelta(hours=5)
+        self.appointment.date = new_date
+        self.appointment.save()
+
+        # A antecedência de 24h já passou na nova data; a de 1h volta para a fila.
+        reminder = Reminder.objects.get(appointment=self.appointment, lead_minutes=60)
+        self.assertEqual(reminder.remind_at, new_date - timedelta(hours=1))
+        self.assertEqual(reminder.status, Reminder.Status.PENDING)
+
+
+@override_settings(REMINDER_LEAD_TIMES_MINUTES=[60], REMINDER_MAX_ATTEMPTS=2)
+class ReminderWorkerTests(TestCase):
+    def setUp(self):
+        get_sender.cache_clear()
+        self.addCleanup(get_sender.cache_clear)
+        self.professional = create_professional()
+        self.appointment = Appointment.objects.create(
+            professional=self.professional, date=timezone.now() + timedelta(hours=3)
+        )
+        self.later = timezone.now() + timedelta(hours=2, minutes=30)
+
+    def test_send_reminders_command(self):
+        """Teste do comando send_reminders com o sender de log"""
+        out = StringIO()
+        call_command("send_reminders", stdout=out)
+        self.assertIn("0 lembretes processados", out.getvalue())
+
+        Reminder.objects.update(remind_at=timezone.now() - timedelta(minutes=1))
+        with self.assertLogs("django", level="INFO") as logs:
+            call_command("send_reminders", stdout=out)
+
+        reminder = Reminder.objects.get()
+        self.assertEqual(reminder.status, Reminder.Status.SENT)
+        self.assertIsNotNone(reminder.sent_at)
+        self.assertTrue(any("Reminder:" in line for line in logs.output))
+        self.assertIn("1 lembretes processados", out.getvalue())
+
+    @override_settings(REMINDER_SENDER="apps.reminders.tests.FailingSender")
+    def test_failed_send_is_retried_then_marked_failed(self):
+        """Teste de nova tentativa e falha definitiva no envio"""
+        self.assertEqual(send_due_reminders(10, now=self.later), 1)
+        reminder = Reminder.objects.get()
+        self.assertEqual(reminder.status, Reminder.Status.PENDING)
+        self.assertEqual(reminder.attempts, 1)
+        self.assertGreater(reminder.remind_at, self.later)
+
+        send_due_reminders(10, now=self.later + timedelta(minutes=5))
+        reminder.refresh_from_db()
+        self.assertEqual(reminder.status, Reminder.Status.FAILED)
+        self.assertIn("gateway indisponível", reminder.last_error)
+
+    @override_settings(REMINDER_SENDER="apps.reminders.tests.FailingSender")
+    def test_retrying_reminder_survives_unrelated_save(self):
+        """Teste: salvar a consulta sem mudar a data mantém a nova tentativa"""
+        send_due_reminders(10, now=self.later)
+        retry_at = Reminder.objects.get().remind_at
+
+        self.appointment.save()
+
+        reminder = Reminder.objects.get()
+        self.assertEqual(reminder.status, Reminder.Status.PENDING)
+        self.assertEqual(reminder.attempts, 1)
+        self.assertEqual(reminder.remind_at, retry_at)
+
+    def test_reminder_of_removed_appointment_is_canceled(self):
+        """Teste: lembretes de consultas que não existem mais são cancelados"""
+        self.professional.deleted_at = timezone.now()
+        self.professional.save()
+
+        send_due_reminders(10, now=self.later)
+        self.assertEqual(Reminder.objects.get().status, Reminder.Status.CANCELED)
+
+
+@skipUnless(connection.vendor == "postgresql", "SKIP LOCKED exige PostgreSQL")
+@override_settings(REMINDER_LEAD_TIMES_MINUTES=[60])
+class ReminderConcurrencyTests(TransactionTestCase):
+    def test_workers_skip_reminders_locked_by_other_worker(self):
+        """Teste: um worker não envia lembretes reservados por outro"""
+        professional = create_professional()
+        Appointment.objects.create(
+            professional=professional, date=timezone.now() + timedelta(hours=2)
+        )
+        Appointment.objects.create(
+            professional=professional, date=timezone.now() + timedelta(hours=3)
+        )
+        later = timezone.now() + timedelta(hours=4)
+        results = []
+
+        def other_worker():
+            try:
+                results.append(send_due_reminders(10, now=later))
+            finally:
+                connection.close()
+
+        with transaction.atomic():
+            locked = Reminder.objects.select_for_update().order_by("remind_at").first()
+            thread = threading.Thread(target=other_worker)
+            thread.start()
+            thread.join(timeout=10)
+
+        self.assertEqual(results, [1])
+        locked.refresh_from_db()
+        self.assertEqual(locked.status, Reminder.Status.PENDING)
+        self.assertEqual(
+            Reminder.objects.filter(status=Reminder.Status.SENT).count(), 1
+        )
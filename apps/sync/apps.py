@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class SyncConfig(AppConfig):
+    name = "apps.sync"
+
+    def ready(self):
+        from apps.appointments.models import Appointment
+        from apps.professionals.models import Professional
+
+        from .signals import track_deletions
+
+        track_deletions(Professional, Appointment)
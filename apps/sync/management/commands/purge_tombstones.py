@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.sync.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = (
+        "Apaga, em lotes, os tombstones mais antigos que SYNC_MAX_AGE_DAYS. "
+        "Clientes com um ponto de sincronização anterior refazem a sincronização "
+        "inicial. Deve ser agendado periodicamente."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Quantidade de tombstones apagados por query.",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - settings.SYNC_MAX_AGE
+        expired = Tombstone.objects.filter(deleted_at__lt=cutoff)
+        purged = 0
+        while True:
+            ids = list(expired.values_list("pk", flat=True)[: options["batch_size"]])
+            if not ids:
+                break
+            purged += Tombstone.objects.filter(pk__in=ids).delete()[0]
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{purged} tombstones anteriores a {cutoff} apagados.")
+        )
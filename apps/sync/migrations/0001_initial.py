@@ -0,0 +1,51 @@
+# Generated by Django 6.0.2 on 2026-10-19 18:36
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model", models.CharField(max_length=100, verbose_name="Modelo")),
+                ("object_id", models.BigIntegerField(verbose_name="ID do Objeto")),
+                (
+                    "deleted_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="Removido em"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Registro de Remoção",
+                "verbose_name_plural": "Registros de Remoção",
+                "indexes": [
+                    models.Index(
+                        fields=["model", "deleted_at"],
+                        name="sync_tombstone_model_del_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("model", "object_id"),
+                        name="sync_tombstone_unique_object",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-19 19:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sync", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tombstone",
+            name="patient_id",
+            field=models.BigIntegerField(
+                blank=True, null=True, verbose_name="Paciente"
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Tombstone(models.Model):
+    """
+    Registro de remoção de um objeto, usado pelo feed de alterações
+    para propagar deletes aos clientes que sincronizam incrementalmente.
+    """
+
+    model = models.CharField(max_length=100, verbose_name="Modelo")
+    object_id = models.BigIntegerField(verbose_name="ID do Objeto")
+    deleted_at = models.DateTimeField(default=timezone.now, verbose_name="Removido em")
+    # Dono do objeto removido (consultas), para que cada paciente receba só as
+    # próprias remoções no feed de alterações.
+    patient_id = models.BigIntegerField(null=True, blank=True, verbose_name="Paciente")
+
+    def __str__(self):
+        return f"{self.model}#{self.object_id} removido em {self.deleted_at}"
+
+    class Meta:
+        verbose_name = "Registro de Remoção"
+        verbose_name_plural = "Registros de Remoção"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["model", "object_id"], name="sync_tombstone_unique_object"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["model", "deleted_at"], name="sync_tombstone_model_del_idx"
+            ),
+        ]
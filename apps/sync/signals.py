@@ -0,0 +1,35 @@
+from django.db.models.signals import post_delete
+from django.utils import timezone
+
+from .models import Tombstone
+
+
+def record_tombstone(instance):
+    """Registra (ou atualiza) o tombstone de um objeto removido, em uma única query."""
+    Tombstone.objects.bulk_create(
+        [
+            Tombstone(
+                model=instance._meta.label_lower,
+                object_id=instance.pk,
+                deleted_at=timezone.now(),
+                patient_id=getattr(instance, "patient_id", None),
+            )
+        ],
+        update_conflicts=True,
+        unique_fields=["model", "object_id"],
+        update_fields=["deleted_at", "patient_id"],
+    )
+
+
+def _on_delete(sender, instance, **kwargs):
+    record_tombstone(instance)
+
+
+def track_deletions(*models):
+    """Conecta o registro de tombstones ao `post_delete` dos modelos informados."""
+    for model in models:
+        post_delete.connect(
+            _on_delete,
+            sender=model,
+            dispatch_uid=f"sync_tombstone_{model._meta.label_lower}",
+        )
@@ -0,0 +1,153 @@
+from datetime import timedelta
+
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.appointments.models import Appointment
+from apps.professionals.models import Professional
+from .models import Tombstone
+
+
+class ChangeFeedTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="partner", password="password123")
+        self.client.force_authenticate(user=self.user)
+
+        self.professional = Professional.objects.create(
+            social_name="Dr. House",
+            profession="Diagnostician",
+            contact="house@princeton.edu",
+            address="221B Baker Street",
+        )
+        self.url = reverse("professional-changes")
+
+    def _age(self, queryset, **delta):
+        """Envelhece `updated_at` para simular alterações antigas."""
+        queryset.update(updated_at=timezone.now() - timedelta(**delta))
+
+    def test_initial_sync_returns_everything(self):
+        """Teste de sincronização inicial: sem token retorna todos os objetos"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["deleted"], [])
+        self.assertIsNone(response.data["next"])
+        self.assertTrue(response.data["sync_token"])
+
+    @override_settings(SYNC_PAGE_SIZE=2)
+    def test_initial_sync_is_paged(self):
+        """Teste de paginação da sincronização inicial por cursor"""
+        for index in range(4):
+            Professional.objects.create(
+                social_name=f"Dra. Página {index}",
+                profession="Clínica Geral",
+                contact=f"pagina{index}@example.com",
+            )
+        ids = []
+        params = {}
+        while True:
+            response = self.client.get(self.url, params)
+            ids += [item["id"] for item in response.data["results"]]
+            if response.data["next"] is None:
+                break
+            self.assertIsNone(response.data["sync_token"])
+            params = {"cursor": response.data["next"]}
+
+        self.assertEqual(ids, sorted(Professional.objects.values_list("id", flat=True)))
+        self.assertEqual(len(ids), 5)
+        response = self.client.get(self.url, {"since": response.data["sync_token"]})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_expired_sync_point_requires_full_resync(self):
+        """Teste: ponto de sincronização além de SYNC_MAX_AGE_DAYS recebe 410"""
+        since = (timezone.now() - timedelta(days=31)).isoformat()
+        response = self.client.get(self.url, {"updated_since": since})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+    def test_purge_tombstones_command(self):
+        """Teste do comando purge_tombstones"""
+        now = timezone.now()
+        for object_id, days in ((1, 31), (2, 29)):
+            Tombstone.objects.create(
+                model="professionals.professional",
+                object_id=object_id,
+                deleted_at=now - timedelta(days=days),
+            )
+        out = StringIO()
+        call_command("purge_tombstones", "--batch-size", "1", stdout=out)
+        self.assertEqual(
+            list(Tombstone.objects.values_list("object_id", flat=True)), [2]
+        )
+        self.assertIn("1 tombstones", out.getvalue())
+
+    def test_incremental_sync_returns_only_changes(self):
+        """Teste de sincronização incremental: apenas objetos alterados após o token"""
+        self._age(Professional.objects.all(), hours=1)
+        token = self.client.get(self.url).data["sync_token"]
+
+        changed = Professional.objects.create(
+            social_name="Dr. Who", profession="Time Lord", contact="tardis@bbc.com"
+        )
+
+        response = self.client.get(self.url, {"since": token})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([p["id"] for p in response.data["results"]], [changed.id])
+
+    def test_deletes_are_propagated_as_tombstones(self):
+        """Teste de propagação de remoções através de tombstones"""
+        appointment = Appointment.objects.create(
+            professional=self.professional,
+            date=timezone.now() + timedelta(days=1),
+            patient=self.user,
+        )
+        self._age(Appointment.objects.all(), hours=1)
+        since = (timezone.now() - timedelta(minutes=1)).isoformat()
+
+        appointment_id = appointment.id
+        appointment.delete()
+
+        response = self.client.get(
+            reverse("appointment-changes"), {"updated_since": since}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [])
+        self.assertEqual(response.data["deleted"], [appointment_id])
+        self.assertTrue(
+            Tombstone.objects.filter(
+                model="appointments.appointment", object_id=appointment_id
+            ).exists()
+        )
+
+    def test_patients_only_receive_their_own_deletes(self):
+        """Teste: pacientes recebem apenas as remoções das próprias consultas"""
+        other = User.objects.create_user(username="other", password="password123")
+        mine, theirs = (
+            Appointment.objects.create(
+                professional=self.professional,
+                date=timezone.now() + timedelta(days=1),
+                patient=patient,
+            )
+            for patient in (self.user, other)
+        )
+        since = (timezone.now() - timedelta(minutes=1)).isoformat()
+        mine_id = mine.id
+        mine.delete()
+        theirs.delete()
+
+        response = self.client.get(
+            reverse("appointment-changes"), {"updated_since": since}
+        )
+        self.assertEqual(response.data["deleted"], [mine_id])
+
+    def test_invalid_token(self):
+        """Teste de validação: token de sincronização adulterado"""
+        response = self.client.get(self.url, {"since": "invalid-token"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("since", response.data)
@@ -0,0 +1,41 @@
+from django.core import signing
+from django.utils.dateparse import parse_datetime
+
+_SALT = "apps.sync.token"
+_CURSOR_SALT = "apps.sync.cursor"
+
+
+def make_sync_token(moment):
+    """Gera um token opaco (assinado) que marca o ponto de sincronização."""
+    return signing.dumps(moment.isoformat(), salt=_SALT)
+
+
+def read_sync_token(token):
+    """
+    Retorna o instante codificado no token ou `None` se ele for inválido.
+    """
+    try:
+        value = signing.loads(token, salt=_SALT)
+    except signing.BadSignature:
+        return None
+    return parse_datetime(value) if isinstance(value, str) else None
+
+
+def make_page_cursor(started_at, last_pk):
+    """
+    Cursor da próxima página da sincronização inicial: o último ID enviado e o
+    início da sincronização, de onde sai o `sync_token` da última página.
+    """
+    return signing.dumps([started_at.isoformat(), last_pk], salt=_CURSOR_SALT)
+
+
+def read_page_cursor(cursor):
+    """Retorna `(início, último ID)` ou `None` se o cursor for inválido."""
+    try:
+        started_at, last_pk = signing.loads(cursor, salt=_CURSOR_SALT)
+    except (signing.BadSignature, TypeError, ValueError):
+        return None
+    started_at = parse_datetime(started_at) if isinstance(started_at, str) else None
+    if started_at is None or not isinstance(last_pk, int):
+        return None
+    return started_at, last_pk
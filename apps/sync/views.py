@@ -0,0 +1,125 @@
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+from .models import Tombstone
+from .tokens import (
+    make_page_cursor,
+    make_sync_token,
+    read_page_cursor,
+    read_sync_token,
+)
+
+
+class SyncExpired(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = (
+        "Sincronização expirada: as remoções anteriores já foram descartadas. "
+        "Refaça a sincronização inicial."
+    )
+    default_code = "sync_expired"
+
+
+class ChangeFeedMixin:
+    """
+    Adiciona o endpoint `changes/` a um ModelViewSet.
+
+    Sem parâmetros, inicia a sincronização completa, em páginas de
+    `SYNC_PAGE_SIZE` objetos por ordem de ID: cada resposta traz o cursor da
+    próxima (`next`, enviado como `?cursor=`) e a última traz o `sync_token`.
+    Com `?since=<sync_token>` ou `?updated_since=<datetime ISO>`, retorna apenas
+    os objetos alterados desde então (via índice em `updated_at`) e os IDs
+    removidos no período, junto com o `sync_token` para o próximo poll.
+    Os IDs removidos passam por `filter_tombstones`, assim como os objetos
+    passam por `get_queryset`.
+
+    Tombstones são mantidos por `SYNC_MAX_AGE` (`purge_tombstones`): um ponto
+    de sincronização mais antigo recebe 410 e o cliente recomeça do zero.
+    """
+
+    def filter_tombstones(self, tombstones):
+        return tombstones
+
+    def _changes_since(self, request):
+        token = request.query_params.get("since")
+        if token:
+            since = read_sync_token(token)
+            if since is None:
+                raise serializers.ValidationError(
+                    {"since": "Token de sincronização inválido."}
+                )
+        else:
+            updated_since = request.query_params.get("updated_since")
+            if not updated_since:
+                return None
+            since = parse_datetime(updated_since)
+            if since is None:
+                raise serializers.ValidationError(
+                    {"updated_since": "Informe uma data/hora no formato ISO 8601."}
+                )
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+
+        if since < timezone.now() - settings.SYNC_MAX_AGE:
+            raise SyncExpired()
+        return since
+
+    def _initial_page(self, request, queryset):
+        cursor = request.query_params.get("cursor")
+        if cursor:
+            position = read_page_cursor(cursor)
+            if position is None:
+                raise serializers.ValidationError({"cursor": "Cursor inválido."})
+            started_at, last_pk = position
+            queryset = queryset.filter(pk__gt=last_pk)
+        else:
+            started_at = timezone.now() - settings.SYNC_SAFETY_MARGIN
+
+        page_size = settings.SYNC_PAGE_SIZE
+        objects = list(queryset.order_by("pk")[: page_size + 1])
+        if len(objects) > page_size:
+            objects = objects[:page_size]
+            return objects, make_page_cursor(started_at, objects[-1].pk), None
+        return objects, None, make_sync_token(started_at)
+
+    @action(detail=False, methods=["get"])
+    def changes(self, request):
+        since = self._changes_since(request)
+        queryset = self.filter_queryset(self.get_queryset())
+
+        if since is None:
+            objects, next_cursor, sync_token = self._initial_page(request, queryset)
+            return Response(
+                {
+                    "results": self.get_serializer(objects, many=True).data,
+                    "deleted": [],
+                    "next": next_cursor,
+                    "sync_token": sync_token,
+                }
+            )
+
+        # O token marca o início da leitura, recuado por uma margem de segurança
+        # para não perder escritas de transações que ainda não haviam sido commitadas.
+        next_sync = timezone.now() - settings.SYNC_SAFETY_MARGIN
+        queryset = queryset.filter(updated_at__gte=since)
+        deleted = self.filter_tombstones(
+            Tombstone.objects.filter(
+                model=queryset.model._meta.label_lower, deleted_at__gte=since
+            )
+        ).values_list("object_id", flat=True)
+
+        serializer = self.get_serializer(
+            queryset.order_by("updated_at", "pk"), many=True
+        )
+        return Response(
+            {
+                "results": serializer.data,
+                "deleted": list(deleted),
+                "next": None,
+                "sync_token": make_sync_token(next_sync),
+            }
+        )
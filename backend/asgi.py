@@ -3,6 +3,11 @@ ASGI config for backend project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Long-lived connections, such as the appointment event stream
+(``/api/appointments/events/<professional_id>/``), must be served through this
+entry point (e.g. ``uvicorn backend.asgi:application``); the WSGI workers keep
+serving the regular API.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 """
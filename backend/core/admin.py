@@ -0,0 +1,61 @@
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import F
+from django.utils.functional import cached_property
+
+
+def estimated_count(connection, table):
+    """
+    Número aproximado de linhas de `table` segundo as estatísticas do
+    PostgreSQL (`pg_class.reltuples`, atualizado por ANALYZE/autovacuum).
+    Em tabelas particionadas soma as partições: o autovacuum não analisa a
+    tabela pai, então as estatísticas dela podem estar ausentes ou velhas.
+    Retorna None fora do PostgreSQL.
+    """
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COALESCE(SUM(GREATEST(reltuples, 0)), 0)::bigint FROM pg_class "
+            "WHERE relkind <> 'p' AND (oid = to_regclass(%s) OR oid IN "
+            "(SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass(%s)))",
+            [table, table],
+        )
+        return cursor.fetchone()[0]
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginador do admin que evita `COUNT(*)` na listagem sem filtros: usa a
+    estimativa das estatísticas quando ela passa de
+    `ADMIN_ESTIMATED_COUNT_THRESHOLD`. Com filtro, busca ou tabela pequena a
+    contagem continua exata.
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, "query", None)
+        if query is not None and not query.where:
+            estimate = estimated_count(
+                connections[self.object_list.db], query.model._meta.db_table
+            )
+            if estimate is not None and estimate >= (
+                settings.ADMIN_ESTIMATED_COUNT_THRESHOLD
+            ):
+                return estimate
+        return super().count
+
+
+class VersionedAdminMixin:
+    """
+    Incrementa `version` nas edições pelo admin, invalidando as ETags que os
+    clientes da API guardaram (ver `backend.core.concurrency`).
+    """
+
+    def save_model(self, request, obj, form, change):
+        if change:
+            obj.version = F("version") + 1
+        super().save_model(request, obj, form, change)
+        if change:
+            obj.refresh_from_db(fields=["version"])
@@ -0,0 +1,154 @@
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class BatchObjectCacheMixin:
+    """
+    Permite que o `BatchView` resolva de uma só vez (um único `IN`) os objetos
+    de várias sub-requisições de detalhe do mesmo ViewSet. Fora de um batch o
+    comportamento de `get_object` não muda.
+    """
+
+    def get_object(self):
+        cache = getattr(self.request, "batch_objects", None)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        key = (type(self), str(self.kwargs.get(lookup_url_kwarg)))
+        if cache is None or key not in cache:
+            return super().get_object()
+
+        obj = cache[key]
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+
+class BatchRequestSerializer(serializers.Serializer):
+    requests = serializers.ListField(
+        child=serializers.CharField(max_length=2000), allow_empty=False
+    )
+
+    def validate_requests(self, value):
+        if len(value) > settings.BATCH_MAX_REQUESTS:
+            raise serializers.ValidationError(
+                f"Envie no máximo {settings.BATCH_MAX_REQUESTS} requisições por batch."
+            )
+        return value
+
+
+class BatchView(APIView):
+    """
+    Executa várias requisições de leitura (GET) em uma única chamada HTTP.
+
+    Corpo: `{"requests": ["/api/professionals/1/", "/api/appointments/?professional_id=1"]}`.
+    As sub-requisições compartilham a autenticação da requisição externa, não
+    passam novamente pelos middlewares, caminhos repetidos são executados uma
+    só vez e os objetos das rotas de detalhe são carregados em lote. As
+    respostas voltam na mesma ordem, cada uma com `path`, `status` e `body`.
+    """
+
+    def post(self, request):
+        serializer = BatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        paths = serializer.validated_data["requests"]
+
+        cache = {}
+        resolved = {path: self._resolve(path) for path in dict.fromkeys(paths)}
+        self._prefetch_objects(request, resolved.items(), cache)
+
+        results = {}
+        for path, match in resolved.items():
+            if match is None:
+                results[path] = (400, {"detail": "Rota não permitida em batch."})
+            else:
+                results[path] = self._dispatch(request, path, match, cache)
+
+        return Response(
+            {
+                "responses": [
+                    {"path": path, "status": results[path][0], "body": results[path][1]}
+                    for path in paths
+                ]
+            }
+        )
+
+    def _resolve(self, path):
+        """Aceita apenas rotas da API servidas por views do DRF (exceto o próprio batch)."""
+        url = urlsplit(path)
+        if url.scheme or url.netloc or not url.path.startswith("/api/"):
+            return None
+        try:
+            match = resolve(url.path)
+        except Resolver404:
+            return None
+        view_class = getattr(match.func, "cls", None)
+        if view_class is None or not issubclass(view_class, APIView):
+            return None
+        if issubclass(view_class, BatchView):
+            return None
+        return match
+
+    def _prefetch_objects(self, request, matches, cache):
+        """Carrega com um `IN` por ViewSet os objetos das rotas de detalhe sem query string."""
+        lookups = {}
+        for path, match in matches:
+            if match is None or urlsplit(path).query:
+                continue
+            view_class = match.func.cls
+            actions = getattr(match.func, "actions", None) or {}
+            if actions.get("get") != "retrieve" or not issubclass(
+                view_class, BatchObjectCacheMixin
+            ):
+                continue
+            lookup_url_kwarg = view_class.lookup_url_kwarg or view_class.lookup_field
+            _, _, values = lookups.setdefault(view_class, (path, match, set()))
+            values.add(str(match.kwargs[lookup_url_kwarg]))
+
+        for view_class, (path, match, values) in lookups.items():
+            view = view_class(
+                args=(),
+                kwargs={},
+                action_map=match.func.actions,
+                format_kwarg=None,
+            )
+            view.request = view.initialize_request(
+                self._build_request(request, urlsplit(path), match, cache)
+            )
+            try:
+                objects = view.get_queryset().in_bulk(
+                    values, field_name=view.lookup_field
+                )
+            except (TypeError, ValueError, ValidationError):
+                # Valores inválidos seguem o fluxo normal da sub-requisição.
+                continue
+            # Apenas acertos entram no cache; ausências geram o 404 habitual.
+            for key, obj in objects.items():
+                cache[(view_class, str(key))] = obj
+
+    def _build_request(self, request, url, match, cache):
+        sub_request = HttpRequest()
+        sub_request.method = "GET"
+        sub_request.path = sub_request.path_info = url.path
+        sub_request.META = {
+            **request.META,
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": url.path,
+            "QUERY_STRING": url.query,
+        }
+        sub_request.GET = QueryDict(url.query)
+        sub_request.resolver_match = match
+        # Reaproveita a autenticação já feita na requisição externa.
+        sub_request._force_auth_user = request.user
+        sub_request._force_auth_token = request.auth
+        sub_request.batch_objects = cache
+        return sub_request
+
+    def _dispatch(self, request, path, match, cache):
+        sub_request = self._build_request(request, urlsplit(path), match, cache)
+        response = match.func(sub_request, *match.args, **match.kwargs)
+        return response.status_code, getattr(response, "data", None)
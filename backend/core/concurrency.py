@@ -0,0 +1,79 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = (
+        "O recurso foi alterado por outra requisição. Recarregue e tente novamente."
+    )
+    default_code = "precondition_failed"
+
+
+def version_etag(version):
+    return quote_etag(str(version))
+
+
+def claim_version(instance, expected, lookup_fields=("pk",)):
+    """
+    `UPDATE ... SET version = version + 1 WHERE version = <expected>` na linha
+    de `instance`. Retorna False se outra escrita já mudou a versão. Deve rodar
+    na mesma transação que grava as alterações: a linha fica reservada até o
+    commit, e uma escrita concorrente com a mesma versão espera e então não a
+    encontra mais.
+    """
+    lookup = {field: getattr(instance, field) for field in lookup_fields}
+    return bool(
+        type(instance)
+        ._base_manager.filter(version=expected, **lookup)
+        .update(version=F("version") + 1)
+    )
+
+
+class OptimisticConcurrencyMixin:
+    """
+    Controle de concorrência otimista para ViewSets de modelos com a coluna
+    `version`, sem manter locks enquanto o cliente edita.
+
+    As respostas de detalhe trazem `ETag` com a versão do objeto. Na edição
+    (PUT/PATCH), a escrita só acontece se a versão no banco ainda for a
+    esperada, via `UPDATE ... WHERE version = n`; caso contrário a resposta é
+    412. A versão esperada é a do `If-Match` (aceita ETags fracas, já que a
+    compressão enfraquece as fortes) ou, sem o header, a versão lida no início
+    da requisição.
+    """
+
+    etag_actions = ("retrieve", "create", "update", "partial_update")
+    # Campos usados para localizar a linha no UPDATE condicional.
+    version_lookup_fields = ("pk",)
+
+    def get_expected_version(self, instance):
+        header = self.request.headers.get("If-Match")
+        if header is None:
+            return instance.version
+        etags = {etag.removeprefix("W/") for etag in parse_etags(header)}
+        if "*" in etags or version_etag(instance.version) in etags:
+            return instance.version
+        raise PreconditionFailed()
+
+    def perform_update(self, serializer):
+        instance = serializer.instance
+        expected = self.get_expected_version(instance)
+        with transaction.atomic():
+            if not claim_version(instance, expected, self.version_lookup_fields):
+                raise PreconditionFailed()
+            serializer.save(version=expected + 1)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if (
+            getattr(self, "action", None) in self.etag_actions
+            and status.is_success(response.status_code)
+            and isinstance(response.data, dict)
+            and "version" in response.data
+        ):
+            response["ETag"] = version_etag(response.data["version"])
+        return response
@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+MAX_IDS = 100
+
+
+def parse_id_list(params, name, limit=MAX_IDS):
+    """
+    Lê um parâmetro de query com IDs separados por vírgula (`?ids=1,2,3`).
+
+    Retorna `None` quando o parâmetro não foi enviado e a lista ordenada, sem
+    repetições, caso contrário. IDs não numéricos ou acima de `limit` geram
+    erro de validação, para que o `IN` gerado tenha tamanho limitado.
+    """
+    raw = params.get(name)
+    if raw is None:
+        return None
+
+    try:
+        ids = {int(value) for value in raw.split(",") if value.strip()}
+    except ValueError:
+        raise serializers.ValidationError(
+            {name: ["Informe IDs numéricos separados por vírgula."]}
+        ) from None
+    if len(ids) > limit:
+        raise serializers.ValidationError({name: [f"Informe no máximo {limit} IDs."]})
+    return sorted(ids)
@@ -0,0 +1,34 @@
+from django.utils.module_loading import import_string
+
+
+class LazyView:
+    """
+    View cujo módulo só é importado na primeira requisição.
+
+    Usada no URLconf para adiar o import das views de documentação OpenAPI até
+    o primeiro uso. Não serve para views que devem aparecer no schema: o
+    drf-spectacular só documenta callbacks com o atributo `cls`.
+    """
+
+    def __init__(self, dotted_path, *, csrf_exempt=False, **initkwargs):
+        self.dotted_path = dotted_path
+        self.initkwargs = initkwargs
+        # O CsrfViewMiddleware inspeciona a view antes de ela ser carregada.
+        self.csrf_exempt = csrf_exempt
+        self._view = None
+
+    def __call__(self, request, *args, **kwargs):
+        if self._view is None:
+            view = import_string(self.dotted_path)
+            self._view = (
+                view.as_view(**self.initkwargs) if hasattr(view, "as_view") else view
+            )
+        return self._view(request, *args, **kwargs)
+
+    def __repr__(self):
+        return f"<LazyView {self.dotted_path}>"
+
+
+def lazy_api_view(dotted_path, **initkwargs):
+    """Atalho para views do DRF, que são sempre isentas de CSRF."""
+    return LazyView(dotted_path, csrf_exempt=True, **initkwargs)
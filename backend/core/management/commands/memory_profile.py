@@ -0,0 +1,107 @@
+import gc
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.core.memory import WSGIRequester, tracker
+
+
+class Command(BaseCommand):
+    help = (
+        "Executa requisições GET em processo com o tracemalloc ligado e mostra o "
+        "crescimento de memória por arquivo/linha entre rodadas e o pico de "
+        "alocação por endpoint."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            help="Caminho a requisitar (pode repetir; padrão: MEMORY_PROFILING_PATHS).",
+        )
+        parser.add_argument(
+            "--username",
+            required=True,
+            help="Usuário usado para autenticar as requisições.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Requisições por rodada.",
+        )
+        parser.add_argument(
+            "--rounds", type=int, default=5, help="Quantidade de rodadas."
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="Linhas com maior crescimento listadas ao final.",
+        )
+        parser.add_argument(
+            "--frames",
+            type=int,
+            default=settings.MEMORY_PROFILING_FRAMES,
+            help="Frames guardados por alocação (mais frames, mais custo).",
+        )
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or list(settings.MEMORY_PROFILING_PATHS)
+        try:
+            user = get_user_model().objects.get(username=options["username"])
+        except get_user_model().DoesNotExist as exc:
+            raise CommandError(
+                f"Usuário não encontrado: {options['username']}"
+            ) from exc
+
+        host = next(
+            (host.lstrip(".") for host in settings.ALLOWED_HOSTS if host != "*"),
+            "localhost",
+        )
+        requester = WSGIRequester(user, host=host, secure=settings.SECURE_SSL_REDIRECT)
+
+        def request(index):
+            path = paths[index % len(paths)]
+            with tracker.measure(f"GET {path}"):
+                status_code = requester.get(path)
+            if status_code != 200:
+                raise CommandError(f"GET {path} respondeu {status_code}.")
+
+        tracker.start(options["frames"])
+        try:
+            # Rodada de aquecimento: imports, caches e conexões antes do baseline.
+            for index in range(len(paths)):
+                request(index)
+            tracker.take_baseline()
+            tracker.endpoints = {}
+
+            for round_number in range(1, options["rounds"] + 1):
+                for index in range(options["requests"]):
+                    request(index)
+                # Ciclos ainda não coletados não são vazamento.
+                gc.collect()
+                traced_kb = tracker.report(0)["traced_kb"]
+                self.stdout.write(
+                    f"Rodada {round_number}: {traced_kb:.1f} KB rastreados."
+                )
+
+            report = tracker.report(options["top"])
+        finally:
+            tracker.stop()
+
+        self.stdout.write("\nCrescimento desde o baseline (arquivo:linha):")
+        for item in report["growth"]:
+            self.stdout.write(
+                f"  {item['size_diff_kb']:+10.1f} KB  {item['count_diff']:+7d}  "
+                f"{item['location']}"
+            )
+
+        self.stdout.write("\nPico de alocação por endpoint:")
+        for endpoint, stats in report["endpoints"].items():
+            self.stdout.write(
+                f"  {endpoint}: pico {stats['peak_kb']:.1f} KB, "
+                f"média {stats['avg_peak_kb']:.1f} KB ({stats['requests']} requisições)"
+            )
@@ -0,0 +1,91 @@
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# Reproduz o boot de um worker: setup do Django, aplicação WSGI e URLconf.
+BOOT_SCRIPT = """
+import django
+django.setup()
+from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
+get_wsgi_application()
+get_resolver().url_patterns
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede o tempo de import de cada módulo durante o boot de um worker "
+        "(python -X importtime) e lista os mais custosos."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=25, help="Quantidade de módulos listados."
+        )
+        parser.add_argument(
+            "--sort",
+            choices=["cumulative", "self"],
+            default="cumulative",
+            help="Ordena pelo tempo acumulado (com dependências) ou próprio.",
+        )
+        parser.add_argument(
+            "--packages",
+            action="store_true",
+            help="Agrupa os tempos próprios por pacote de primeiro nível.",
+        )
+
+    def handle(self, *args, **options):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT],
+            capture_output=True,
+            text=True,
+            env=os.environ.copy(),
+        )
+        if result.returncode != 0:
+            raise CommandError(f"Falha ao iniciar a aplicação:\n{result.stderr}")
+
+        modules = self.parse(result.stderr)
+        if not modules:
+            raise CommandError("Nenhuma medição de import encontrada.")
+
+        total = sum(self_us for self_us, _ in modules.values())
+        if options["packages"]:
+            grouped = defaultdict(int)
+            for name, (self_us, _) in modules.items():
+                grouped[name.split(".")[0]] += self_us
+            rows = sorted(grouped.items(), key=lambda item: item[1], reverse=True)
+            rows = [(name, self_us, self_us) for name, self_us in rows]
+        else:
+            index = 1 if options["sort"] == "cumulative" else 0
+            rows = sorted(
+                modules.items(), key=lambda item: item[1][index], reverse=True
+            )
+            rows = [(name, self_us, cumulative) for name, (self_us, cumulative) in rows]
+
+        self.stdout.write(f"{'self (ms)':>10} {'cumul. (ms)':>12}  módulo")
+        for name, self_us, cumulative in rows[: options["limit"]]:
+            self.stdout.write(
+                f"{self_us / 1000:>10.1f} {cumulative / 1000:>12.1f}  {name}"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Total: {total / 1000:.1f} ms em {len(modules)} módulos importados."
+            )
+        )
+
+    @staticmethod
+    def parse(output):
+        """Converte a saída de `-X importtime` em {módulo: (self_us, cumulative_us)}."""
+        modules = {}
+        for line in output.splitlines():
+            match = IMPORTTIME_LINE.match(line)
+            if match:
+                modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+        return modules
@@ -0,0 +1,129 @@
+import os
+import tracemalloc
+from contextlib import contextmanager
+
+
+class MemoryTracker:
+    """
+    Acompanha a memória alocada pelo processo com `tracemalloc`.
+
+    Guarda um snapshot de referência (`baseline`) para comparar alocações por
+    arquivo/linha e o pico de memória alocada durante cada endpoint medido.
+    O pico é medido com `tracemalloc.reset_peak()`, portanto só é exato com um
+    request por vez no processo (workers síncronos do gunicorn).
+    """
+
+    def __init__(self):
+        self.baseline = None
+        self.endpoints = {}
+
+    @property
+    def tracing(self):
+        return tracemalloc.is_tracing()
+
+    def start(self, frames=1):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self.take_baseline()
+
+    def stop(self):
+        tracemalloc.stop()
+        self.baseline = None
+        self.endpoints = {}
+
+    def take_baseline(self):
+        self.baseline = tracemalloc.take_snapshot()
+
+    def growth(self, limit=10):
+        """Maiores variações de memória alocada por arquivo/linha desde o baseline."""
+        snapshot = tracemalloc.take_snapshot()
+        stats = snapshot.compare_to(self.baseline, "lineno")
+        return [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_diff_kb": round(stat.size_diff / 1024, 1),
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[:limit]
+        ]
+
+    @contextmanager
+    def measure(self, endpoint):
+        """
+        Registra o pico de memória alocada durante o bloco. O nome do endpoint
+        pode ser ajustado dentro do bloco via `record["endpoint"]`.
+        """
+        record = {"endpoint": endpoint}
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        try:
+            yield record
+        finally:
+            peak_kb = (tracemalloc.get_traced_memory()[1] - before) / 1024
+            stats = self.endpoints.setdefault(
+                record["endpoint"], {"requests": 0, "peak_kb": 0.0, "total_kb": 0.0}
+            )
+            stats["requests"] += 1
+            stats["peak_kb"] = max(stats["peak_kb"], peak_kb)
+            stats["total_kb"] += peak_kb
+
+    def endpoint_report(self):
+        return {
+            name: {
+                "requests": stats["requests"],
+                "peak_kb": round(stats["peak_kb"], 1),
+                "avg_peak_kb": round(stats["total_kb"] / stats["requests"], 1),
+            }
+            for name, stats in sorted(self.endpoints.items())
+        }
+
+    def report(self, limit=10):
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "pid": os.getpid(),
+            "traced_kb": round(current / 1024, 1),
+            "peak_kb": round(peak / 1024, 1),
+            "growth": self.growth(limit) if limit else [],
+            "endpoints": self.endpoint_report(),
+        }
+
+
+class WSGIRequester:
+    """
+    Requisições GET em processo pelo `WSGIHandler`, o mesmo caminho de um
+    worker do gunicorn, autenticadas com um token JWT do usuário.
+
+    O `Client` de teste do Django não serve para medir memória: ele conecta
+    receivers de signals a cada requisição, e cada conexão deixa um registro
+    `weakref.finalize` que aparece como crescimento. Como em produção, o
+    `request_started` limpa `connection.queries` a cada requisição.
+    """
+
+    def __init__(self, user, host="testserver", secure=False):
+        from django.core.handlers.wsgi import WSGIHandler
+        from django.test import RequestFactory
+        from rest_framework_simplejwt.tokens import AccessToken
+
+        self.handler = WSGIHandler()
+        self.factory = RequestFactory(
+            headers={"authorization": f"Bearer {AccessToken.for_user(user)}"}
+        )
+        self.host = host
+        self.secure = secure
+
+    def get(self, path):
+        """Executa `GET path` e retorna o status da resposta."""
+        environ = self.factory.get(
+            path, HTTP_HOST=self.host, secure=self.secure
+        ).environ
+        response = self.handler(environ, lambda status, headers, exc_info=None: None)
+        try:
+            for _ in response:
+                pass
+        finally:
+            response.close()
+        return response.status_code
+
+
+# Um rastreador por processo (cada worker do gunicorn tem o seu).
+tracker = MemoryTracker()
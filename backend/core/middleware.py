@@ -1,9 +1,108 @@
 import logging
+import random
+import re
 import time
 
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DatabaseError, connection
+from django.http import JsonResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # dependência opcional: sem ela, apenas gzip
+    brotli = None
+
+from .memory import tracker
+from .queries import QueryProfiler
+
 logger = logging.getLogger("django")
 
 
+class HealthCheckMiddleware:
+    """
+    Responde `/healthz` (liveness) e `/readyz` (readiness, com ping no banco) antes
+    dos demais middlewares, para que as probes não passem por validação de host,
+    redirecionamento HTTPS, sessão, autenticação ou pela documentação da API.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path == "/healthz":
+            return JsonResponse({"status": "ok"})
+        if request.path == "/readyz":
+            return self.readiness()
+        return self.get_response(request)
+
+    def readiness(self):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except DatabaseError:
+            logger.exception("Readiness: banco de dados indisponível")
+            return JsonResponse(
+                {"status": "unavailable", "database": "error"}, status=503
+            )
+        return JsonResponse({"status": "ok", "database": "ok"})
+
+
+ACCEPTS_BROTLI = re.compile(r"\bbr\b")
+ACCEPTS_GZIP = re.compile(r"\bgzip\b")
+
+
+class CompressionMiddleware:
+    """
+    Comprime com brotli (se instalado e aceito pelo cliente) ou gzip as respostas
+    a partir de `COMPRESSION_MIN_SIZE` bytes. Respostas em streaming (SSE,
+    exportações) não são tocadas, para não atrasar a entrega de cada chunk.
+    """
+
+    # Mitigação BREACH, como no GZipMiddleware do Django.
+    max_random_bytes = 100
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if brotli is not None and ACCEPTS_BROTLI.search(accept_encoding):
+            encoding = "br"
+            content = brotli.compress(
+                response.content, quality=settings.COMPRESSION_BROTLI_QUALITY
+            )
+        elif ACCEPTS_GZIP.search(accept_encoding):
+            encoding = "gzip"
+            content = compress_string(
+                response.content, max_random_bytes=self.max_random_bytes
+            )
+        else:
+            return response
+
+        if len(content) >= len(response.content):
+            return response
+
+        response.content = content
+        response.headers["Content-Length"] = str(len(content))
+        response.headers["Content-Encoding"] = encoding
+        # O corpo mudou: um ETag forte passa a ser fraco (RFC 9110, 8.8.1).
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        return response
+
+
 class RequestLoggingMiddleware:
     """
     Middleware para registrar logs de cada requisição (método, path, status, tempo de execução).
@@ -41,3 +140,76 @@ class RequestLoggingMiddleware:
         logger.info(f"API Access: {log_data}")
 
         return response
+
+
+class QueryProfilingMiddleware:
+    """
+    Middleware opcional (`QUERY_PROFILING_ENABLED`) que instrumenta uma amostra das
+    requisições (`QUERY_PROFILING_SAMPLE_RATE`) com `connection.execute_wrapper`:
+    registra total e tempo de queries por view, queries acima de
+    `SLOW_QUERY_THRESHOLD_MS` e formas de SQL repetidas (possíveis N+1).
+    """
+
+    def __init__(self, get_response):
+        if not settings.QUERY_PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if random.random() >= settings.QUERY_PROFILING_SAMPLE_RATE:
+            return self.get_response(request)
+
+        profiler = QueryProfiler(settings.SLOW_QUERY_THRESHOLD_MS)
+        with connection.execute_wrapper(profiler):
+            response = self.get_response(request)
+
+        self.report(request, response, profiler)
+        return response
+
+    def report(self, request, response, profiler):
+        match = request.resolver_match
+        view = (match.view_name or match._func_path) if match else request.path
+
+        log_data = {
+            "view": view,
+            "status": response.status_code,
+            "queries": profiler.count,
+            "duration": f"{profiler.duration:.3f}s",
+        }
+        logger.info(f"Query Profile: {log_data}")
+
+        for elapsed, shape in profiler.slow_queries:
+            log_data = {"view": view, "duration": f"{elapsed:.3f}s", "sql": shape}
+            logger.warning(f"Slow Query: {log_data}")
+
+        threshold = settings.QUERY_PROFILING_REPEAT_THRESHOLD
+        for shape, count in profiler.repeated(threshold):
+            log_data = {"view": view, "count": count, "sql": shape}
+            logger.warning(f"Possible N+1: {log_data}")
+
+
+class MemoryProfilingMiddleware:
+    """
+    Middleware opcional (`MEMORY_PROFILING_ENABLED`) que liga o `tracemalloc` no
+    worker e registra o pico de memória alocada por endpoint para os caminhos
+    em `MEMORY_PROFILING_PATHS`. O relatório de cada worker é exposto em
+    `/api/debug/memory/` (apenas administradores).
+    """
+
+    def __init__(self, get_response):
+        if not settings.MEMORY_PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.paths = tuple(settings.MEMORY_PROFILING_PATHS)
+        tracker.start(settings.MEMORY_PROFILING_FRAMES)
+
+    def __call__(self, request):
+        if not request.path.startswith(self.paths):
+            return self.get_response(request)
+
+        with tracker.measure(request.path) as record:
+            response = self.get_response(request)
+            match = request.resolver_match
+            if match is not None:
+                record["endpoint"] = f"{request.method} {match.view_name}"
+        return response
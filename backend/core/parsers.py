@@ -0,0 +1,37 @@
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+try:
+    import msgpack
+except ImportError:  # dependência opcional, ver renderers.MessagePackMixin
+    msgpack = None
+
+
+class StreamParser(BaseParser):
+    """
+    Entrega o corpo da requisição como stream (sem lê-lo para a memória), para
+    endpoints que processam a entrada linha a linha.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        return stream
+
+
+class CSVStreamParser(StreamParser):
+    media_type = "text/csv"
+
+
+class NDJSONStreamParser(StreamParser):
+    media_type = "application/x-ndjson"
+
+
+class MessagePackParser(BaseParser):
+    """Corpo `application/msgpack` (requer o pacote opcional `msgpack`)."""
+
+    media_type = "application/msgpack"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError(f"MessagePack inválido: {exc}") from exc
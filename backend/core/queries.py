@@ -0,0 +1,55 @@
+import re
+import time
+from collections import Counter
+
+_STRING_LITERALS = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERALS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LISTS = re.compile(r"\(\s*%s(?:\s*,\s*%s)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    """
+    Reduz uma query à sua "forma": literais viram `%s` e listas de `IN`
+    colapsam em `(...)`, para que queries repetidas com valores diferentes
+    (assinatura típica de N+1) sejam agrupadas.
+    """
+    sql = _STRING_LITERALS.sub("%s", sql)
+    sql = _NUMBER_LITERALS.sub("%s", sql)
+    sql = _PLACEHOLDER_LISTS.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class QueryProfiler:
+    """
+    Wrapper para `connection.execute_wrapper` que conta e cronometra as queries
+    executadas, agrupando-as por forma normalizada e guardando as lentas.
+    """
+
+    def __init__(self, slow_threshold_ms):
+        self.slow_threshold = slow_threshold_ms / 1000
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+        self.slow_queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            shape = normalize_sql(sql)
+            self.count += 1
+            self.duration += elapsed
+            self.shapes[shape] += 1
+            if elapsed >= self.slow_threshold:
+                self.slow_queries.append((elapsed, shape))
+
+    def repeated(self, threshold):
+        """Formas executadas pelo menos `threshold` vezes (possíveis N+1)."""
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
@@ -0,0 +1,41 @@
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from .parsers import MessagePackParser, msgpack
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renderiza em MessagePack (`Accept: application/msgpack`), formato binário
+    mais compacto e mais rápido de codificar que JSON para listagens grandes.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        # Tipos fora do MessagePack (datas, Decimal, UUID) seguem a conversão do JSON.
+        return msgpack.packb(data, default=JSONEncoder().default, use_bin_type=True)
+
+
+class MessagePackMixin:
+    """
+    Adiciona MessagePack às opções de negociação de conteúdo de uma view quando o
+    pacote opcional `msgpack` está instalado. JSON continua sendo o padrão.
+    """
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if msgpack is not None:
+            renderers.append(MessagePackRenderer())
+        return renderers
+
+    def get_parsers(self):
+        parsers = super().get_parsers()
+        if msgpack is not None:
+            parsers.append(MessagePackParser())
+        return parsers
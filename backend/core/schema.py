@@ -0,0 +1,80 @@
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+import yaml
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import patch_cache_control
+from drf_spectacular.views import SpectacularAPIView
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    Schema OpenAPI gerado uma única vez por processo.
+
+    O schema é lido do arquivo `SPECTACULAR_SCHEMA_FILE` (gerado no build da
+    imagem com `manage.py spectacular --file ...`) ou, na sua ausência, gerado
+    por introspecção na primeira requisição. Cada formato é renderizado uma vez
+    e servido da memória com ETag, respondendo 304 para `If-None-Match`.
+    """
+
+    _schemas = {}
+    _rendered = {}
+    _lock = threading.Lock()
+
+    def _get_schema_response(self, request):
+        version = (
+            self.api_version or request.version or self._get_version_parameter(request)
+        )
+        renderer, media_type = self.perform_content_negotiation(request, force=True)
+        key = (version, translation.get_language(), media_type)
+
+        with self._lock:
+            cached = self._rendered.get(key)
+            if cached is None:
+                schema = self._get_schema(request, version)
+                content = renderer.render(schema, media_type, {"request": request})
+                etag = f'"{hashlib.md5(content).hexdigest()}"'
+                cached = self._rendered[key] = (content, etag)
+
+        content, etag = cached
+        if etag in request.headers.get("If-None-Match", ""):
+            response = HttpResponse(status=304)
+        else:
+            response = HttpResponse(content, content_type=media_type)
+            response["Content-Disposition"] = (
+                f'inline; filename="{self._get_filename(request, version)}"'
+            )
+        response["ETag"] = etag
+        patch_cache_control(response, public=True, max_age=300)
+        return response
+
+    def _get_schema(self, request, version):
+        key = (version, translation.get_language())
+        if key not in self._schemas:
+            self._schemas[key] = self._load_schema_file(version) or self._generate(
+                request, version
+            )
+        return self._schemas[key]
+
+    def _load_schema_file(self, version):
+        path = settings.SPECTACULAR_SCHEMA_FILE
+        # O arquivo pré-gerado corresponde à versão e ao idioma padrão.
+        if not path or version or translation.get_language() != settings.LANGUAGE_CODE:
+            return None
+        path = Path(path)
+        if not path.is_file():
+            return None
+        with path.open(encoding="utf-8") as schema_file:
+            if path.suffix == ".json":
+                return json.load(schema_file)
+            return yaml.safe_load(schema_file)
+
+    def _generate(self, request, version):
+        generator = self.generator_class(
+            urlconf=self.urlconf, api_version=version, patterns=self.patterns
+        )
+        return generator.get_schema(request=request, public=self.serve_public)
@@ -6,6 +6,7 @@ Environment-specific settings should be in local.py, staging.py, or production.p
 
 from pathlib import Path
 from datetime import timedelta
+from decimal import Decimal
 from decouple import config, Csv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -33,12 +34,18 @@ INSTALLED_APPS = [
     "rest_framework",
     "corsheaders",
     "drf_spectacular",
+    "backend.core",
     "apps.accounts",
     "apps.professionals",
     "apps.appointments",
+    "apps.sync",
+    "apps.reminders",
+    "apps.payments",
 ]
 
 MIDDLEWARE = [
+    "backend.core.middleware.HealthCheckMiddleware",
+    "backend.core.middleware.CompressionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -48,6 +55,8 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "backend.core.middleware.RequestLoggingMiddleware",
+    "backend.core.middleware.QueryProfilingMiddleware",
+    "backend.core.middleware.MemoryProfilingMiddleware",
 ]
 
 ROOT_URLCONF = "backend.core.urls"
@@ -183,12 +192,136 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
     "COMPONENT_SPLIT_REQUEST": True,
 }
+# Schema pré-gerado no build (manage.py spectacular --file ...); vazio = gerar na primeira requisição
+SPECTACULAR_SCHEMA_FILE = config("SPECTACULAR_SCHEMA_FILE", default="")
+
+# Query Profiling (opt-in)
+QUERY_PROFILING_ENABLED = config("QUERY_PROFILING_ENABLED", default=False, cast=bool)
+QUERY_PROFILING_SAMPLE_RATE = config(
+    "QUERY_PROFILING_SAMPLE_RATE", default=0.1, cast=float
+)
+QUERY_PROFILING_REPEAT_THRESHOLD = config(
+    "QUERY_PROFILING_REPEAT_THRESHOLD", default=5, cast=int
+)
+SLOW_QUERY_THRESHOLD_MS = config("SLOW_QUERY_THRESHOLD_MS", default=200, cast=int)
+
+# Memory Profiling (opt-in)
+# Liga o tracemalloc nos workers; tem custo de CPU e memória, use temporariamente
+MEMORY_PROFILING_ENABLED = config("MEMORY_PROFILING_ENABLED", default=False, cast=bool)
+MEMORY_PROFILING_FRAMES = config("MEMORY_PROFILING_FRAMES", default=1, cast=int)
+MEMORY_PROFILING_PATHS = config(
+    "MEMORY_PROFILING_PATHS",
+    default="/api/appointments/,/api/professionals/",
+    cast=Csv(),
+)
+
+# Appointment Storage
+# Partições mensais criadas antecipadamente e horizonte de arquivamento
+APPOINTMENT_PARTITIONS_AHEAD = config(
+    "APPOINTMENT_PARTITIONS_AHEAD", default=3, cast=int
+)
+APPOINTMENT_ARCHIVE_AFTER_DAYS = config(
+    "APPOINTMENT_ARCHIVE_AFTER_DAYS", default=365, cast=int
+)
+# Maior intervalo de datas aceito pela listagem de consultas
+APPOINTMENT_MAX_DATE_RANGE_DAYS = config(
+    "APPOINTMENT_MAX_DATE_RANGE_DAYS", default=93, cast=int
+)
+
+# Django Admin
+# Acima dessa quantidade de linhas (segundo as estatísticas do PostgreSQL) a
+# listagem sem filtros do admin mostra o total estimado em vez de COUNT(*)
+ADMIN_ESTIMATED_COUNT_THRESHOLD = config(
+    "ADMIN_ESTIMATED_COUNT_THRESHOLD", default=10000, cast=int
+)
+
+# Response Compression
+# Respostas menores que isso não compensam a compressão; brotli usa qualidade
+# moderada para não pesar na CPU em conteúdo dinâmico
+COMPRESSION_MIN_SIZE = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)
+COMPRESSION_BROTLI_QUALITY = config("COMPRESSION_BROTLI_QUALITY", default=5, cast=int)
+
+# Appointment Reminders
+# Antecedências dos lembretes (minutos antes da consulta) e canal de envio
+REMINDER_LEAD_TIMES_MINUTES = config(
+    "REMINDER_LEAD_TIMES_MINUTES", default="1440,60", cast=Csv(int)
+)
+REMINDER_SENDER = config(
+    "REMINDER_SENDER", default="apps.reminders.senders.LoggingSender"
+)
+REMINDER_BATCH_SIZE = config("REMINDER_BATCH_SIZE", default=100, cast=int)
+REMINDER_MAX_ATTEMPTS = config("REMINDER_MAX_ATTEMPTS", default=5, cast=int)
+REMINDER_POLL_SECONDS = config("REMINDER_POLL_SECONDS", default=30, cast=float)
+
+# Asaas Payments
+# Token configurado no painel da Asaas e enviado no header `asaas-access-token` dos webhooks
+ASAAS_WEBHOOK_TOKEN = config("ASAAS_WEBHOOK_TOKEN", default="")
+PAYMENT_WEBHOOK_BATCH_SIZE = config("PAYMENT_WEBHOOK_BATCH_SIZE", default=500, cast=int)
+# O webhook pode chegar antes do commit do pagamento local: o evento é
+# reprocessado com espera dobrada a cada tentativa (30s, 60s, 120s...) e só é
+# descartado com erro após o número máximo de tentativas
+PAYMENT_WEBHOOK_MAX_ATTEMPTS = config(
+    "PAYMENT_WEBHOOK_MAX_ATTEMPTS", default=5, cast=int
+)
+PAYMENT_WEBHOOK_RETRY_SECONDS = config(
+    "PAYMENT_WEBHOOK_RETRY_SECONDS", default=30, cast=int
+)
+# API usada pela conciliação (reconcile_payments) e limite de requisições por segundo
+ASAAS_API_URL = config("ASAAS_API_URL", default="https://sandbox.asaas.com/api/v3")
+ASAAS_API_KEY = config("ASAAS_API_KEY", default="")
+ASAAS_TIMEOUT_SECONDS = config("ASAAS_TIMEOUT_SECONDS", default=10, cast=float)
+ASAAS_RATE_LIMIT = config("ASAAS_RATE_LIMIT", default=10, cast=float)
+ASAAS_PLATFORM_WALLET_ID = config(
+    "ASAAS_PLATFORM_WALLET_ID", default="wallet_id_da_lacrei"
+)
+
+# Pricing
+# Preço, taxa da plataforma e wallet usados quando não há regra para o
+# profissional nem para a profissão, e validade do cache de regras por processo
+PRICING_DEFAULT_VALUE = config("PRICING_DEFAULT_VALUE", default="200.00", cast=Decimal)
+PRICING_DEFAULT_PLATFORM_FEE = config(
+    "PRICING_DEFAULT_PLATFORM_FEE", default="20.00", cast=Decimal
+)
+PRICING_DEFAULT_WALLET_ID = config(
+    "PRICING_DEFAULT_WALLET_ID", default="wallet_id_do_profissional"
+)
+PRICING_CACHE_TTL_SECONDS = config("PRICING_CACHE_TTL_SECONDS", default=300, cast=int)
+# Com vários processos (gunicorn) no PostgreSQL, cada um escuta o NOTIFY de
+# alteração das regras e descarta o próprio cache
+PRICING_LISTEN_FOR_CHANGES = config(
+    "PRICING_LISTEN_FOR_CHANGES", default=False, cast=bool
+)
+
+# Batch API
+# Máximo de sub-requisições aceitas por chamada a /api/batch/
+BATCH_MAX_REQUESTS = config("BATCH_MAX_REQUESTS", default=50, cast=int)
+
+# Incremental Sync
+# Margem subtraída do sync_token para cobrir transações ainda não commitadas no momento do poll
+SYNC_SAFETY_MARGIN = timedelta(
+    seconds=config("SYNC_SAFETY_MARGIN_SECONDS", default=5, cast=int)
+)
+# Tombstones mais antigos que isso são apagados por `purge_tombstones`; tokens
+# mais antigos recebem 410 e o cliente refaz a sincronização inicial
+SYNC_MAX_AGE = timedelta(days=config("SYNC_MAX_AGE_DAYS", default=30, cast=int))
+# Objetos por página da sincronização inicial
+SYNC_PAGE_SIZE = config("SYNC_PAGE_SIZE", default=500, cast=int)
+
+# Live Appointment Events (SSE)
+# InMemoryBroker só entrega eventos dentro do mesmo processo; com múltiplos
+# processos use apps.appointments.events.PostgresNotifyBroker
+APPOINTMENT_EVENTS_BROKER = config(
+    "APPOINTMENT_EVENTS_BROKER", default="apps.appointments.events.InMemoryBroker"
+)
+SSE_HEARTBEAT_SECONDS = config("SSE_HEARTBEAT_SECONDS", default=15, cast=int)
 
 # CORS Configuration
 CORS_ALLOW_ALL_ORIGINS = config("CORS_ALLOW_ALL_ORIGINS", default=False, cast=bool)
 CORS_ALLOWED_ORIGINS = config(
     "CORS_ALLOWED_ORIGINS", default="http://localhost:3000", cast=Csv()
 )
+# Intervalo aplicado na listagem de consultas, lido pelos clientes no navegador
+CORS_EXPOSE_HEADERS = ["X-Date-From", "X-Date-To"]
 
 # Logging Configuration
 LOGGING = {
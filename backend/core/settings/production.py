@@ -27,6 +27,17 @@ CORS_ALLOW_CREDENTIALS = True
 # Database connection pooling for production
 DATABASES["default"]["CONN_MAX_AGE"] = config("DB_CONN_MAX_AGE", default=600, cast=int)  # noqa: F405
 
+# Live appointment events: fan-out entre processos via LISTEN/NOTIFY
+APPOINTMENT_EVENTS_BROKER = config(  # noqa: F405
+    "APPOINTMENT_EVENTS_BROKER",
+    default="apps.appointments.events.PostgresNotifyBroker",
+)
+
+# Regras de preço: invalidação do cache de cada worker via LISTEN/NOTIFY
+PRICING_LISTEN_FOR_CHANGES = config(  # noqa: F405
+    "PRICING_LISTEN_FOR_CHANGES", default=True, cast=bool
+)
+
 # Logging configuration for production
 LOGGING = {
     "version": 1,
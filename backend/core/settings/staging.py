@@ -17,6 +17,17 @@ CSRF_COOKIE_SECURE = True
 # CORS settings for staging
 CORS_ALLOWED_ORIGINS = config("CORS_ALLOWED_ORIGINS", default="", cast=Csv())  # noqa: F405
 
+# Live appointment events: fan-out entre processos via LISTEN/NOTIFY
+APPOINTMENT_EVENTS_BROKER = config(  # noqa: F405
+    "APPOINTMENT_EVENTS_BROKER",
+    default="apps.appointments.events.PostgresNotifyBroker",
+)
+
+# Regras de preço: invalidação do cache de cada worker via LISTEN/NOTIFY
+PRICING_LISTEN_FOR_CHANGES = config(  # noqa: F405
+    "PRICING_LISTEN_FOR_CHANGES", default=True, cast=bool
+)
+
 # Logging configuration for staging
 LOGGING = {
     "version": 1,
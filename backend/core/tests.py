@@ -0,0 +1,417 @@
+import gzip
+from datetime import timedelta
+from io import StringIO
+from unittest import mock, skipUnless
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.signals import request_finished, request_started
+from django.db import OperationalError, close_old_connections, connection
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from django.utils import timezone
+from drf_spectacular.generators import SchemaGenerator
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.appointments.models import Appointment
+from apps.professionals.models import Professional
+
+from .admin import EstimatedCountPaginator
+from .lazy import LazyView
+from .memory import MemoryTracker, tracker
+from .middleware import CompressionMiddleware, brotli
+from .parsers import msgpack
+from .queries import QueryProfiler, normalize_sql
+from .schema import CachedSpectacularAPIView
+
+
+def sample_view(request):
+    return HttpResponse("ok")
+
+
+class StartupTests(SimpleTestCase):
+    def test_lazy_view_imports_on_first_call(self):
+        """Teste de carga tardia: a view só é importada na primeira requisição"""
+        view = LazyView("backend.core.tests.sample_view")
+        self.assertIsNone(view._view)
+
+        response = view(RequestFactory().get("/"))
+        self.assertEqual(response.content, b"ok")
+        self.assertIs(view._view, sample_view)
+
+    def test_lazy_api_views_are_csrf_exempt(self):
+        """Teste de isenção de CSRF das views DRF carregadas tardiamente"""
+        match = resolve("/api/docs/")
+        self.assertIsInstance(match.func, LazyView)
+        self.assertTrue(match.func.csrf_exempt)
+
+    def test_token_endpoints_in_schema(self):
+        """Teste: endpoints JWT presentes no schema OpenAPI gerado"""
+        schema = SchemaGenerator().get_schema(request=None, public=True)
+        self.assertIn("/api/token/", schema["paths"])
+        self.assertIn("/api/token/refresh/", schema["paths"])
+
+    def test_startup_profile_command(self):
+        """Teste do comando startup_profile"""
+        out = StringIO()
+        call_command("startup_profile", "--limit", "5", "--packages", stdout=out)
+        output = out.getvalue()
+        self.assertIn("django", output)
+        self.assertIn("Total:", output)
+
+
+class HealthCheckTests(TestCase):
+    def test_healthz(self):
+        """Teste da probe de liveness"""
+        response = self.client.get("/healthz")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "ok"})
+
+    def test_readyz_pings_database(self):
+        """Teste da probe de readiness com ping no banco"""
+        with self.assertNumQueries(1):
+            response = self.client.get("/readyz")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["database"], "ok")
+
+    def test_readyz_database_unavailable(self):
+        """Teste de readiness com banco indisponível"""
+        with mock.patch.object(
+            connection, "cursor", side_effect=OperationalError("down")
+        ):
+            response = self.client.get("/readyz")
+        self.assertEqual(response.status_code, 503)
+
+
+class SchemaCacheTests(SimpleTestCase):
+    def setUp(self):
+        CachedSpectacularAPIView._schemas.clear()
+        CachedSpectacularAPIView._rendered.clear()
+
+    def test_schema_is_generated_once(self):
+        """Teste de cache do schema: introspecção apenas na primeira requisição"""
+        with mock.patch.object(
+            CachedSpectacularAPIView,
+            "_generate",
+            autospec=True,
+            side_effect=CachedSpectacularAPIView._generate,
+        ) as generate:
+            first = self.client.get("/api/schema/")
+            second = self.client.get("/api/schema/")
+
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first["ETag"], second["ETag"])
+
+    def test_schema_not_modified(self):
+        """Teste de resposta 304 quando o ETag informado é o atual"""
+        etag = self.client.get("/api/schema/")["ETag"]
+        response = self.client.get("/api/schema/", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+
+class QueryProfilingTests(TestCase):
+    def test_normalize_sql_groups_equivalent_queries(self):
+        """Teste de normalização: valores diferentes geram a mesma forma"""
+        self.assertEqual(
+            normalize_sql("SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = 'x'"),
+            normalize_sql("SELECT *  FROM t WHERE id IN (%s, %s) AND name = 'y'"),
+        )
+
+    def test_profiler_detects_repeated_queries(self):
+        """Teste de detecção de formas repetidas (assinatura de N+1)"""
+        profiler = QueryProfiler(slow_threshold_ms=1000)
+        with connection.execute_wrapper(profiler):
+            for pk in range(5):
+                User.objects.filter(pk=pk).first()
+
+        self.assertEqual(profiler.count, 5)
+        [(shape, count)] = profiler.repeated(threshold=5)
+        self.assertEqual(count, 5)
+        self.assertIn("auth_user", shape)
+
+    @override_settings(
+        QUERY_PROFILING_ENABLED=True,
+        QUERY_PROFILING_SAMPLE_RATE=1.0,
+        SLOW_QUERY_THRESHOLD_MS=0,
+    )
+    def test_middleware_logs_profile_and_slow_queries(self):
+        """Teste do middleware: resumo por view e log de queries lentas"""
+        user = User.objects.create_user(username="profiler", password="password123")
+        self.client.defaults["HTTP_AUTHORIZATION"] = (
+            f"Bearer {AccessToken.for_user(user)}"
+        )
+
+        with self.assertLogs("django", level="INFO") as logs:
+            self.client.get("/api/professionals/")
+
+        output = "\n".join(logs.output)
+        self.assertIn("Query Profile", output)
+        self.assertIn("professional-list", output)
+        self.assertIn("Slow Query", output)
+
+
+class BatchTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="batch", password="password123")
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("batch")
+        self.professionals = [
+            Professional.objects.create(
+                social_name=f"Dr. {name}",
+                profession="Clínico",
+                contact=f"{name.lower()}@clinic.com",
+            )
+            for name in ("Grey", "Shepherd", "Yang")
+        ]
+        Appointment.objects.create(
+            professional=self.professionals[0],
+            date=timezone.now() + timezone.timedelta(days=1),
+            patient=self.user,
+        )
+
+    def test_batch_runs_sub_requests_with_shared_cache(self):
+        """Teste do endpoint de batch: detalhes carregados em lote e caminhos repetidos executados uma vez"""
+        first, second, third = self.professionals
+        paths = [
+            f"/api/professionals/{first.id}/",
+            f"/api/professionals/{second.id}/",
+            f"/api/professionals/{third.id}/",
+            f"/api/professionals/{first.id}/",
+            f"/api/appointments/?professional_id={first.id}",
+            "/api/professionals/999999/",
+            "/admin/",
+        ]
+
+        # 1 IN para os profissionais + 1 listagem de consultas + 1 busca do 404
+        with self.assertNumQueries(3):
+            response = self.client.post(self.url, {"requests": paths}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        results = response.data["responses"]
+        self.assertEqual([item["path"] for item in results], paths)
+        self.assertEqual(
+            [item["status"] for item in results], [200, 200, 200, 200, 200, 404, 400]
+        )
+        self.assertEqual(results[1]["body"]["social_name"], "Dr. Shepherd")
+        self.assertEqual(len(results[4]["body"]), 1)
+
+    def test_batch_requires_authentication(self):
+        """Teste de autenticação obrigatória no batch"""
+        self.client.force_authenticate(user=None)
+        response = self.client.post(
+            self.url, {"requests": ["/api/professionals/"]}, format="json"
+        )
+        self.assertEqual(response.status_code, 401)
+
+    @override_settings(BATCH_MAX_REQUESTS=2)
+    def test_batch_limits_number_of_requests(self):
+        """Teste do limite de sub-requisições por batch"""
+        response = self.client.post(
+            self.url, {"requests": ["/api/professionals/"] * 3}, format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(COMPRESSION_MIN_SIZE=1024)
+class CompressionTests(SimpleTestCase):
+    def compress(self, response, accept_encoding="gzip, deflate, br"):
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def test_gzip_above_threshold(self):
+        """Teste de compressão gzip de respostas grandes"""
+        body = b'{"social_name": "Dr. House"}' * 100
+        response = self.compress(HttpResponse(body), accept_encoding="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(gzip.decompress(response.content), body)
+
+    @skipUnless(brotli, "brotli não instalado")
+    def test_brotli_preferred_when_accepted(self):
+        """Teste de preferência por brotli quando aceito pelo cliente"""
+        body = b'{"social_name": "Dr. House"}' * 100
+        response = self.compress(HttpResponse(body))
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(response.content), body)
+
+    def test_small_and_streaming_responses_are_untouched(self):
+        """Teste: respostas pequenas e em streaming não são comprimidas"""
+        small = self.compress(HttpResponse(b"ok"))
+        self.assertFalse(small.has_header("Content-Encoding"))
+
+        streaming = self.compress(StreamingHttpResponse(iter([b"x" * 4096])))
+        self.assertFalse(streaming.has_header("Content-Encoding"))
+        self.assertEqual(b"".join(streaming.streaming_content), b"x" * 4096)
+
+
+@skipUnless(msgpack, "msgpack não instalado")
+class MessagePackTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="mobile", password="password123")
+        self.client.force_authenticate(user=self.user)
+
+    def test_msgpack_request_and_response(self):
+        """Teste de criação e listagem de profissionais em MessagePack"""
+        body = msgpack.packb(
+            {
+                "social_name": "Dr. House",
+                "profession": "Diagnostician",
+                "contact": "house@princeton.edu",
+                "address": "221B Baker Street",
+            }
+        )
+        response = self.client.post(
+            reverse("professional-list"),
+            data=body,
+            content_type="application/msgpack",
+            HTTP_ACCEPT="application/msgpack",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(msgpack.unpackb(response.content)["social_name"], "Dr. House")
+
+        response = self.client.get(
+            reverse("professional-list"), HTTP_ACCEPT="application/msgpack"
+        )
+        self.assertEqual(len(msgpack.unpackb(response.content)), 1)
+
+        response = self.client.get(reverse("professional-list"))
+        self.assertEqual(response["Content-Type"], "application/json")
+
+
+class MemoryTrackerTests(SimpleTestCase):
+    def test_measure_and_growth(self):
+        """Teste do pico por endpoint e do crescimento por linha com tracemalloc"""
+        memory = MemoryTracker()
+        memory.start()
+        self.addCleanup(memory.stop)
+
+        with memory.measure("GET /temporario") as record:
+            record["endpoint"] = "GET temporario"
+            _ = [bytearray(1024) for _ in range(512)]
+        retained = [bytearray(1024) for _ in range(256)]
+
+        report = memory.report(limit=5)
+        self.assertGreater(report["endpoints"]["GET temporario"]["peak_kb"], 400)
+        self.assertEqual(report["endpoints"]["GET temporario"]["requests"], 1)
+        self.assertGreater(report["growth"][0]["size_diff_kb"], 200)
+        self.assertIn("tests.py", report["growth"][0]["location"])
+        self.assertEqual(len(retained), 256)
+
+
+@override_settings(MEMORY_PROFILING_ENABLED=True)
+class MemoryProfilingTests(APITestCase):
+    def setUp(self):
+        self.addCleanup(tracker.stop)
+        self.admin = User.objects.create_user(username="admin", is_staff=True)
+        self.client.force_authenticate(user=self.admin)
+
+    def test_middleware_and_debug_endpoint(self):
+        """Teste do pico por endpoint exposto em /api/debug/memory/"""
+        self.client.get(reverse("professional-list"))
+        self.client.get(reverse("appointment-list"))
+
+        response = self.client.get(reverse("debug-memory"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.data["endpoints"]),
+            {"GET professional-list", "GET appointment-list"},
+        )
+        self.assertIn("growth", response.data)
+
+        response = self.client.post(reverse("debug-memory"))
+        self.assertEqual(response.status_code, 200)
+
+    def test_debug_endpoint_rejects_invalid_limit(self):
+        """Teste de validação do parâmetro limit do relatório de memória"""
+        self.client.get(reverse("professional-list"))
+        for limit in ("abc", "-1"):
+            with self.subTest(limit=limit):
+                response = self.client.get(reverse("debug-memory"), {"limit": limit})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("limit", response.data)
+
+        response = self.client.get(reverse("debug-memory"), {"limit": "1000"})
+        self.assertEqual(response.status_code, 200)
+
+    def test_debug_endpoint_requires_admin(self):
+        """Teste: relatório de memória restrito a administradores"""
+        self.client.force_authenticate(
+            user=User.objects.create_user(username="patient")
+        )
+        response = self.client.get(reverse("debug-memory"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_memory_profile_command(self):
+        """Teste do comando memory_profile"""
+        # Como o Client de teste: fechar a conexão ao fim de cada requisição
+        # desfaria a transação do teste.
+        for signal in (request_started, request_finished):
+            signal.disconnect(close_old_connections)
+            self.addCleanup(signal.connect, close_old_connections)
+        out = StringIO()
+        call_command(
+            "memory_profile",
+            "--username",
+            "admin",
+            "--requests",
+            "4",
+            "--rounds",
+            "2",
+            stdout=out,
+        )
+        self.assertIn("Rodada 2", out.getvalue())
+        self.assertIn("GET /api/appointments/: pico", out.getvalue())
+        self.assertFalse(tracker.tracing)
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    def setUp(self):
+        professional = Professional.objects.create(
+            social_name="Dr. Strange",
+            profession="Sorcerer Supreme",
+            contact="strange@sanctum.com",
+            address="177A Bleecker Street",
+        )
+        Appointment.objects.bulk_create(
+            Appointment(
+                professional=professional,
+                date=timezone.now() + timedelta(days=index * 40),
+            )
+            for index in range(3)
+        )
+
+    @override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=10000)
+    def test_small_tables_use_exact_count(self):
+        """Teste: abaixo do limite o paginador usa a contagem exata"""
+        paginator = EstimatedCountPaginator(Appointment.objects.all(), 2)
+        self.assertEqual(paginator.count, 3)
+
+    @override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=1)
+    def test_filtered_queryset_uses_exact_count(self):
+        """Teste: com filtro o paginador não usa a estimativa"""
+        queryset = Appointment.objects.filter(
+            date__gt=timezone.now() + timedelta(days=1)
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(EstimatedCountPaginator(queryset, 2).count, 2)
+        self.assertNotIn("reltuples", queries[0]["sql"])
+
+    @skipUnless(connection.vendor == "postgresql", "Estatísticas exigem PostgreSQL")
+    @override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=1)
+    def test_unfiltered_queryset_uses_statistics(self):
+        """Teste de estimativa via pg_class somando as partições de consultas"""
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE appointments_appointment")
+
+        paginator = EstimatedCountPaginator(Appointment.objects.all(), 2)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(paginator.count, 3)
+        self.assertEqual(len(queries), 1)
+        self.assertIn("reltuples", queries[0]["sql"])
@@ -13,34 +13,47 @@ Class-based views
 Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
+
+Documentation views are wrapped in `lazy_api_view` so that `drf_spectacular.views`
+is only imported on first use. The JWT views stay eager: drf-spectacular only
+documents URL callbacks that expose the view class (`.cls`).
 """
 
 from django.contrib import admin
 from django.urls import path, include
-from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
-    TokenRefreshView,
-)
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from backend.core.batch import BatchView
+from backend.core.lazy import lazy_api_view
+from backend.core.views import MemoryDebugView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     # API Endpoints
     path("api/professionals/", include("apps.professionals.urls")),
     path("api/appointments/", include("apps.appointments.urls")),
+    path("api/payments/", include("apps.payments.urls")),
+    path("api/me/", include("apps.accounts.urls")),
+    path("api/batch/", BatchView.as_view(), name="batch"),
+    path("api/debug/memory/", MemoryDebugView.as_view(), name="debug-memory"),
     # Authentication
     path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     # Documentation
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path(
+        "api/schema/",
+        lazy_api_view("backend.core.schema.CachedSpectacularAPIView"),
+        name="schema",
+    ),
     path(
         "api/docs/",
-        SpectacularSwaggerView.as_view(url_name="schema"),
+        lazy_api_view(
+            "drf_spectacular.views.SpectacularSwaggerView", url_name="schema"
+        ),
         name="swagger-ui",
     ),
-    path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
+    path(
+        "api/redoc/",
+        lazy_api_view("drf_spectacular.views.SpectacularRedocView", url_name="schema"),
+        name="redoc",
+    ),
 ]
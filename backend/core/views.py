@@ -0,0 +1,44 @@
+from rest_framework import permissions, serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .memory import tracker
+
+
+class MemoryDebugView(APIView):
+    """
+    Relatório de memória do worker que atendeu a requisição (ver `pid`):
+    memória rastreada, maiores crescimentos por arquivo/linha desde o baseline
+    e pico de alocação por endpoint. `POST` registra um novo baseline.
+
+    Disponível apenas com `MEMORY_PROFILING_ENABLED` e para administradores.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        self.check_tracing()
+        return Response(tracker.report(self.get_limit(request)))
+
+    def post(self, request):
+        self.check_tracing()
+        tracker.take_baseline()
+        return Response(tracker.report(0))
+
+    def get_limit(self, request):
+        """`?limit=` (padrão 10, no máximo 100) de linhas com maior crescimento."""
+        raw = request.query_params.get("limit") or "10"
+        try:
+            limit = int(raw)
+        except ValueError:
+            limit = -1
+        if limit < 0:
+            raise serializers.ValidationError(
+                {"limit": ["Informe um número inteiro não negativo."]}
+            )
+        return min(limit, 100)
+
+    def check_tracing(self):
+        if not tracker.tracing or tracker.baseline is None:
+            raise NotFound("Perfil de memória desativado (MEMORY_PROFILING_ENABLED).")
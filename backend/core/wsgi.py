@@ -10,7 +10,12 @@ https://docs.djangoproject.com/en/6.0/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
 
 application = get_wsgi_application()
+
+# Resolve the URLconf at import time so that, under `gunicorn --preload`, the
+# views are imported once in the master and shared by every worker.
+get_resolver().url_patterns
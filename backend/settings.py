@@ -10,22 +10,30 @@ Set the DJANGO_SETTINGS_MODULE environment variable to:
 For backward compatibility, this file imports from local settings by default.
 """
 
+import importlib
 import os
 
+ENVIRONMENT_SETTINGS = (
+    "backend.core.settings.local",
+    "backend.core.settings.staging",
+    "backend.core.settings.production",
+)
+
 # Determine which settings module to use
 settings_module = os.environ.get(
     "DJANGO_SETTINGS_MODULE", "backend.core.settings.local"
 )
 
-# Import the appropriate settings
-if "backend.core.settings.local" in settings_module:
-    from backend.core.settings.local import *  # noqa: F403
-elif "backend.core.settings.staging" in settings_module:
-    from backend.core.settings.staging import *  # noqa: F403
-elif "backend.core.settings.production" in settings_module:
-    from backend.core.settings.production import *  # noqa: F403
-else:
+if settings_module not in ENVIRONMENT_SETTINGS:
     # Default to local if not specified
-    from backend.core.settings.local import *  # noqa: F403
-
     print("Warning: DJANGO_SETTINGS_MODULE not properly set. Using local settings.")
+    settings_module = "backend.core.settings.local"
+
+# Import the appropriate settings (equivalent to `from <module> import *`)
+globals().update(
+    {
+        name: value
+        for name, value in vars(importlib.import_module(settings_module)).items()
+        if not name.startswith("_")
+    }
+)
@@ -0,0 +1,135 @@
+"""
+Benchmark: soak test de memória das listagens da API.
+
+Executa milhares de requisições a `/api/appointments/` e `/api/professionals/`
+pelo `WSGIHandler`, em um único processo (como um worker do gunicorn), com o
+`tracemalloc` ligado e
+acompanha a memória rastreada a cada bloco de requisições. Se a memória cresce
+mais que `--max-growth-kb` entre o primeiro e o último bloco após o
+aquecimento, o benchmark aponta as linhas que mais cresceram e termina com
+código 1.
+
+    poetry run python -m benchmarks.bench_memory_soak --requests 5000
+"""
+
+import argparse
+import gc
+import sys
+from datetime import timedelta
+
+from benchmarks.utils import benchmark_database, print_table, setup_django
+
+
+def seed(professionals, appointments_per_professional):
+    from django.contrib.auth.models import User
+    from django.utils import timezone
+
+    from apps.appointments.models import Appointment
+    from apps.professionals.models import Professional
+
+    user = User.objects.create_user(username="soak")
+    created = Professional.objects.bulk_create(
+        Professional(
+            social_name=f"Dra. Soak {i}",
+            profession="Clínica Geral",
+            contact=f"soak{i}@example.com",
+            address=f"Rua do Benchmark, {i}",
+        )
+        for i in range(professionals)
+    )
+    start = timezone.now() + timedelta(days=1)
+    Appointment.objects.bulk_create(
+        (
+            Appointment(
+                professional=professional,
+                patient=user,
+                date=start + timedelta(hours=i),
+            )
+            for professional in created
+            for i in range(appointments_per_professional)
+        ),
+        batch_size=1000,
+    )
+    return user
+
+
+def run(total_requests, block_size, warmup, max_growth_kb, top):
+    from django.conf import settings
+
+    from backend.core.memory import WSGIRequester, tracker
+
+    user = seed(professionals=20, appointments_per_professional=5)
+    requester = WSGIRequester(user)
+    paths = list(settings.MEMORY_PROFILING_PATHS)
+
+    def request(index):
+        path = paths[index % len(paths)]
+        with tracker.measure(f"GET {path}"):
+            status_code = requester.get(path)
+        assert status_code == 200, (path, status_code)
+
+    tracker.start()
+    try:
+        for index in range(warmup):
+            request(index)
+        tracker.take_baseline()
+        tracker.endpoints = {}
+
+        rows = []
+        for block_start in range(0, total_requests, block_size):
+            for index in range(
+                block_start, min(block_start + block_size, total_requests)
+            ):
+                request(index)
+            # Ciclos ainda não coletados não são vazamento.
+            gc.collect()
+            rows.append(
+                (
+                    min(block_start + block_size, total_requests),
+                    tracker.report(0)["traced_kb"],
+                )
+            )
+        report = tracker.report(top)
+    finally:
+        tracker.stop()
+
+    print_table(("requisições", "memória rastreada (KB)"), rows)
+    print()
+    print_table(
+        ("endpoint", "pico (KB)", "média (KB)"),
+        [
+            (endpoint, stats["peak_kb"], stats["avg_peak_kb"])
+            for endpoint, stats in report["endpoints"].items()
+        ],
+    )
+
+    growth = rows[-1][1] - rows[0][1]
+    print(f"\nCrescimento entre o primeiro e o último bloco: {growth:+.1f} KB")
+    if growth <= max_growth_kb:
+        return True
+
+    print("POSSÍVEL VAZAMENTO: maiores crescimentos desde o baseline:")
+    for item in report["growth"]:
+        print(f"  {item['size_diff_kb']:+10.1f} KB  {item['location']}")
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--block-size", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--max-growth-kb", type=float, default=256)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        ok = run(
+            args.requests, args.block_size, args.warmup, args.max_growth_kb, args.top
+        )
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Benchmark: edições concorrentes de consultas, controle otimista x lock de linha.
+
+Vários clientes (threads, cada uma com sua conexão) reagendam repetidamente
+consultas de um mesmo profissional muito procurado. Cada edição lê a consulta,
+gasta `--think-ms` (validação, serialização, rede) e grava:
+
+- lock: `select_for_update` no profissional e na consulta, com os locks
+  mantidos até a gravação, como no contorno usado antes contra reagendamentos
+  concorrentes (todas as edições da agenda do profissional ficam em fila);
+- optimistic: leitura sem lock e `UPDATE ... WHERE version = n`, como nos
+  ViewSets; em conflito o cliente relê e tenta de novo (até `--retries`).
+
+Mostra edições gravadas por segundo, latência média e taxa de conflito.
+Requer PostgreSQL: o SQLite serializa todas as escritas.
+
+    poetry run python -m benchmarks.bench_optimistic_concurrency --threads 8 --hot 64
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from datetime import timedelta
+
+from benchmarks.utils import benchmark_database, print_table, setup_django
+
+LOOKUP_FIELDS = ("pk", "date")
+
+
+def seed(hot):
+    from django.utils import timezone
+
+    from apps.appointments.models import Appointment
+    from apps.professionals.models import Professional
+
+    professional = Professional.objects.create(
+        social_name="Dra. Concorrida",
+        profession="Clínica Geral",
+        contact="concorrida@example.com",
+        address="Rua do Benchmark, 1",
+    )
+    start = timezone.now() + timedelta(days=1)
+    appointments = Appointment.objects.bulk_create(
+        Appointment(professional=professional, date=start + timedelta(hours=i))
+        for i in range(hot)
+    )
+    return [appointment.pk for appointment in appointments]
+
+
+def edit_locked(appointment_id, think, retries):
+    from django.db import transaction
+
+    from apps.appointments.models import Appointment
+    from apps.professionals.models import Professional
+
+    with transaction.atomic():
+        appointment = Appointment.objects.select_for_update().get(pk=appointment_id)
+        Professional.objects.select_for_update().get(pk=appointment.professional_id)
+        time.sleep(think)
+        appointment.date += timedelta(minutes=1)
+        appointment.save()
+    return 0, True
+
+
+def edit_optimistic(appointment_id, think, retries):
+    from django.db import transaction
+
+    from apps.appointments.models import Appointment
+    from backend.core.concurrency import claim_version
+
+    conflicts = 0
+    for _ in range(retries + 1):
+        appointment = Appointment.objects.get(pk=appointment_id)
+        time.sleep(think)
+        expected = appointment.version
+        with transaction.atomic():
+            if claim_version(appointment, expected, LOOKUP_FIELDS):
+                appointment.date += timedelta(minutes=1)
+                appointment.version = expected + 1
+                appointment.save()
+                return conflicts, True
+        conflicts += 1
+    return conflicts, False
+
+
+STRATEGIES = {"lock": edit_locked, "optimistic": edit_optimistic}
+
+
+def run(strategy, ids, threads, edits, think, retries):
+    from django.db import connection
+
+    edit = STRATEGIES[strategy]
+    barrier = threading.Barrier(threads + 1)
+    lock = threading.Lock()
+    totals = {"saved": 0, "gave_up": 0, "conflicts": 0, "latency": 0.0}
+
+    def client(seed):
+        rng = random.Random(seed)
+        saved = gave_up = conflicts = 0
+        latency = 0.0
+        try:
+            barrier.wait()
+            for _ in range(edits):
+                start = time.perf_counter()
+                edit_conflicts, ok = edit(rng.choice(ids), think, retries)
+                latency += time.perf_counter() - start
+                conflicts += edit_conflicts
+                saved += ok
+                gave_up += not ok
+        finally:
+            connection.close()
+        with lock:
+            totals["saved"] += saved
+            totals["gave_up"] += gave_up
+            totals["conflicts"] += conflicts
+            totals["latency"] += latency
+
+    workers = [
+        threading.Thread(target=client, args=(index,)) for index in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    attempts = totals["saved"] + totals["conflicts"]
+    return (
+        strategy,
+        f"{totals['saved'] / elapsed:.1f}",
+        f"{totals['latency'] / (threads * edits) * 1000:.1f}",
+        f"{totals['conflicts'] / attempts:.1%}" if attempts else "-",
+        totals["gave_up"],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--edits", type=int, default=50, help="Edições por thread.")
+    parser.add_argument(
+        "--hot", type=int, default=64, help="Consultas do profissional disputadas."
+    )
+    parser.add_argument("--think-ms", type=float, default=5)
+    parser.add_argument("--retries", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+
+    if connection.vendor != "postgresql":
+        sys.exit("Este benchmark requer PostgreSQL (DB_ENGINE).")
+
+    with benchmark_database():
+        ids = seed(args.hot)
+        rows = [
+            run(
+                strategy,
+                ids,
+                args.threads,
+                args.edits,
+                args.think_ms / 1000,
+                args.retries,
+            )
+            for strategy in STRATEGIES
+        ]
+        connection.close()
+
+    print(
+        f"{args.threads} threads x {args.edits} edições em {args.hot} consultas, "
+        f"{args.think_ms:g} ms entre leitura e gravação\n"
+    )
+    print_table(
+        ("estratégia", "edições/s", "latência (ms)", "conflitos", "desistências"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
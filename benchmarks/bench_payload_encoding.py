@@ -0,0 +1,122 @@
+"""
+Benchmark: bytes trafegados e tempo de codificação da listagem de consultas.
+
+Serializa listagens de consultas (com `professional_detail` embutido) e compara
+JSON e MessagePack, sem compressão e com gzip/brotli nas mesmas configurações do
+`CompressionMiddleware`. Os números são normalizados por 1.000 linhas. Não usa
+banco de dados: as consultas são montadas em memória.
+
+    poetry run python -m benchmarks.bench_payload_encoding --rows 1000 10000
+"""
+
+import argparse
+import time
+from datetime import timedelta
+
+from benchmarks.utils import print_table, setup_django
+
+
+def build_payload(rows):
+    from django.utils import timezone
+
+    from apps.appointments.models import Appointment
+    from apps.appointments.serializers import AppointmentSerializer
+    from apps.professionals.models import Professional
+
+    now = timezone.now()
+    professionals = [
+        Professional(
+            id=i,
+            social_name=f"Dra. Profissional {i}",
+            profession="Clínica Geral",
+            contact=f"profissional{i}@example.com",
+            address=f"Rua do Benchmark, {i}",
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(1, 51)
+    ]
+    appointments = [
+        Appointment(
+            id=i,
+            professional=professionals[i % len(professionals)],
+            date=now + timedelta(hours=i),
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(1, rows + 1)
+    ]
+    return AppointmentSerializer(appointments, many=True).data
+
+
+def encoders():
+    from django.conf import settings
+    from django.utils.text import compress_string
+    from rest_framework.renderers import JSONRenderer
+
+    from backend.core.middleware import CompressionMiddleware, brotli
+    from backend.core.parsers import msgpack
+    from backend.core.renderers import MessagePackRenderer
+
+    def gzip(content):
+        return compress_string(
+            content, max_random_bytes=CompressionMiddleware.max_random_bytes
+        )
+
+    compressors = {"": None, "+gzip": gzip}
+    if brotli is not None:
+        compressors["+br"] = lambda content: brotli.compress(
+            content, quality=settings.COMPRESSION_BROTLI_QUALITY
+        )
+    renderers = {"json": JSONRenderer()}
+    if msgpack is not None:
+        renderers["msgpack"] = MessagePackRenderer()
+
+    for renderer_name, renderer in renderers.items():
+        for compressor_name, compress in compressors.items():
+
+            def encode(data, renderer=renderer, compress=compress):
+                content = renderer.render(data)
+                return compress(content) if compress else content
+
+            yield renderer_name + compressor_name, encode
+
+
+def run(sizes, repeat):
+    rows = []
+    for size in sizes:
+        data = build_payload(size)
+        for name, encode in encoders():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                content = encode(data)
+                timings.append(time.perf_counter() - start)
+            per_1k = 1000 / size
+            rows.append(
+                (
+                    size,
+                    name,
+                    f"{len(content) / 1024:.1f}",
+                    f"{len(content) * per_1k / 1024:.1f}",
+                    f"{min(timings) * per_1k * 1000:.2f}",
+                )
+            )
+
+    print_table(
+        ("linhas", "formato", "total (KB)", "KB / 1k linhas", "ms / 1k linhas"), rows
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: remoção de um profissional com muitas consultas.
+
+Compara o delete em cascata do ORM (comportamento anterior, executado dentro da
+requisição) com a remoção lógica pela API seguida do purge em lotes. O pico de
+memória do purge deve permanecer estável conforme o número de consultas cresce.
+
+    poetry run python -m benchmarks.bench_professional_delete --sizes 1000 10000 50000
+"""
+
+import argparse
+from datetime import timedelta
+
+from benchmarks.utils import benchmark_database, measure, print_table, setup_django
+
+
+def create_professional(size):
+    from django.utils import timezone
+
+    from apps.appointments.models import Appointment
+    from apps.professionals.models import Professional
+
+    professional = Professional.objects.create(
+        social_name="Dra. Benchmark",
+        profession="Clínica Geral",
+        contact="benchmark@example.com",
+        address="Rua do Benchmark, 1",
+    )
+    start = timezone.now()
+    Appointment.objects.bulk_create(
+        (
+            Appointment(professional=professional, date=start + timedelta(hours=i))
+            for i in range(size)
+        ),
+        batch_size=1000,
+    )
+    return professional
+
+
+def run(sizes, chunk_size):
+    from django.contrib.auth.models import User
+    from rest_framework.test import APIClient
+
+    from apps.professionals.purge import purge_professional
+
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user(username="benchmark"))
+
+    rows = []
+    for size in sizes:
+        professional = create_professional(size)
+        with measure() as cascade:
+            professional.delete()
+
+        professional = create_professional(size)
+        with measure() as api:
+            response = client.delete(f"/api/professionals/{professional.pk}/")
+        assert response.status_code == 204, response.status_code
+        with measure() as purge:
+            purge_professional(professional, chunk_size)
+
+        rows.append(
+            (
+                size,
+                f"{cascade['seconds']:.2f}",
+                f"{cascade['peak_kb']:.0f}",
+                f"{api['seconds'] * 1000:.1f}",
+                f"{purge['seconds']:.2f}",
+                f"{purge['peak_kb']:.0f}",
+            )
+        )
+
+    print_table(
+        (
+            "consultas",
+            "cascade (s)",
+            "cascade pico (KB)",
+            "DELETE API (ms)",
+            "purge (s)",
+            "purge pico (KB)",
+        ),
+        rows,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.sizes, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
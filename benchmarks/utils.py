@@ -0,0 +1,59 @@
+"""
+Utilitários compartilhados pelos benchmarks.
+
+Cada benchmark roda contra um banco de teste criado a partir das configurações
+atuais (variáveis `DB_*`) e descartado ao final, por exemplo:
+
+    DB_ENGINE=django.db.backends.sqlite3 DB_NAME=:memory: \\
+        poetry run python -m benchmarks.bench_professional_delete
+"""
+
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+def setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.core.settings.local")
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def benchmark_database():
+    """Cria um banco de teste com as migrações aplicadas e o remove ao final."""
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    # DEBUG=False: com DEBUG o Django acumula o log de queries e distorce a memória
+    setup_test_environment(debug=False)
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+@contextmanager
+def measure():
+    """Mede o tempo e o pico de memória alocada (tracemalloc) do bloco."""
+    result = {}
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result["seconds"] = time.perf_counter() - start
+        result["peak_kb"] = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+
+
+def print_table(headers, rows):
+    widths = [
+        max(len(str(value)) for value in column) for column in zip(headers, *rows)
+    ]
+    for row in (headers, *rows):
+        print("  ".join(str(value).rjust(width) for value, width in zip(row, widths)))
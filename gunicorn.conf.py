@@ -0,0 +1,39 @@
+"""
+Configuração do Gunicorn (lida automaticamente a partir do diretório da aplicação).
+
+Com `preload_app` a aplicação é importada uma única vez no processo master antes
+do fork: os workers compartilham o código já importado (copy-on-write) e sobem
+sem repetir o boot do Django.
+"""
+
+import os
+
+from decouple import config
+
+bind = config("GUNICORN_BIND", default="0.0.0.0:8000")
+workers = config("GUNICORN_WORKERS", default=4, cast=int)
+timeout = config("GUNICORN_TIMEOUT", default=60, cast=int)
+preload_app = config("GUNICORN_PRELOAD", default=True, cast=bool)
+
+
+def pre_fork(server, worker):
+    # Conexões abertas no master durante o preload são fechadas antes do fork,
+    # enquanto só o master as usa.
+    from django.db import connections
+
+    connections.close_all()
+
+
+def post_fork(server, worker):
+    # Uma conexão que ainda assim chegue ao worker pertence ao master: fechá-la
+    # aqui enviaria Terminate pela sessão dele. O descritor do socket passa a
+    # apontar para /dev/null no worker e o handle é descartado sem falar com o
+    # servidor.
+    from django.db import connections
+
+    for connection in connections.all(initialized_only=True):
+        if connection.connection is None:
+            continue
+        with open(os.devnull, "wb") as devnull:
+            os.dup2(devnull.fileno(), connection.connection.fileno())
+        connection.connection = None